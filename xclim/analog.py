@@ -58,11 +58,12 @@ a single float.
 .. [Grenier2013]  Grenier, P., A.-C. Parent, D. Huard, F. Anctil, and D. Chaumont, 2013: An assessment of six dissimilarity metrics for climate analogs. J. Appl. Meteor. Climatol., 52, 733–752, `<doi:10.1175/JAMC-D-12-0170.1>`_
 """
 # Code adapted from flyingpigeon.dissimilarity, Nov 2020.
+import inspect
+from functools import wraps
 from typing import Sequence, Union
 
 import numpy as np
 import xarray as xr
-from boltons.funcutils import wraps
 from scipy import spatial
 from scipy.spatial import cKDTree as KDTree
 
@@ -92,6 +93,7 @@ def spatial_analogs(
     target : xr.Dataset
         Dataset of the target indices. Only indice variables should be included in the
         dataset's `data_vars`. They should have only the dimension(s) `dist_dim `in common with `candidates`.
+        Other dimensions (ex: `site`) hold multiple targets, all compared to the candidates in a single pass.
     candidates : xr.Dataset
         Dataset of the candidate indices. Only indice variables should be included in
         the dataset's `data_vars`.
@@ -126,6 +128,12 @@ def spatial_analogs(
     )
     candidates = candidates.stack(dist=dist_dim)
 
+    # The distributions are core dimensions, they must be held in a single chunk.
+    if target.chunks is not None:
+        target = target.chunk({"dist": -1, "indices": -1})
+    if candidates.chunks is not None:
+        candidates = candidates.chunk({"dist": -1, "indices": -1})
+
     try:
         metric = metrics[method]
     except KeyError:
@@ -135,14 +143,14 @@ def spatial_analogs(
 
     # Compute dissimilarity
     diss = xr.apply_ufunc(
-        metric,
+        _spatial_analogs,
         target,
         candidates,
         input_core_dims=[("dist", "indices"), ("dist", "indices")],
         output_core_dims=[()],
-        vectorize=True,
         dask="parallelized",
         output_dtypes=[float],
+        kwargs=dict(func=metric, **kwargs),
     )
     diss.name = "dissimilarity"
     diss.attrs.update(
@@ -154,6 +162,178 @@ def spatial_analogs(
     return diss
 
 
+def top_analogs(
+    target: xr.Dataset,
+    candidates: xr.Dataset,
+    k: int = 20,
+    dist_dim: Union[str, Sequence[str]] = "time",
+    method: str = "kldiv",
+    screen: int = 10,
+    **kwargs,
+):
+    """Find the `k` best spatial analogs of target points among candidate points.
+
+    Instead of computing the full dissimilarity map with an expensive metric, the candidates
+    are first screened with the standardized euclidean distance between their mean indices
+    and those of the target (method `seuclidean`), which is computed for all candidates at a
+    very low cost. The requested metric is only evaluated on the ``screen * k`` closest
+    candidates, among which the `k` best analogs are selected.
+
+    Parameters
+    ----------
+    target : xr.Dataset
+        Dataset of the target indices, as in :py:func:`spatial_analogs`. Dimensions other than `dist_dim` hold multiple targets.
+    candidates : xr.Dataset
+        Dataset of the candidate indices, as in :py:func:`spatial_analogs`.
+    k : int
+        The number of analogs to return for each target.
+    dist_dim : Union[str, Sequence[Union[str, Sequence[str]]]]
+        The dimension(s) over which the *distributions* are constructed.
+    method : {'seuclidean', 'nearest_neighbor', 'zech_aslan', 'kolmogorov_smirnov', 'friedman_rafsky', 'kldiv'}
+        Which method to use when computing the dissimilarity statistic.
+    screen : int
+        The number of candidates evaluated with `method` for each target, as a multiple of `k`.
+    **kwargs
+        Any other parameter passed directly to the dissimilarity method.
+
+    Returns
+    -------
+    xr.DataArray
+        The dissimilarity statistic of the `k` best analogs of each target, sorted along the new `analog` dimension.
+        The coordinates of the candidates are kept, along the target dimensions and `analog`.
+
+    Notes
+    -----
+    The screening is a heuristic : a candidate whose mean indices are far from those of the target
+    could still have a low dissimilarity with other metrics. The result is exact when ``screen * k`` is
+    larger than the number of candidates. The screening distances are computed immediately, even for
+    dask-backed inputs, only the selected candidates are loaded for the final evaluation.
+    """
+    if isinstance(dist_dim, str):
+        dist_dim = [dist_dim]
+    tdims = [d for d in target.dims if d not in dist_dim]
+    cdims = [d for d in candidates.dims if d not in dist_dim]
+
+    # Flatten the targets and the candidates.
+    # The targets' coordinates (ex: scalar lat and lon) would conflict with those of the candidates.
+    target = target.reset_coords(drop=True)
+    if tdims:
+        target = target.stack(_target=tdims)
+        tindex = target.indexes["_target"]
+        # The selected candidates have no index along `_target`, the targets must not either.
+        target = target.reset_index("_target", drop=True)
+    else:
+        target = target.expand_dims("_target")
+    candidates = candidates.stack(candidate=cdims).reset_index("candidate")
+    ncand = candidates.candidate.size
+    nscreen = min(screen * k, ncand)
+
+    if method != "seuclidean" and nscreen < ncand:
+        diss = spatial_analogs(
+            target, candidates, dist_dim=dist_dim, method="seuclidean"
+        ).transpose("_target", "candidate")
+        # Invalid candidates (NaN) are sorted last.
+        idx = np.argpartition(diss.values, nscreen - 1, axis=-1)[:, :nscreen]
+        candidates = candidates.isel(
+            candidate=xr.DataArray(idx, dims=("_target", "candidate"))
+        )
+
+    diss = spatial_analogs(
+        target, candidates, dist_dim=dist_dim, method=method, **kwargs
+    ).transpose("_target", "candidate")
+
+    order = np.argsort(diss.values, axis=-1, kind="stable")[:, :k]
+    out = xr.DataArray(
+        np.take_along_axis(diss.values, order, axis=-1),
+        dims=("_target", "analog"),
+        name=diss.name,
+        attrs=diss.attrs,
+    )
+    for name, crd in diss.coords.items():
+        if "candidate" in crd.dims:
+            crd = crd.broadcast_like(diss).transpose("_target", "candidate")
+            out.coords[name] = (
+                ("_target", "analog"),
+                np.take_along_axis(crd.values, order, axis=-1),
+            )
+
+    if tdims:
+        out.coords["_target"] = tindex
+        return out.unstack("_target").transpose(*tdims, "analog")
+    return out.isel(_target=0)
+
+
+def _spatial_analogs(x, y, *, func, **kwargs):
+    """Compute the dissimilarity between each target and candidate of a block.
+
+    `x` and `y` are arrays of shape (..., n, D) and (..., m, D), with leading dimensions
+    broadcastable against each other. Each target and each candidate are prepared once
+    and reused for all the pairs they are part of. Metrics with a batched implementation
+    evaluate all the candidates compared to a given target in a single call. Otherwise,
+    candidates are prepared one at a time and compared to all targets before the next one.
+    """
+    ndim = max(x.ndim, y.ndim) - 2
+    x = x.reshape((1,) * (ndim + 2 - x.ndim) + x.shape)
+    y = y.reshape((1,) * (ndim + 2 - y.ndim) + y.shape)
+    tshape = x.shape[:-2]
+    shape = np.broadcast(x[..., 0, 0], y[..., 0, 0]).shape
+    out = np.full(shape, np.nan)
+
+    # Candidates as a flat stack, with the index of the candidate compared in each output cell.
+    cidx = np.broadcast_to(
+        np.arange(np.prod(y.shape[:-2], dtype=int)).reshape(y.shape[:-2]), shape
+    )
+    ys = y.reshape((-1,) + y.shape[-2:])
+    valid = ~np.isnan(ys).any(axis=(-2, -1))
+
+    # Valid targets, prepared once, with the output cells and the candidates compared to them.
+    targets = []
+    for it in np.ndindex(*tshape):
+        xt = x[it]
+        if np.any(np.isnan(xt)):
+            continue
+        sel = tuple(i if s > 1 else slice(None) for i, s in zip(it, tshape))
+        # The ellipsis keeps a (writeable) view on `out` even if all dimensions are selected.
+        sel += (Ellipsis,)
+        targets.append((xt, func.prepare(xt, **kwargs), out[sel], cidx[sel]))
+
+    if func.evaluate_batched is not None:
+        # Valid candidates are prepared all at once.
+        ys = ys[valid]
+        vpos = np.cumsum(valid) - 1
+        cprep = func.prepare_candidate(ys, **kwargs)
+        for xt, prepared, outs, ci in targets:
+            ok = valid[ci]
+            cv = vpos[ci[ok]]
+            outs[ok] = func.evaluate_batched(
+                xt,
+                ys[cv],
+                **prepared,
+                **{k: v[cv] for k, v in cprep.items()},
+                **kwargs,
+            )
+    else:
+        # Candidates are in the outer loop, so each is prepared once and dropped after use.
+        # A candidate is compared at most once to a given target, `cell` is the flat position
+        # of that comparison in the target's output cells, -1 if there is none.
+        cells = []
+        for xt, prepared, outs, ci in targets:
+            cell = np.full(ys.shape[0], -1)
+            cell[ci.ravel()] = np.arange(ci.size)
+            cells.append(cell)
+        for c in np.nonzero(valid)[0]:
+            cprep = None
+            for (xt, prepared, outs, _), cell in zip(targets, cells):
+                if cell[c] < 0:
+                    continue
+                if cprep is None:
+                    cprep = func.prepare_candidate(ys[c], **kwargs)
+                outs[np.unravel_index(cell[c], outs.shape)] = func.evaluate(
+                    xt, ys[c], **prepared, **cprep, **kwargs
+                )
+    return out
+
+
 # ---------------------------------------------------------------------------- #
 # -------------------------- Utility functions ------------------------------- #
 # ---------------------------------------------------------------------------- #
@@ -177,12 +357,34 @@ def standardize(x, y):
     return x / s, y / s
 
 
-def metric(func):
+def metric(func=None, *, prepare=None, prepare_candidate=None):
     """Register a metric function in the `metrics` mapping and add some preparation/checking code.
 
     All metric functions accept 2D inputs. This reshape 1D inputs to (n, 1) and (m, 1).
     All metric functions are invalid when any non-finite values are present in the inputs.
+
+    A metric can be given a `prepare` function computing the quantities that depend only on the
+    reference sample. It is called as ``prepare(x, **kwargs)``, with the same keyword arguments as the
+    metric, and returns a dictionary of keyword arguments passed to the metric function. These are
+    keyword-only arguments without defaults and are not part of the metric's public signature.
+    Likewise, `prepare_candidate` computes the quantities depending only on the candidate sample.
+    :py:func:`spatial_analogs` prepares each target and each candidate once and reuses them for all
+    the pairs they are part of.
+
+    A vectorized implementation of the metric can also be registered with the `batched` attribute of the
+    returned function, used as a decorator. It is called as the metric, but with a candidate array of
+    shape (N, m, d), and returns the N dissimilarities. When available, :py:func:`spatial_analogs`
+    uses it to evaluate all candidates of a block at once. The `prepare_candidate` function of such
+    metrics must also accept stacked candidates and return arrays with the same leading dimension N.
     """
+    if func is None:
+        return lambda f: metric(f, prepare=prepare, prepare_candidate=prepare_candidate)
+
+    def _no_preparation(x, **kwargs):
+        return {}
+
+    prepare = prepare or _no_preparation
+    prepare_candidate = prepare_candidate or _no_preparation
 
     @wraps(func)
     def _metric_overhead(x, y, **kwargs):
@@ -201,7 +403,29 @@ def metric(func):
         if x.shape[1] != y.shape[1]:
             raise AttributeError("Shape mismatch")
 
-        return func(x, y, **kwargs)
+        return func(
+            x, y, **prepare(x, **kwargs), **prepare_candidate(y, **kwargs), **kwargs
+        )
+
+    # Hide the arguments computed by `prepare` and `prepare_candidate` from the signature.
+    sig = inspect.signature(func)
+    _metric_overhead.__signature__ = sig.replace(
+        parameters=[
+            p
+            for p in sig.parameters.values()
+            if not (p.kind == p.KEYWORD_ONLY and p.default is p.empty)
+        ]
+    )
+    _metric_overhead.prepare = prepare
+    _metric_overhead.prepare_candidate = prepare_candidate
+    _metric_overhead.evaluate = func
+    _metric_overhead.evaluate_batched = None
+
+    def batched(vfunc):
+        _metric_overhead.evaluate_batched = vfunc
+        return vfunc
+
+    _metric_overhead.batched = batched
 
     metrics[func.__name__] = _metric_overhead
     return _metric_overhead
@@ -212,8 +436,16 @@ def metric(func):
 # ---------------------------------------------------------------------------- #
 
 
-@metric
-def seuclidean(x, y):
+def _seuclidean_prepare(x):
+    return {"mx": x.mean(axis=0), "vx": x.var(axis=0, ddof=1)}
+
+
+def _seuclidean_prepare_candidate(y):
+    return {"my": y.mean(axis=-2)}
+
+
+@metric(prepare=_seuclidean_prepare, prepare_candidate=_seuclidean_prepare_candidate)
+def seuclidean(x, y, *, mx, vx, my):
     """
     Compute the Euclidean distance between the mean of a multivariate candidate sample with respect to the mean of a reference sample.
 
@@ -241,10 +473,12 @@ def seuclidean(x, y):
     21st-century climate-change scenarios. Climatic Change,
     DOI 10.1007/s10584-011-0261-z.
     """
-    mx = x.mean(axis=0)
-    my = y.mean(axis=0)
+    return spatial.distance.seuclidean(mx, my, vx)
+
 
-    return spatial.distance.seuclidean(mx, my, x.var(axis=0, ddof=1))
+@seuclidean.batched
+def _seuclidean_batched(x, y, *, mx, vx, my):
+    return np.sqrt(((my - mx) ** 2 / vx).sum(axis=-1))
 
 
 @metric
@@ -284,8 +518,19 @@ def nearest_neighbor(x, y):
     return same.mean()
 
 
-@metric
-def zech_aslan(x, y):
+def _zech_aslan_prepare(x):
+    # Squared differences along each dimension for all pairs of points, in `pdist` order.
+    i, j = np.triu_indices(x.shape[0], 1)
+    return {"sx": x.std(axis=0, ddof=1), "dx2": (x[i] - x[j]) ** 2}
+
+
+def _zech_aslan_prepare_candidate(y):
+    i, j = np.triu_indices(y.shape[0], 1)
+    return {"sy": y.std(axis=0, ddof=1), "dy2": (y[i] - y[j]) ** 2}
+
+
+@metric(prepare=_zech_aslan_prepare, prepare_candidate=_zech_aslan_prepare_candidate)
+def zech_aslan(x, y, *, sx, dx2, sy, dy2):
     """
     Compute the Zech-Aslan energy distance dissimimilarity metric based on an analogy with the energy of a cloud of electrical charges.
 
@@ -311,10 +556,10 @@ def zech_aslan(x, y):
     nx, d = x.shape
     ny, d = y.shape
 
-    v = (x.std(axis=0, ddof=1) * y.std(axis=0, ddof=1)).astype(np.double)
+    v = (sx * sy).astype(np.double)
 
-    dx = spatial.distance.pdist(x, "seuclidean", V=v)
-    dy = spatial.distance.pdist(y, "seuclidean", V=v)
+    dx = np.sqrt(dx2 @ (1 / v))
+    dy = np.sqrt(dy2 @ (1 / v))
     dxy = spatial.distance.cdist(x, y, "seuclidean", V=v)
 
     phix = -np.log(dx).sum() / nx / (nx - 1)
@@ -365,6 +610,58 @@ def skezely_rizzo(x, y):
     # z = ((n * m) / (n + m)) * z;
 
 
+def _euclidean_mst(xy):
+    """Return the edges, as an (n - 1, 2) array, of the euclidean minimum spanning tree of the points xy (n, d).
+
+    The tree is a subgraph of the Delaunay triangulation, so the MST is computed on the sparse graph of its edges
+    in two or three dimensions, where the triangulation is cheap. For one-dimensional samples, it simply links
+    consecutive points. In other cases, including degenerate triangulations, Prim's algorithm is used, computing
+    the distances as needed. No dense distance matrix is ever built.
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components, minimum_spanning_tree
+
+    n, d = xy.shape
+    if d == 1:
+        order = np.argsort(xy[:, 0], kind="stable")
+        return np.stack([order[:-1], order[1:]], axis=-1)
+
+    if d <= 3 and n > d + 1:
+        try:
+            tri = spatial.Delaunay(xy)
+        except spatial.qhull.QhullError:
+            pass
+        else:
+            # All edges of the simplices, each counted once, with their length.
+            i, j = np.triu_indices(d + 1, 1)
+            a, b = tri.simplices[:, i].ravel(), tri.simplices[:, j].ravel()
+            a, b = np.unique(np.stack([np.minimum(a, b), np.maximum(a, b)]), axis=1)
+            g = coo_matrix(
+                (np.sqrt(((xy[a] - xy[b]) ** 2).sum(-1)), (a, b)), shape=(n, n)
+            ).tocsr()
+            # Duplicate points are left out of the triangulation, and null edges are not seen by scipy.
+            if connected_components(g, directed=False, return_labels=False) == 1:
+                mst = minimum_spanning_tree(g, overwrite=True)
+                return np.array(mst.nonzero()).T
+
+    # Prim's algorithm, with the distances to the growing tree updated from each new node.
+    intree = np.zeros(n, dtype=bool)
+    dist = np.full(n, np.inf)
+    parent = np.zeros(n, dtype=int)
+    edges = np.empty((n - 1, 2), dtype=int)
+    new = 0
+    for e in range(n - 1):
+        intree[new] = True
+        dnew = np.sqrt(((xy - xy[new]) ** 2).sum(-1))
+        closer = dnew < dist
+        dist[closer] = dnew[closer]
+        parent[closer] = new
+        dist[intree] = np.inf
+        new = np.argmin(dist)
+        edges[e] = parent[new], new
+    return edges
+
+
 @metric
 def friedman_rafsky(x, y):
     """
@@ -392,18 +689,13 @@ def friedman_rafsky(x, y):
     Wald-Wolfowitz and Smirnov two-sample tests. Annals of Stat. Vol.7,
     No. 4, 697-717.
     """
-    from scipy.sparse.csgraph import minimum_spanning_tree
-    from sklearn import neighbors
-
     nx, _ = x.shape
     ny, _ = y.shape
     n = nx + ny
 
     xy = np.vstack([x, y])
-    # Compute the NNs and the minimum spanning tree
-    g = neighbors.kneighbors_graph(xy, n_neighbors=n - 1, mode="distance")
-    mst = minimum_spanning_tree(g, overwrite=True)
-    edges = np.array(mst.nonzero()).T
+    # Compute the minimum spanning tree
+    edges = _euclidean_mst(xy)
 
     # Number of points whose neighbor is from the other sample
     diff = np.logical_xor(*(edges < nx).T).sum()
@@ -411,8 +703,55 @@ def friedman_rafsky(x, y):
     return 1.0 - (1.0 + diff) / n
 
 
-@metric
-def kolmogorov_smirnov(x, y):
+# Maximal number of comparisons between points made at once by `_ks_quadrants`.
+_KS_BLOCK_SIZE = 2 ** 22
+
+
+def _ks_quadrants(p, s):
+    """Return the fraction of the points of sample `s` in each of the 2^d quadrants around each point of `p`.
+
+    `p` and `s` are arrays of shape (..., n_p, d) and (..., n, d) with broadcastable leading dimensions.
+    The output has shape (..., n_p, 2^d). Pairs of samples are processed in blocks, so that no more than
+    `_KS_BLOCK_SIZE` comparisons are made at once.
+    """
+    n, d = s.shape[-2:]
+    n_p = p.shape[-2]
+    lead = np.broadcast(p[..., 0, 0], s[..., 0, 0]).shape
+    p = np.broadcast_to(p, lead + p.shape[-2:]).reshape((-1, n_p, d))
+    s = np.broadcast_to(s, lead + s.shape[-2:]).reshape((-1, n, d))
+
+    # Multiplicating factor converting d-dim booleans to a unique integer.
+    mf = 2 ** np.arange(d)
+    minlength = 2 ** d
+
+    out = np.empty((p.shape[0], n_p, minlength))
+    step = max(1, min(p.shape[0], _KS_BLOCK_SIZE // max(1, n * n_p * d)))
+    offset = np.arange(step * n_p).reshape(step, 1, n_p) * minlength
+    for start in range(0, p.shape[0], step):
+        sl = slice(start, start + step)
+        # Assign a unique integer according on whether or not p[j] <= s[i], shape (block, n, n_p)
+        i = ((p[sl, np.newaxis, :, :] <= s[sl, :, np.newaxis, :]) * mf).sum(-1)
+
+        # Count the number of samples in each quadrant, with a single bincount over all pivots.
+        nb = i.shape[0]
+        counts = np.bincount((i + offset[:nb]).ravel(), minlength=nb * n_p * minlength)
+        out[sl] = counts.reshape(nb, n_p, minlength)
+    return out.reshape(lead + (n_p, minlength)) / n
+
+
+def _kolmogorov_smirnov_prepare(x):
+    return {"cxx": _ks_quadrants(x, x)}
+
+
+def _kolmogorov_smirnov_prepare_candidate(y):
+    return {"cyy": _ks_quadrants(y, y)}
+
+
+@metric(
+    prepare=_kolmogorov_smirnov_prepare,
+    prepare_candidate=_kolmogorov_smirnov_prepare_candidate,
+)
+def kolmogorov_smirnov(x, y, *, cxx, cyy):
     """
     Compute the Kolmogorov-Smirnov statistic applied to two multivariate samples as described by Fasano and Franceschini.
 
@@ -434,35 +773,49 @@ def kolmogorov_smirnov(x, y):
     of the Kolmogorov-Smirnov test. Monthly Notices of the Royal
     Astronomical Society, vol. 225, pp. 155-170.
     """
+    # This is from https://github.com/syrte/ndtest/blob/master/ndtest.py
+    # D = cx - cy
+    # D[0,:] -= 1. / nx # I don't understand this...
+    # dmin, dmax = -D.min(), D.max() + .1 / nx
 
-    def pivot(x, y):
-        nx, d = x.shape
-        ny, d = y.shape
+    # Largest difference in the quadrant fractions around the points of x, then of y.
+    dx = np.max(np.abs(cxx - _ks_quadrants(x, y)))
+    dy = np.max(np.abs(cyy - _ks_quadrants(y, x)))
+    return max(dx, dy)
 
-        # Multiplicating factor converting d-dim booleans to a unique integer.
-        mf = (2 ** np.arange(d)).reshape(1, d, 1)
-        minlength = 2 ** d
 
-        # Assign a unique integer according on whether or not x[i] <= sample
-        ix = ((x.T <= np.atleast_3d(x)) * mf).sum(1)
-        iy = ((x.T <= np.atleast_3d(y)) * mf).sum(1)
+@kolmogorov_smirnov.batched
+def _kolmogorov_smirnov_batched(x, y, *, cxx, cyy):
+    dx = np.abs(cxx - _ks_quadrants(x, y)).max(axis=(-2, -1))
+    dy = np.abs(cyy - _ks_quadrants(y, x)).max(axis=(-2, -1))
+    return np.maximum(dx, dy)
+
+
+def _kldiv_prepare(x, *, k=1):
+    nx, d = x.shape
+
+    # Limit the number of dimensions to 10, too slow otherwise.
+    if d > 10:
+        raise ValueError("Too many dimensions: {}.".format(d))
 
-        # Count the number of samples in each quadrant
-        cx = 1.0 * np.apply_along_axis(np.bincount, 0, ix, minlength=minlength) / nx
-        cy = 1.0 * np.apply_along_axis(np.bincount, 0, iy, minlength=minlength) / ny
+    # Not enough data to draw conclusions.
+    if nx < 5:
+        return {"r": None}
 
-        # This is from https://github.com/syrte/ndtest/blob/master/ndtest.py
-        # D = cx - cy
-        # D[0,:] -= 1. / nx # I don't understand this...
-        # dmin, dmax = -D.min(), D.max() + .1 / nx
+    # Get the k'th nearest neighbour from each points in x.
+    # We get the values for K + 1 to make sure the output is a 2D array.
+    kmax = max(np.atleast_1d(k)) + 1
+    r, _ = KDTree(x).query(x, k=kmax, eps=0, p=2, n_jobs=2)
+    return {"r": r}
 
-        return np.max(np.abs(cx - cy))
 
-    return max(pivot(x, y), pivot(y, x))
+def _kldiv_prepare_candidate(y, *, k=1):
+    # Build a KD tree representation of the candidate sample.
+    return {"ytree": KDTree(y) if y.shape[0] >= 5 else None}
 
 
-@metric
-def kldiv(x, y, *, k=1):
+@metric(prepare=_kldiv_prepare, prepare_candidate=_kldiv_prepare_candidate)
+def kldiv(x, y, *, r, ytree, k=1):
     r"""
     Compute the Kullback-Leibler divergence between two multivariate samples.
 
@@ -523,23 +876,13 @@ def kldiv(x, y, *, k=1):
     nx, d = x.shape
     ny, d = y.shape
 
-    # Limit the number of dimensions to 10, too slow otherwise.
-    if d > 10:
-        raise ValueError("Too many dimensions: {}.".format(d))
-
     # Not enough data to draw conclusions.
-    if nx < 5 or ny < 5:
+    if r is None or ytree is None:
         return np.nan if not mk else [np.nan] * len(k)
 
-    # Build a KD tree representation of the samples.
-    xtree = KDTree(x)
-    ytree = KDTree(y)
-
-    # Get the k'th nearest neighbour from each points in x for both x and y.
-    # We get the values for K + 1 to make sure the output is a 2D array.
-    kmax = max(ka) + 1
-    r, _ = xtree.query(x, k=kmax, eps=0, p=2, n_jobs=2)
-    s, _ = ytree.query(x, k=kmax, eps=0, p=2, n_jobs=2)
+    # Get the k'th nearest neighbour from each points in x in y,
+    # the distances to their neighbours in x (r) are computed by `_kldiv_prepare`.
+    s, _ = ytree.query(x, k=r.shape[1], eps=0, p=2, n_jobs=2)
 
     # There is a mistake in the paper. In Eq. 14, the right side misses a
     # negative sign on the first term of the right hand side.
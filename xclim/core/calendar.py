@@ -7,6 +7,11 @@ Calendar handling utilities
 Helper function to handle dates, times and different calendars with xarray.
 """
 import datetime as pydt
+import itertools
+import operator
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Any, Optional, Sequence, Union
 
 import cftime
@@ -25,6 +30,8 @@ from xarray.coding.cftime_offsets import (
 from xarray.coding.cftimeindex import CFTimeIndex
 from xarray.core.resample import DataArrayResample
 
+from .utils import float_dtype
+
 # cftime and datetime classes to use for each calendar name
 datetime_classes = {"default": pydt.datetime, **cftime._cftime.DATE_TYPES}
 
@@ -42,6 +49,86 @@ max_doy = {
     "360_day": 360,
 }
 
+# Days in each month, for normal (first row) and leap years (second row).
+_month_lengths = np.array(
+    [
+        [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+        [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+    ]
+)
+# Days of the year before the start of each month, and the total on the last column.
+_month_starts = np.concatenate(
+    [np.zeros((2, 1), dtype=int), _month_lengths.cumsum(axis=1)], axis=1
+)
+
+
+def _is_leap_year(year: np.ndarray, calendar: str) -> np.ndarray:
+    """Return a boolean array, True where the year is a leap year in the given calendar."""
+    year = np.asarray(year)
+    if calendar in ["noleap", "365_day", "360_day"]:
+        return np.zeros(year.shape, dtype=bool)
+    if calendar in ["all_leap", "366_day"]:
+        return np.ones(year.shape, dtype=bool)
+    julian = year % 4 == 0
+    if calendar == "julian":
+        return julian
+    gregorian = julian & ((year % 100 != 0) | (year % 400 == 0))
+    if calendar in ["standard", "gregorian"]:
+        # Mixed julian/gregorian calendar, the switch happened in October 1582.
+        return np.where(year < 1583, julian, gregorian)
+    return gregorian
+
+
+def _days_in_year(year: np.ndarray, calendar: str) -> np.ndarray:
+    """Return the number of days in each year of an array, according to the calendar."""
+    year = np.asarray(year)
+    if calendar == "360_day":
+        return np.full(year.shape, 360)
+    return 365 + _is_leap_year(year, calendar)
+
+
+def _is_valid_date(
+    year: np.ndarray, month: np.ndarray, day: np.ndarray, calendar: str
+) -> np.ndarray:
+    """Return a boolean array, True where the year, month and day form a date that exists in the calendar."""
+    if calendar == "360_day":
+        return day <= 30
+    valid = day <= _month_lengths[_is_leap_year(year, calendar).astype(int), month - 1]
+    if calendar in ["standard", "gregorian"]:
+        # 1582-10-05 to 1582-10-14 were skipped in the switch to the gregorian calendar.
+        valid &= ~((year == 1582) & (month == 10) & (day > 4) & (day < 15))
+    return valid
+
+
+def _doy_to_month_day(year: np.ndarray, doy: np.ndarray, calendar: str):
+    """Return the month and day arrays of the given days of year (starting at 1) in the calendar."""
+    if calendar == "360_day":
+        return (doy - 1) // 30 + 1, (doy - 1) % 30 + 1
+    starts = _month_starts[_is_leap_year(year, calendar).astype(int)]
+    month = (starts[:, 1:] < doy[:, np.newaxis]).sum(axis=1) + 1
+    return month, doy - starts[np.arange(doy.size), month - 1]
+
+
+def _dates_from_fields(calendar: str, *fields: np.ndarray) -> np.ndarray:
+    """Return an array of dates in the calendar from arrays of their components.
+
+    The fields are the year, month, day, hour, minute, second and microsecond arrays. Dates of the
+    "default" calendar are returned as numpy's datetime64 (or python datetimes if they are out of its range),
+    the others as cftime objects.
+    """
+    if calendar == "default" and ((fields[0] > 1677) & (fields[0] < 2262)).all():
+        year, month, day, hour, minute, second, microsecond = fields
+        months = (year - 1970).astype("datetime64[Y]").astype("datetime64[M]")
+        days = (months + (month - 1)).astype("datetime64[D]") + (day - 1)
+        offsets = ((hour * 60 + minute) * 60 + second) * 1_000_000 + microsecond
+        return days.astype("datetime64[ns]") + offsets.astype("timedelta64[us]")
+    cls = datetime_classes[calendar]
+    dates = np.empty(len(fields[0]), dtype=object)
+    # Filling element-wise avoids numpy inspecting each date as a potential sequence.
+    for i, args in enumerate(zip(*(f.tolist() for f in fields))):
+        dates[i] = cls(*args)
+    return dates
+
 
 def get_calendar(obj: Any, dim: str = "time") -> str:
     """Return the calendar of an object.
@@ -68,6 +155,9 @@ def get_calendar(obj: Any, dim: str = "time") -> str:
       The cftime calendar name or "default" when the data is using numpy's or python's datetime types.
     """
     if isinstance(obj, (xr.DataArray, xr.Dataset)):
+        if isinstance(obj.indexes.get(dim), CFTimeIndex):
+            # Indexes can't hold missing values.
+            return obj.indexes[dim][0].calendar
         if obj[dim].dtype == "O":
             obj = obj[dim].where(obj[dim].notnull(), drop=True)[0].item()
         elif "datetime64" in obj[dim].dtype.name:
@@ -84,6 +174,235 @@ def get_calendar(obj: Any, dim: str = "time") -> str:
     raise ValueError(f"Calendar could not be inferred from object of type {type(obj)}.")
 
 
+class TimeIndexInfo:
+    """Date components and calendar of a time index.
+
+    The components are integer arrays, computed the first time they are accessed. For cftime indexes, the
+    most common components are extracted together, in a single pass over the dates. Use :py:func:`time_index_info`
+    to get the cached instance of an index.
+
+    Parameters
+    ----------
+    index : Union[pd.DatetimeIndex, CFTimeIndex]
+      The time index.
+
+    Attributes
+    ----------
+    calendar : str
+      The calendar name, "default" for numpy's datetime64.
+    year, month, day, hour, dayofyear, dayofweek, days_in_month, minute, second, microsecond : np.ndarray
+      Date components of each element of the index, with the same conventions as xarray's `dt` accessor.
+    season : np.ndarray
+      Season of each element, as a three-letter string ("DJF", "MAM", "JJA" or "SON").
+    """
+
+    fields = (
+        "year",
+        "month",
+        "day",
+        "hour",
+        "dayofyear",
+        "dayofweek",
+        "days_in_month",
+        "minute",
+        "second",
+        "microsecond",
+    )
+    _seasons = np.array("DJF DJF MAM MAM MAM JJA JJA JJA SON SON SON DJF".split())
+
+    def __init__(self, index):
+        self.size = len(index)
+        if isinstance(index, CFTimeIndex):
+            self.calendar = index[0].calendar if self.size else "default"
+        else:
+            self.calendar = "default"
+        self._index = weakref.ref(index)
+        self._components = {}
+        self._labels = {}
+
+    # Attributes of cftime dates for the fields, computed in groups of one pass each, the most common ones first.
+    _cftime_attrs = (
+        ("year", "month", "day", "hour", "dayofyr"),
+        ("dayofwk", "daysinmonth"),
+        ("minute", "second", "microsecond"),
+    )
+
+    def _compute(self, name):
+        """Return the components computed along with `name`, as a dictionary."""
+        index = self._index()
+        if index is None:
+            raise RuntimeError("The time index has been garbage collected.")
+        if not isinstance(index, CFTimeIndex):
+            return {name: np.asarray(getattr(index, name))}
+
+        start = 0
+        for attrs in self._cftime_attrs:
+            fields = self.fields[start : start + len(attrs)]
+            if name in fields:
+                break
+            start += len(attrs)
+        values = np.fromiter(
+            itertools.chain.from_iterable(map(operator.attrgetter(*attrs), index)),
+            dtype=int,
+            count=self.size * len(attrs),
+        ).reshape(self.size, len(attrs))
+        return dict(zip(fields, values.T.copy()))
+
+    def __getattr__(self, name):
+        """Return the components of the index, computing them on first access."""
+        if name == "season":
+            return self._seasons[self.month - 1]
+        if name not in self.fields:
+            raise AttributeError(f"{self.__class__.__name__} has no field {name}.")
+        if name not in self._components:
+            comps = self._compute(name)
+            for arr in comps.values():
+                arr.flags.writeable = False
+            self._components.update(comps)
+        return self._components[name]
+
+    def period_labels(self, freq: str) -> np.ndarray:
+        """Return integer labels of the resampling period of each element.
+
+        Labels increase with time and are the same for all elements of a period. Supported frequencies are
+        yearly, quarterly and monthly (start or end anchored, ex: "YS", "AS-JUL", "QS-DEC", "M") and daily.
+
+        Parameters
+        ----------
+        freq : str
+          Resampling frequency, with a multiple of 1.
+
+        Returns
+        -------
+        np.ndarray
+          Labels of each element, as an array of integers.
+        """
+        if freq not in self._labels:
+            offset = to_offset(freq)
+            if offset.n != 1:
+                raise ValueError(
+                    f"Frequency {freq} is not supported, the multiple must be 1."
+                )
+            months = self.year * 12 + self.month - 1
+            if isinstance(offset, (YearBegin, QuarterBegin)):
+                start = offset.month - 1
+            elif isinstance(offset, (YearEnd, QuarterEnd)):
+                start = offset.month
+            if isinstance(offset, (YearBegin, YearEnd)):
+                labels = (months - start) // 12
+            elif isinstance(offset, (QuarterBegin, QuarterEnd)):
+                labels = (months - start % 3) // 3
+            elif isinstance(offset, (MonthBegin, MonthEnd)):
+                labels = months
+            elif offset.rule_code() == "D":
+                labels = self.year * 400 + self.dayofyear
+            else:
+                raise ValueError(f"Frequency {freq} is not supported.")
+            labels.flags.writeable = False
+            self._labels[freq] = labels
+        return self._labels[freq]
+
+
+# Cache of TimeIndexInfo, by id of the index and by its values.
+_time_info_ids = {}
+_time_info_hashes = OrderedDict()
+_time_info_lock = threading.Lock()
+_TIME_INFO_CACHE_SIZE = 16
+
+
+def _index_key(index):
+    """Return a key comparing equal for indexes with the same dates and calendar.
+
+    For cftime indexes, the key is only a fingerprint made of the calendar, the length and the first and last
+    dates: indexes with the same key must still be compared.
+    """
+    if isinstance(index, CFTimeIndex):
+        if len(index) == 0:
+            return "cftime", None, 0
+        # Dates of different calendars can compare and hash equal.
+        return "cftime", index[0].calendar, len(index), index[0], index[-1]
+    return "datetime64", np.asarray(index.values).view("i8").tobytes()
+
+
+def time_index_info(obj: Any, dim: str = "time") -> TimeIndexInfo:
+    """Return the date components and calendar of a time index, cached.
+
+    Computations on the same time coordinate share the same instance, so that the date components of
+    cftime indexes are extracted only once. Instances are cached by the identity of the index and, for
+    indexes that are new but equal to a recently used one, by their values and calendar. A new cftime index is
+    only matched with a recently used index that still exists.
+
+    Parameters
+    ----------
+    obj : Union[xr.DataArray, xr.Dataset, pd.DatetimeIndex, CFTimeIndex]
+      An array or dataset with a `dim` time index, or the index itself.
+    dim : str
+      Name of the time dimension.
+
+    Returns
+    -------
+    TimeIndexInfo
+      The date components of the index.
+    """
+    index = obj.indexes[dim] if isinstance(obj, (xr.DataArray, xr.Dataset)) else obj
+
+    ref, info = _time_info_ids.get(id(index), (None, None))
+    if ref is not None and ref() is index:
+        return info
+
+    key = _index_key(index)
+    with _time_info_lock:
+        info = _time_info_hashes.get(key)
+        if info is not None and key[0] == "cftime":
+            # Only the fingerprint matches, the dates are compared to the ones of the cached index, if it still exists.
+            cached = info._index()
+            if cached is None or not (cached is index or cached.equals(index)):
+                info = None
+        if info is None:
+            info = TimeIndexInfo(index)
+            _time_info_hashes[key] = info
+            if len(_time_info_hashes) > _TIME_INFO_CACHE_SIZE:
+                _time_info_hashes.popitem(last=False)
+        else:
+            if info._index() is None:
+                info._index = weakref.ref(index)
+        _time_info_hashes.move_to_end(key)
+
+    key = id(index)
+    _time_info_ids[key] = (
+        weakref.ref(index, lambda _: _time_info_ids.pop(key, None)),
+        info,
+    )
+    return info
+
+
+def time_field(
+    obj: Union[xr.DataArray, xr.Dataset], name: str, dim: str = "time"
+) -> xr.DataArray:
+    """Return a date component of the time coordinate, the same as `obj[dim].dt.<name>`, from the cached info.
+
+    Parameters
+    ----------
+    obj : Union[xr.DataArray, xr.Dataset]
+      An array or dataset with a `dim` time index.
+    name : str
+      The date component, one of the fields of :py:class:`TimeIndexInfo` or "season".
+    dim : str
+      Name of the time dimension.
+
+    Returns
+    -------
+    xr.DataArray
+      The date component of each time step, named `name`.
+    """
+    return xr.DataArray(
+        getattr(time_index_info(obj, dim), name),
+        dims=(dim,),
+        coords={dim: obj[dim]},
+        name=name,
+    )
+
+
 def convert_calendar(
     source: Union[xr.DataArray, xr.Dataset],
     target: Union[xr.DataArray, str],
@@ -177,41 +496,34 @@ def convert_calendar(
     if cal_src != "360_day" and cal_tgt != "360_day":
         align_on = None
 
-    out = source.copy()
+    info = time_index_info(source, dim)
+    year = info.year
     # TODO Maybe the 5-6 days to remove could be given by the user?
     if align_on == "year":
+        # The nearest day in the target calendar of the corresponding "decimal year" in the source calendar
+        doy = np.round(
+            _days_in_year(year, cal_tgt) * info.dayofyear / _days_in_year(year, cal_src)
+        ).astype(int)
+        month, day = _doy_to_month_day(year, doy, cal_tgt)
+    else:
+        month, day = info.month, info.day
 
-        def _yearly_interp_doy(time):
-            # Returns the nearest day in the target calendar of the corresponding "decimal year" in the source calendar
-            yr = int(time.dt.year[0])
-            return np.round(
-                days_in_year(yr, cal_tgt)
-                * time.dt.dayofyear
-                / days_in_year(yr, cal_src)
-            ).astype(int)
-
-        new_doy = source.time.groupby(f"{dim}.year").map(_yearly_interp_doy)
-
-        # Convert the source datetimes, but override the doy with our new doys
-        out[dim] = xr.DataArray(
-            [
-                _convert_datetime(datetime, new_doy=doy, calendar=cal_tgt)
-                for datetime, doy in zip(source[dim].indexes[dim], new_doy)
-            ],
-            dims=(dim,),
-            name=dim,
-        )
+    # Remove invalid dates in the target calendar
+    keep = np.flatnonzero(_is_valid_date(year, month, day, cal_tgt))
+    if align_on == "year":
         # Remove duplicate timestamps, happens when reducing the number of days
-        out = out.isel({dim: np.unique(out[dim], return_index=True)[1]})
+        seconds = ((year * 400 + doy) * 24 + info.hour) * 3600
+        seconds += info.minute * 60 + info.second
+        stamps = seconds[keep] * 1_000_000 + info.microsecond[keep]
+        keep = keep[np.unique(stamps, return_index=True)[1]]
+
+    fields = [year, month, day, info.hour, info.minute, info.second, info.microsecond]
+    if keep.size == year.size and (keep[:-1] < keep[1:]).all():
+        out = source.copy()
     else:
-        time_idx = source[dim].indexes[dim]
-        out[dim] = xr.DataArray(
-            [_convert_datetime(time, calendar=cal_tgt) for time in time_idx],
-            dims=(dim,),
-            name=dim,
-        )
-        # Remove NaN that where put on invalid dates in target calendar
-        out = out.where(out[dim].notnull(), drop=True)
+        out = source.isel({dim: keep})
+        fields = [f[keep] for f in fields]
+    out[dim] = xr.DataArray(_dates_from_fields(cal_tgt, *fields), dims=(dim,), name=dim)
 
     if isinstance(target, str) and missing is not None:
         target = date_range_like(source[dim], cal_tgt)
@@ -421,11 +733,7 @@ def datetime_to_decimal_year(times: xr.DataArray, calendar: str = "") -> xr.Data
 
 def days_in_year(year: int, calendar: str = "default") -> int:
     """Return the number of days in the input year according to the input calendar."""
-    return (
-        (datetime_classes[calendar](year + 1, 1, 1) - pydt.timedelta(days=1))
-        .timetuple()
-        .tm_yday
-    )
+    return int(_days_in_year(year, calendar))
 
 
 def percentile_doy(
@@ -454,7 +762,7 @@ def percentile_doy(
     rr = arr.rolling(min_periods=1, center=True, time=window).construct("window")
 
     # Create empty percentile array
-    g = rr.groupby("time.dayofyear")
+    g = rr.groupby(time_field(rr, "dayofyear"))
 
     p = g.quantile(q=per, dim=("time", "window"), skipna=True)
 
@@ -463,6 +771,8 @@ def percentile_doy(
     if p.dayofyear.max() == 366:
         p = adjust_doy_calendar(p.sel(dayofyear=(p.dayofyear < 366)), arr)
 
+    # The quantiles and the interpolation are computed in float64.
+    p = p.astype(float_dtype(arr))
     p.attrs.update(arr.attrs.copy())
     return p
 
@@ -529,6 +839,63 @@ def adjust_doy_calendar(source: xr.DataArray, target: xr.DataArray) -> xr.DataAr
     return _interpolate_doy_calendar(source, doy_max)
 
 
+def _doy_positions(doy: xr.DataArray, arr: xr.DataArray):
+    """Return `doy` adjusted to the calendar of `arr` and the position of each time step of `arr` along it."""
+    if "dayofyear" not in doy.coords:
+        raise AttributeError("Source should have `dayofyear` coordinates.")
+
+    # Adjust calendar
+    adoy = adjust_doy_calendar(doy, arr)
+
+    pos = adoy.indexes["dayofyear"].get_indexer(time_index_info(arr).dayofyear)
+    if (pos < 0).any():
+        raise KeyError("Some days of the year of `arr` are missing from `doy`.")
+    return adoy, xr.DataArray(pos, dims=("time",), coords={"time": arr.time})
+
+
+# Maximal number of elements of the thresholds taken at once by `_take_doy`.
+_DOY_BLOCK_SIZE = 2 ** 20
+
+
+def _take_doy(doy: np.ndarray, arr: np.ndarray, pos: np.ndarray, op=None):
+    """Take the values of `doy` at positions `pos` along its last axis, or compare `arr` to them with `op`.
+
+    `arr` has time on its last axis. The thresholds are taken in blocks of time steps, so that they are never
+    broadcast against the whole array at once.
+    """
+    if doy.ndim > 1:
+        # Drop the time axis inserted by apply_ufunc.
+        doy = doy[..., 0, :]
+    shape = np.broadcast(arr, doy[..., :1]).shape
+    out = np.empty(shape, dtype=doy.dtype if op is None else bool)
+    step = max(1, _DOY_BLOCK_SIZE // max(1, out[..., 0].size))
+    for start in range(0, shape[-1], step):
+        sl = slice(start, start + step)
+        if op is None:
+            out[..., sl] = doy[..., pos[sl]]
+        else:
+            op(arr[..., sl], doy[..., pos[sl]], out=out[..., sl])
+    return out
+
+
+def _apply_doy(doy: xr.DataArray, arr: xr.DataArray, op=None, dtype=None):
+    """Apply `_take_doy` on each block of `arr`, with dimensions ordered as in `arr`."""
+    adoy, pos = _doy_positions(doy, arr)
+    # Passing the thresholds first puts time on the last axis of the broadcast inputs.
+    out = xr.apply_ufunc(
+        _take_doy,
+        adoy.reset_coords(drop=True),
+        arr.transpose(..., "time"),
+        pos,
+        input_core_dims=[["dayofyear"], [], []],
+        kwargs=dict(op=op),
+        dask="parallelized",
+        output_dtypes=[dtype or adoy.dtype],
+        dask_gufunc_kwargs=dict(allow_rechunk=True),
+    )
+    return out.transpose(*arr.dims, ...)
+
+
 def resample_doy(doy: xr.DataArray, arr: xr.DataArray) -> xr.DataArray:
     """Create a temporal DataArray where each day takes the value defined by the day-of-year.
 
@@ -545,20 +912,48 @@ def resample_doy(doy: xr.DataArray, arr: xr.DataArray) -> xr.DataArray:
       An array with the same `time` dimension as `arr` whose values are filled according to the day-of-year value in
       `doy`.
     """
-    if "dayofyear" not in doy.coords:
-        raise AttributeError("Source should have `dayofyear` coordinates.")
+    out = _apply_doy(doy, arr)
+    out.attrs.update(arr.attrs)
+    return out.rename(arr.name)
+
+
+# Numpy comparison functions of the operators accepted by `compare_doy`.
+_doy_ops = {
+    ">": np.greater,
+    "<": np.less,
+    ">=": np.greater_equal,
+    "<=": np.less_equal,
+    "gt": np.greater,
+    "lt": np.less,
+    "ge": np.greater_equal,
+    "le": np.less_equal,
+}
 
-    # Adjust calendar
-    adoy = adjust_doy_calendar(doy, arr)
 
-    # Create array with arr shape and coords
-    out = xr.full_like(arr, np.nan)
+def compare_doy(arr: xr.DataArray, op: str, doy: xr.DataArray) -> xr.DataArray:
+    """Compare each time step of an array to the threshold of its day of year.
 
-    # Fill with values from `doy`
-    d = out.time.dt.dayofyear.values
-    out.data = adoy.sel(dayofyear=d)
+    This is equivalent to ``arr > resample_doy(doy, arr)`` (for `op` ">"), but the thresholds are only taken for a block
+    of time steps at a time, without creating the full-size array of thresholds. With dask, the comparison is done lazily,
+    on each block of `arr`.
 
-    return out
+    Parameters
+    ----------
+    arr : xr.DataArray
+      Array with `time` coordinate.
+    op : {">", "<", ">=", "<=", "gt", "lt", "ge", "le"}
+      Logical operator, e.g. arr > doy.
+    doy : xr.DataArray
+      Array of thresholds with `dayofyear` coordinate.
+
+    Returns
+    -------
+    xr.DataArray
+      Boolean array, True where the comparison of `arr` with the threshold of the day of year is true.
+    """
+    if op not in _doy_ops:
+        raise ValueError(f"Operation `{op}` not recognized.")
+    return _apply_doy(doy, arr, op=_doy_ops[op], dtype=bool)
 
 
 def cftime_start_time(date, freq):
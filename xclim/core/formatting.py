@@ -36,6 +36,8 @@ class AttrFormatter(string.Formatter):
         super().__init__()
         self.modifiers = modifiers
         self.mapping = mapping
+        # Matched mapping key of the values already seen.
+        self._matches = {}
 
     def format_field(self, value, format_spec):
         """Format a value given a formatting spec.
@@ -74,11 +76,16 @@ class AttrFormatter(string.Formatter):
         return super().format_field(value, format_spec)
 
     def _match_value(self, value):
-        if isinstance(value, str):
-            for mapval in self.mapping.keys():
-                if fnmatch(value, mapval):
-                    return mapval
-        return None
+        if not isinstance(value, str):
+            return None
+        if value not in self._matches:
+            if len(self._matches) > 1024:
+                self._matches.clear()
+            self._matches[value] = next(
+                (mapval for mapval in self.mapping.keys() if fnmatch(value, mapval)),
+                None,
+            )
+        return self._matches[value]
 
 
 # Tag mappings between keyword arguments and long-form text.
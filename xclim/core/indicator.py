@@ -11,12 +11,14 @@ missing and adds metadata attributes to the output object.
 For more info on how to define new indicators see `here <notebooks/customize.ipynb#Defining-new-indicators>`_.
 """
 import re
+import threading
 import warnings
 import weakref
 from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
 from copy import deepcopy
 from enum import IntEnum
-from inspect import Parameter, _empty, signature
+from inspect import BoundArguments, Parameter, _empty, signature
 from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 import numpy as np
@@ -36,11 +38,186 @@ from .formatting import (
 from .locales import TRANSLATABLE_ATTRS, get_local_attrs, get_local_formatter
 from .options import MISSING_METHODS, MISSING_OPTIONS, OPTIONS
 from .units import convert_units_to, units
-from .utils import MissingVariableError
+from .utils import MissingVariableError, float_dtype
+
+
+class _IndicatorRegistry(MutableMapping):
+    """Registry of indicator classes, keyed by class name.
+
+    Indicators defined with `Indicator.lazy` are listed under the name their class will take, but the class is only
+    created when it is first looked up.
+    """
+
+    def __init__(self):
+        self._classes = {}
+        self._pending = {}
+
+    def add_lazy(self, name: str, indicator: "LazyIndicator"):
+        """List a lazy indicator under the name of its future class."""
+        if name in self:
+            warnings.warn(f"Class {name} already exists and will be overwritten.")
+        self._pending[name] = indicator
+
+    def is_pending(self, name: str) -> bool:
+        """Whether `name` is the name of a lazy indicator that wasn't created yet."""
+        return name in self._pending
+
+    def __getitem__(self, name):
+        lazy = self._pending.get(name)
+        if lazy is not None:
+            lazy._lazy_build()
+        return self._classes[name]
+
+    def __setitem__(self, name, cls):
+        self._pending.pop(name, None)
+        self._classes[name] = cls
+
+    def __delitem__(self, name):
+        if self._pending.pop(name, None) is None:
+            del self._classes[name]
+        else:
+            self._classes.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._classes or name in self._pending
+
+    def __iter__(self):
+        # Lazy indicators created by other threads are removed from `_pending` during the iteration.
+        pending = [name for name in list(self._pending) if name not in self._classes]
+        return iter(list(self._classes) + pending)
+
+    def __len__(self):
+        return len(self._classes.keys() | self._pending.keys())
+
+    def copy(self):
+        """Return a dictionary of all registered classes, creating the lazy indicators."""
+        return dict(self.items())
+
 
 # Indicators registry
-registry = {}  # Main class registry
+registry = _IndicatorRegistry()  # Main class registry
 _indicators_registry = defaultdict(list)  # Private instance registry
+_lazy_lock = threading.RLock()
+
+# Cache of the formatted attributes and call signatures, by indicator class, call arguments and metadata locales.
+_attrs_cache = OrderedDict()
+_ATTRS_CACHE_SIZE = 1024
+
+
+def _freeze(value):
+    """Return a hashable version of a call argument or attribute, raise a TypeError if it can't be used in a key."""
+    if isinstance(value, (str, int, float, type(None))) or callable(value):
+        # The type is included so that, for example, 5 and 5.0 are not considered equal.
+        return type(value), value
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(map(_freeze, value))
+    if isinstance(value, dict):
+        return dict, tuple((k, _freeze(v)) for k, v in value.items())
+    raise TypeError(f"Values of type {type(value)} can't be frozen.")
+
+
+def _attrs_key(cls, var_id, das, attrs, args, names):
+    """Return the key of the formatted attributes in `_attrs_cache`, None if they can't be cached."""
+    locales = OPTIONS["metadata_locales"]
+    # Locales given as dictionaries or files could be modified.
+    if not all(isinstance(locale, str) for locale in locales):
+        return None
+    try:
+        key = (cls, var_id, tuple(das), _freeze(attrs), _freeze(args), _freeze(names))
+        hash(key)
+    except TypeError:
+        return None
+    return key + tuple(locales)
+
+
+class _CallPlan:
+    """Resolution of call arguments to the parameters of an indicator signature, precomputed at class creation.
+
+    `bind` gives the same arguments as `Signature.bind` followed by `BoundArguments.apply_defaults`, but without the
+    `inspect` machinery. Calls it can't resolve (invalid calls, unusual parameter kinds) return None and should be
+    bound with the signature, which raises the appropriate errors.
+    """
+
+    _kinds = (
+        Parameter.POSITIONAL_OR_KEYWORD,
+        Parameter.KEYWORD_ONLY,
+        Parameter.VAR_KEYWORD,
+    )
+
+    def __init__(self, sig):
+        params = sig.parameters
+        self.supported = all(p.kind in self._kinds for p in params.values())
+        self.names = tuple(params)
+        self.positional = tuple(
+            name for name, p in params.items() if p.kind == p.POSITIONAL_OR_KEYWORD
+        )
+        self.keywords = frozenset(
+            name for name, p in params.items() if p.kind != p.VAR_KEYWORD
+        )
+        self.defaults = {
+            name: p.default for name, p in params.items() if p.default is not _empty
+        }
+        self.varkw = next(
+            (name for name, p in params.items() if p.kind == p.VAR_KEYWORD), None
+        )
+        # Inputs that can be given as variable names of the `ds` dataset.
+        self.variables = tuple(
+            name for name, p in params.items() if p.annotation is Union[str, DataArray]
+        )
+
+    def bind(self, args, kwds) -> Optional[OrderedDict]:
+        """Return the call arguments with defaults, in the order of the signature, or None if they can't be resolved."""
+        if not self.supported or len(args) > len(self.positional):
+            return None
+        values = dict(zip(self.positional, args))
+        extra = {}
+        for name, value in kwds.items():
+            if name in self.keywords:
+                if name in values:
+                    return None
+                values[name] = value
+            elif self.varkw is not None:
+                extra[name] = value
+            else:
+                return None
+
+        arguments = OrderedDict()
+        for name in self.names:
+            if name in values:
+                arguments[name] = values[name]
+            elif name == self.varkw:
+                arguments[name] = extra
+            elif name in self.defaults:
+                arguments[name] = self.defaults[name]
+            else:
+                return None
+        return arguments
+
+
+# Whether check functions accept the indicator inputs as keywords, by function and input names.
+_bind_by_name = {}
+
+
+def _binds_by_name(func, names):
+    """Return True if `func` can be called with `names` as keyword arguments, see `Indicator.bind_call`."""
+    key = (func, names)
+    try:
+        return _bind_by_name[key]
+    except KeyError:
+        pass
+    except TypeError:  # Unhashable callable
+        key = None
+
+    try:
+        signature(func).bind(**dict.fromkeys(names))
+    except TypeError:
+        by_name = False
+    else:
+        by_name = True
+
+    if key is not None:
+        _bind_by_name[key] = by_name
+    return by_name
 
 
 class InputKind(IntEnum):
@@ -57,7 +234,7 @@ class IndicatorRegistrar:
     def __new__(cls):
         """Add subclass to registry."""
         name = cls.__name__
-        if name in registry:
+        if name in registry and not registry.is_pending(name):
             warnings.warn(f"Class {name} already exists and will be overwritten.")
         registry[name] = cls
         return super().__new__(cls)
@@ -80,6 +257,60 @@ class IndicatorRegistrar:
         )
 
 
+class LazyIndicator:
+    """Indicator created on first use.
+
+    Holds the base class and keywords of an indicator definition, see `Indicator.lazy`. The indicator is listed in the
+    `registry` right away, but its class is only created, and its `compute` docstring parsed, when it is first used.
+    Attribute access and calls are forwarded to the created indicator.
+    """
+
+    __slots__ = ("_lazy_base", "_lazy_kwds", "_lazy_indicator")
+
+    def __init__(self, base: type, **kwds):
+        object.__setattr__(self, "_lazy_base", base)
+        object.__setattr__(self, "_lazy_kwds", kwds)
+        object.__setattr__(self, "_lazy_indicator", None)
+
+        identifier = kwds.get("identifier", base.identifier)
+        if identifier is None:
+            raise AttributeError("`identifier` has not been set.")
+        registry.add_lazy(identifier.upper(), self)
+
+    def _lazy_build(self):
+        """Return the indicator, creating it on first call."""
+        with _lazy_lock:
+            ind = object.__getattribute__(self, "_lazy_indicator")
+            if ind is None:
+                base = object.__getattribute__(self, "_lazy_base")
+                ind = base(**object.__getattribute__(self, "_lazy_kwds"))
+                object.__setattr__(self, "_lazy_indicator", ind)
+        return ind
+
+    def __getattribute__(self, name):
+        """Return the attribute of the indicator, creating it if needed."""
+        if name in LazyIndicator.__slots__ or name == "_lazy_build":
+            return object.__getattribute__(self, name)
+        # Also forwards `__class__`, so that `isinstance` sees the created indicator.
+        return getattr(object.__getattribute__(self, "_lazy_build")(), name)
+
+    def __setattr__(self, name, value):
+        """Set the attribute on the indicator, creating it if needed."""
+        setattr(self._lazy_build(), name, value)
+
+    def __call__(self, *args, **kwds):
+        """Call the indicator, creating it if needed."""
+        return self._lazy_build()(*args, **kwds)
+
+    def __repr__(self):
+        """Return the representation of the indicator, creating it if needed."""
+        return repr(self._lazy_build())
+
+    def __dir__(self):
+        """List the attributes of the indicator, creating it if needed."""
+        return dir(self._lazy_build())
+
+
 class Indicator(IndicatorRegistrar):
     r"""Climate indicator base class.
 
@@ -243,6 +474,16 @@ class Indicator(IndicatorRegistrar):
         # This will create an instance from the new class and call __init__.
         return super().__new__(new)
 
+    @classmethod
+    def lazy(cls, **kwds) -> LazyIndicator:
+        """Define an indicator that is only created when first used.
+
+        Takes the same arguments as the class. The indicator is added to the `registry`, but its subclass is only
+        created on the first registry lookup, attribute access or call. Used for the indicators defined in
+        `xclim.indicators`, so that importing xclim does not build them all.
+        """
+        return LazyIndicator(cls, **kwds)
+
     @classmethod
     def _parse_compute_and_docstring(cls, kwds):
         """
@@ -296,6 +537,8 @@ class Indicator(IndicatorRegistrar):
         new_compute.__doc__ = compute.__doc__
         # The input parameters' name
         kwds["_parameters"] = tuple(kwds["_sig"].parameters.keys())
+        # How call arguments are bound to these parameters
+        kwds["_call_plan"] = _CallPlan(kwds["_sig"])
         # The *indicator* compute function that will be wrapped by __call__
         kwds["_indcompute"] = new_compute
 
@@ -373,6 +616,10 @@ class Indicator(IndicatorRegistrar):
         # Validation is done : register the instance.
         super().__init__()
 
+        # Resolve how the checks are called, see `bind_call`.
+        for check in (self.datacheck, self.cfcheck):
+            _binds_by_name(check, self._parameters[: self._nvar])
+
         # Update call signature
         self.__call__ = wraps(self._indcompute)(self.__call__)
 
@@ -382,8 +629,13 @@ class Indicator(IndicatorRegistrar):
         n_outs = len(self.cf_attrs)
 
         # Bind call arguments to `compute` arguments and set defaults.
-        ba = self._sig.bind(*args, **kwds)
-        ba.apply_defaults()
+        arguments = self._call_plan.bind(args, kwds)
+        if arguments is None:
+            # Let `inspect` bind the unusual calls and raise errors for the invalid ones.
+            ba = self._sig.bind(*args, **kwds)
+            ba.apply_defaults()
+        else:
+            ba = BoundArguments(self._sig, arguments)
 
         # Assign inputs passed as strings from ds.
         self._assign_named_args(ba)
@@ -432,20 +684,26 @@ class Indicator(IndicatorRegistrar):
         # Mask results that do not meet criteria defined by the `missing` method.
         # This means all variables must have the same dimensions...
         mask = self.mask(*das.values(), **ba.arguments)
-        outs = [out.where(~mask) for out in outs]
+        outs = [self._to_float(out).where(~mask) for out in outs]
 
         # Return a single DataArray in case of single output, otherwise a tuple
         if n_outs == 1:
             return outs[0]
         return tuple(outs)
 
+    @staticmethod
+    def _to_float(out: DataArray) -> DataArray:
+        """Cast the output to the floating point dtype given by the `precision` option, before masking it."""
+        dtype = float_dtype(out)
+        if out.dtype.kind not in "iuf" or out.dtype == dtype:
+            return out
+        return out.copy(deep=False, data=out.data.astype(dtype))
+
     def _assign_named_args(self, ba):
         """Assign inputs passed as strings from ds."""
         ds = ba.arguments.pop("ds")
-        for name, param in self._sig.parameters.items():
-            if param.annotation is Union[str, DataArray] and isinstance(
-                ba.arguments[name], str
-            ):
+        for name in self._call_plan.variables:
+            if isinstance(ba.arguments[name], str):
                 if ds is not None:
                     try:
                         ba.arguments[name] = ds[ba.arguments[name]]
@@ -479,15 +737,11 @@ class Indicator(IndicatorRegistrar):
 
         Passing a dictionary of arguments will solve #1, but not #2.
         """
-        # First try to bind arguments to function.
-        try:
-            ba = signature(func).bind(**das)
-        except TypeError:
-            # If this fails, simply call the function using positional arguments
-            return func(*das.values())
-        else:
-            # Call the func using bound arguments
-            return func(*ba.args, **ba.kwargs)
+        # Whether the arguments can be bound to the function is resolved once per function and input names.
+        if _binds_by_name(func, tuple(das)):
+            return func(**das)
+        # If this fails, simply call the function using positional arguments
+        return func(*das.values())
 
     @classmethod
     def update_attrs(cls, ba, das, attrs, var_id=None, names=None):
@@ -520,6 +774,39 @@ class Indicator(IndicatorRegistrar):
         """
         args = ba.arguments
 
+        # The formatted attributes and the call signature only depend on the arguments' values, not on the inputs.
+        key = _attrs_key(cls, var_id, das, attrs, args, names)
+        cached = _attrs_cache.get(key) if key is not None else None
+        if cached is None:
+            cached = cls._format_call_attrs(args, das, attrs, var_id, names)
+            if key is not None:
+                _attrs_cache[key] = cached
+                if len(_attrs_cache) > _ATTRS_CACHE_SIZE:
+                    _attrs_cache.popitem(last=False)
+        out, callstr = cached
+        out = out.copy()
+
+        # Get history and cell method attributes from source data
+        attrs = defaultdict(str)
+        if names is None or "cell_methods" in names:
+            attrs["cell_methods"] = merge_attributes(
+                "cell_methods", new_line=" ", missing_str=None, **das
+            )
+            if "cell_methods" in out:
+                attrs["cell_methods"] += " " + out.pop("cell_methods")
+
+        attrs["xclim_history"] = update_history(
+            f"{var_id or cls.identifier}({callstr})",
+            new_name=out.get("var_name"),
+            **das,
+        )
+
+        attrs.update(out)
+        return attrs
+
+    @classmethod
+    def _format_call_attrs(cls, args, das, attrs, var_id=None, names=None):
+        """Format the attributes in English and in the metadata locales, and the call signature for the history."""
         out = cls.format(attrs, args)
         for locale in OPTIONS["metadata_locales"]:
             out.update(
@@ -541,31 +828,14 @@ class Indicator(IndicatorRegistrar):
         callstr = []
         for (k, v) in das.items():
             callstr.append(f"{k}=<array>")
-        for (k, v) in ba.arguments.items():
+        for (k, v) in args.items():
             if isinstance(v, (float, int, str)):
                 callstr.append(f"{k}={v!r}")  # repr so strings have ' '
             else:
                 callstr.append(
                     f"{k}={type(v)}"
                 )  # don't take chance of having unprintable values
-
-        # Get history and cell method attributes from source data
-        attrs = defaultdict(str)
-        if names is None or "cell_methods" in names:
-            attrs["cell_methods"] = merge_attributes(
-                "cell_methods", new_line=" ", missing_str=None, **das
-            )
-            if "cell_methods" in out:
-                attrs["cell_methods"] += " " + out.pop("cell_methods")
-
-        attrs["xclim_history"] = update_history(
-            f"{var_id or cls.identifier}({', '.join(callstr)})",
-            new_name=out.get("var_name"),
-            **das,
-        )
-
-        attrs.update(out)
-        return attrs
+        return out, ", ".join(callstr)
 
     @staticmethod
     def check_identifier(identifier: str) -> None:
@@ -663,24 +933,24 @@ class Indicator(IndicatorRegistrar):
         if args is None:
             return attrs
 
+        mba = {"indexer": "annual"}
+        # Add formatting {} around values to be able to replace them with _attrs_mapping using format.
+        for k, v in args.items():
+            if isinstance(v, dict):
+                if v:
+                    dk, dv = v.copy().popitem()
+                    if dk == "month":
+                        dv = "m{}".format(dv)
+                    mba[k] = dv
+            elif isinstance(v, units.Quantity):
+                mba[k] = "{:g~P}".format(v)
+            elif isinstance(v, (int, float)):
+                mba[k] = "{:g}".format(v)
+            else:
+                mba[k] = v
+
         out = {}
         for key, val in attrs.items():
-            mba = {"indexer": "annual"}
-            # Add formatting {} around values to be able to replace them with _attrs_mapping using format.
-            for k, v in args.items():
-                if isinstance(v, dict):
-                    if v:
-                        dk, dv = v.copy().popitem()
-                        if dk == "month":
-                            dv = "m{}".format(dv)
-                        mba[k] = dv
-                elif isinstance(v, units.Quantity):
-                    mba[k] = "{:g~P}".format(v)
-                elif isinstance(v, (int, float)):
-                    mba[k] = "{:g}".format(v)
-                else:
-                    mba[k] = v
-
             if callable(val):
                 val = val(**mba)
 
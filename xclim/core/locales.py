@@ -52,7 +52,10 @@ TRANSLATABLE_ATTRS
     List of attributes to consider translatable when generating locale dictionaries.
 """
 import json
+import os
 import warnings
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Sequence, Tuple, Union
 
@@ -90,6 +93,7 @@ def _valid_locales(locales):
     )
 
 
+@lru_cache(maxsize=64)
 def get_best_locale(locale: str):
     """Get the best fitting available locale.
 
@@ -117,6 +121,35 @@ def get_best_locale(locale: str):
     return None
 
 
+# Translations read from json files, by locale name for xclim's files and by path and modification time otherwise.
+_loaded_dicts = {}
+# Formatters of the locales given by name or by path.
+_formatters = {}
+
+
+def _get_local_dict(locale: Union[str, Sequence[str], Tuple[str, dict]]):
+    """Return all translated metadata for a given locale, reading json files only once.
+
+    Same as `get_local_dict`, but the returned dictionary is shared and must not be modified.
+    """
+    if isinstance(locale, str):
+        best = get_best_locale(locale)
+        if best is None:
+            raise UnavailableLocaleError(locale)
+        if best not in _loaded_dicts:
+            _loaded_dicts[best] = json.load(
+                pkg_resources.resource_stream("xclim.locales", f"{best}.json")
+            )
+        return best, _loaded_dicts[best]
+    if isinstance(locale[1], dict):
+        return locale
+    key = (str(locale[1]), os.stat(locale[1]).st_mtime)
+    if key not in _loaded_dicts:
+        with open(locale[1], encoding="utf-8") as locf:
+            _loaded_dicts[key] = json.load(locf)
+    return locale[0], _loaded_dicts[key]
+
+
 def get_local_dict(locale: Union[str, Sequence[str], Tuple[str, dict]]):
     """Return all translated metadata for a given locale.
 
@@ -139,19 +172,11 @@ def get_local_dict(locale: Union[str, Sequence[str], Tuple[str, dict]]):
     dict
         The available translations in this locale.
     """
-    if isinstance(locale, str):
-        locale = get_best_locale(locale)
-        if locale is None:
-            raise UnavailableLocaleError(locale)
-
-        return (
-            locale,
-            json.load(pkg_resources.resource_stream("xclim.locales", f"{locale}.json")),
-        )
-    if isinstance(locale[1], dict):
-        return locale
-    with open(locale[1], encoding="utf-8") as locf:
-        return locale[0], json.load(locf)
+    loc_name, loc_dict = _get_local_dict(locale)
+    if not isinstance(locale, str) and isinstance(locale[1], dict):
+        return loc_name, loc_dict
+    # Files are only read once, return a copy that can be modified.
+    return loc_name, deepcopy(loc_dict)
 
 
 def get_local_attrs(
@@ -195,7 +220,7 @@ def get_local_attrs(
 
     attrs = {}
     for locale in locales:
-        loc_name, loc_dict = get_local_dict(locale)
+        loc_name, loc_dict = _get_local_dict(locale)
         loc_name = f"_{loc_name}" if append_locale_name else ""
         local_attrs = loc_dict.get(indicator)
         if local_attrs is None:
@@ -219,7 +244,17 @@ def get_local_formatter(locale: Union[str, Sequence[str], Tuple[str, dict]]):
         a tuple of the language tag and a path to a json file defining translation
         of attributes.
     """
-    loc_name, loc_dict = get_local_dict(locale)
+    if isinstance(locale, str) or not isinstance(locale[1], dict):
+        # Locales given by name or by path, the formatter is created once.
+        loc_name, loc_dict = _get_local_dict(locale)
+        key = (loc_name, id(loc_dict))
+        if key not in _formatters:
+            _formatters[key] = _make_formatter(loc_dict)
+        return _formatters[key]
+    return _make_formatter(locale[1])
+
+
+def _make_formatter(loc_dict: dict) -> AttrFormatter:
     attrs_mapping = loc_dict["attrs_mapping"].copy()
     mods = attrs_mapping.pop("modifiers")
     return AttrFormatter(attrs_mapping, mods)
@@ -14,6 +14,7 @@ DATA_VALIDATION = "data_validation"
 CF_COMPLIANCE = "cf_compliance"
 CHECK_MISSING = "check_missing"
 MISSING_OPTIONS = "missing_options"
+PRECISION = "precision"
 
 MISSING_METHODS: Dict[str, Callable] = dict()
 
@@ -23,9 +24,11 @@ OPTIONS = {
     CF_COMPLIANCE: "warn",
     CHECK_MISSING: "any",
     MISSING_OPTIONS: {},
+    PRECISION: "auto",
 }
 
 _LOUDNESS_OPTIONS = frozenset(["log", "warn", "raise"])
+_PRECISION_OPTIONS = frozenset(["auto", "float32"])
 
 
 def _valid_missing_options(mopts):
@@ -48,6 +51,7 @@ _VALIDATORS = {
     CF_COMPLIANCE: _LOUDNESS_OPTIONS.__contains__,
     CHECK_MISSING: lambda meth: meth != "from_context" and meth in MISSING_METHODS,
     MISSING_OPTIONS: _valid_missing_options,
+    PRECISION: _PRECISION_OPTIONS.__contains__,
 }
 
 
@@ -135,6 +139,10 @@ class set_options:
       Default: ``'any'``
     - ``missing_options``: Dictionary of options to pass to the missing method. Keys must the name of
         missing method and values must be mappings from option names to values.
+    - ``precision``: The dtype of the floating point results of the indices helpers and indicators.
+        With 'auto', results keep the floating point dtype of the inputs and are float64 for other inputs.
+        With 'float32', all floating point results are float32.
+      Default: ``'auto'``
 
     Examples
     --------
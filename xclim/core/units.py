@@ -9,9 +9,11 @@ most unit handling methods.
 """
 import re
 import warnings
+from functools import lru_cache
 from inspect import signature
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 
+import numpy as np
 import pint.converters
 import pint.unit
 import xarray as xr
@@ -19,7 +21,7 @@ from boltons.funcutils import wraps
 from packaging import version
 
 from .options import datacheck
-from .utils import ValidationError
+from .utils import ValidationError, float_dtype
 
 __all__ = [
     "convert_units_to",
@@ -123,14 +125,6 @@ def units2pint(value: Union[xr.DataArray, str]) -> pint.unit.UnitDefinition:
       Units of the data array.
 
     """
-
-    def _transform(s):
-        """Convert a CF-unit string to a pint expression."""
-        if s == "%":
-            return "percent"
-
-        return re.subn(r"([a-zA-Z]+)\^?(-?\d)", r"\g<1>**\g<2>", s)[0]
-
     if isinstance(value, str):
         unit = value
     elif isinstance(value, xr.DataArray):
@@ -140,6 +134,20 @@ def units2pint(value: Union[xr.DataArray, str]) -> pint.unit.UnitDefinition:
     else:
         raise NotImplementedError(f"Value of type `{type(value)}` not supported.")
 
+    return _parse_units(unit)
+
+
+@lru_cache(maxsize=256)
+def _parse_units(unit: str) -> pint.unit.UnitDefinition:
+    """Parse a CF-unit string with pint, cached by unit string."""
+
+    def _transform(s):
+        """Convert a CF-unit string to a pint expression."""
+        if s == "%":
+            return "percent"
+
+        return re.subn(r"([a-zA-Z]+)\^?(-?\d)", r"\g<1>**\g<2>", s)[0]
+
     unit = unit.replace("%", "pct")
     if unit == "1":
         unit = ""
@@ -169,6 +177,19 @@ def pint2cfunits(value: Any) -> str:
     out : str
       Units following CF-Convention.
     """
+    if isinstance(value, units.Unit):
+        return _unit2cf(value)
+    return _pint2cfunits(value)
+
+
+@lru_cache(maxsize=256)
+def _unit2cf(value: Any) -> str:
+    """Return the CF-Convention string of a pint Unit, cached by unit."""
+    return _pint2cfunits(value)
+
+
+def _pint2cfunits(value: Any) -> str:
+    """Format a pint unit as a CF-Convention unit string."""
     # Print units using abbreviations (millimeter -> mm)
     s = f"{value:~}"
 
@@ -230,6 +251,43 @@ def str2pint(val: str):
         return units.Quantity(1, units2pint(val))
 
 
+@lru_cache(maxsize=256)
+def _conversion_factors(
+    fu: Any, tu: Any, context: str
+) -> Optional[Tuple[float, float]]:
+    """Return the scale and offset converting values from units `fu` to units `tu`, cached.
+
+    Values in `tu` are ``scale * values + offset``. Returns None if the conversion is not affine or if pint can't
+    compute it that way, in which case `units.convert` must be used.
+    """
+    try:
+        with units.context(context):
+            offset = units.Quantity(0, fu).to(tu).m
+            if offset == 0:
+                # Same factor as the one applied by pint.
+                scale = units.Quantity(1, fu).to(tu).m
+            else:
+                # Offset units (temperatures), the scale is the ratio of the multiplicative parts.
+                ffu, bfu = units.get_base_units(fu)
+                ftu, btu = units.get_base_units(tu)
+                if ffu is None or ftu is None or bfu != btu:
+                    return None
+                scale = ffu / ftu
+            two = units.Quantity(2, fu).to(tu).m
+    except (pint.DimensionalityError, pint.OffsetUnitCalculusError):
+        return None
+
+    if not np.isclose(two, 2 * scale + offset, rtol=1e-12, atol=0):
+        return None
+    return float(scale), float(offset)
+
+
+@lru_cache(maxsize=1024)
+def _convert_str(source: str, tu: Any) -> float:
+    """Convert a quantity given as a string to units `tu`, cached by string and units."""
+    return str2pint(source).to(tu).m
+
+
 def convert_units_to(
     source: Union[str, xr.DataArray, Any],
     target: Union[str, xr.DataArray, Any],
@@ -260,9 +318,8 @@ def convert_units_to(
         raise NotImplementedError
 
     if isinstance(source, str):
-        q = str2pint(source)
         # Return magnitude of converted quantity. This is going to fail if units are not compatible.
-        return q.to(tu).m
+        return _convert_str(source, tu)
 
     if isinstance(source, units.Quantity):
         return source.to(tu).m
@@ -273,18 +330,36 @@ def convert_units_to(
 
         if fu == tu:
             # The units are the same, but the symbol may not be.
-            source.attrs["units"] = tu_u
-            return source
-
-        with units.context(context or "none"):
-            out = xr.DataArray(
-                data=units.convert(source.data, fu, tu),
-                coords=source.coords,
-                attrs=source.attrs,
-                name=source.name,
-            )
-            out.attrs["units"] = tu_u
-            return out
+            factors = (1, 0)
+        else:
+            factors = _conversion_factors(fu, tu, context or "none")
+
+        if factors is None:
+            with units.context(context or "none"):
+                data = units.convert(source.data, fu, tu)
+            dtype = float_dtype(source.data)
+            if data.dtype != dtype:
+                data = data.astype(dtype)
+        else:
+            # A single lazy affine operation, the factors are only computed once per pair of units.
+            # Nothing is computed for identity conversions.
+            scale, offset = factors
+            data = source.data
+            if scale != 1 or offset != 0:
+                # Keep the precision of the input, float32 stays float32.
+                dtype = float_dtype(data)
+                if data.dtype != dtype:
+                    data = data.astype(dtype)
+                scale, offset = dtype.type(scale), dtype.type(offset)
+            if scale != 1:
+                data = data * scale
+            if offset != 0:
+                data = data + offset
+
+        # Shallow copy, the coordinates are shared with the source and its attributes are left untouched.
+        out = source.copy(deep=False, data=data)
+        out.attrs["units"] = tu_u
+        return out
 
     # TODO remove backwards compatibility of int/float thresholds after v1.0 release
     if isinstance(source, (float, int)):
@@ -302,6 +377,12 @@ def convert_units_to(
     raise NotImplementedError(f"Source of type `{type(source)}` is not supported.")
 
 
+@lru_cache(maxsize=64)
+def _get_dimensionality(dim: str):
+    """Return the pint dimensionality of a dimension string, cached."""
+    return units.get_dimensionality(dim)
+
+
 @datacheck
 def check_units(val: Optional[Union[str, int, float]], dim: Optional[str]) -> None:
     if dim is None or val is None:
@@ -319,7 +400,7 @@ def check_units(val: Optional[Union[str, int, float]], dim: Optional[str]) -> No
     if isinstance(val, (int, float)):
         return
 
-    expected = units.get_dimensionality(dim.replace("dimensionless", ""))
+    expected = _get_dimensionality(dim.replace("dimensionless", ""))
     if isinstance(val, str):
         val_dim = str2pint(val).dimensionality
     else:  # a DataArray
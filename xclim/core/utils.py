@@ -96,6 +96,29 @@ class MissingVariableError(ValueError):
     """xclim Variable missing from dataset error."""
 
 
+def float_dtype(*arrays) -> np.dtype:
+    """Return the dtype of floating point results computed from `arrays`, according to the `precision` option.
+
+    With precision 'float32', this is always float32. With 'auto', the floating point dtype of the arrays is kept and
+    float64 is used for other dtypes or when no arrays are given.
+
+    Parameters
+    ----------
+    arrays : Union[xr.DataArray, np.ndarray]
+      Input arrays.
+
+    Returns
+    -------
+    np.dtype
+    """
+    from .options import OPTIONS, PRECISION
+
+    if OPTIONS[PRECISION] == "float32":
+        return np.dtype(np.float32)
+    floats = [arr.dtype for arr in arrays if arr.dtype.kind == "f"]
+    return np.result_type(*floats) if floats else np.dtype(np.float64)
+
+
 def ensure_chunk_size(da: xr.DataArray, max_iter: int = 10, **minchunks: int):
     """Ensure that the input dataarray has chunks of at least the given size.
 
@@ -1,10 +1,14 @@
 """Ensembles creation and statistics."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, reduce
 from pathlib import Path
 from typing import List, Optional, Sequence, Union
 
+import dask.array as dsk
 import numpy as np
 import xarray as xr
+from xarray.core import dtypes
 
 from xclim.core.calendar import convert_calendar, get_calendar
 from xclim.core.formatting import update_history
@@ -58,6 +62,14 @@ def create_ensemble(
     Input netcdf files require equal spatial dimension size (e.g. lon, lat dimensions).
     If input data contains multiple cftime calendar types they must be at monthly or coarser frequency.
 
+    The members are opened and their time coordinate decoded in parallel threads. The time axis of the ensemble
+    is computed once, as the union of the time axes of all members, and each member is placed on it by
+    index arithmetic. When the inputs are dask-backed (the default when opening files), the data itself is never
+    loaded: the ensemble is a lazy stack of the members along `realization`. Indexes other than `time` are
+    taken from the first member: members with the same labels in a different order are reindexed like the first
+    one, and a ValueError is raised if the labels differ. Other coordinates that differ between members are
+    stacked along `realization`.
+
     Examples
     --------
     >>> from xclim.ensembles import create_ensemble
@@ -77,13 +89,69 @@ def create_ensemble(
         datasets, mf_flag, resample_freq, calendar=calendar, **xr_kwargs
     )
 
-    dim = xr.IndexVariable("realization", np.arange(len(ds)), attrs={"axis": "E"})
+    # The common time axis is computed once and members are placed on it by their positions.
+    positions = [None] * len(ds)
+    time = None
+    if any("time" in d.dims for d in ds):
+        time = reduce(
+            lambda a, b: a.union(b), [d.indexes["time"] for d in ds if "time" in d.dims]
+        )
+        positions = [
+            time.get_indexer(d.indexes["time"]) if "time" in d.dims else None
+            for d in ds
+        ]
+
+    ref = ds[0]
+    # Members are stacked positionally, so their other indexes must be the ones of the first member.
+    for i, d in enumerate(ds[1:], 1):
+        for dim, index in ref.indexes.items():
+            if dim == "time" or dim not in d.indexes or d.indexes[dim].equals(index):
+                continue
+            if d.indexes[dim].sort_values().equals(index.sort_values()):
+                ds[i] = d = d.reindex({dim: index})
+            else:
+                raise ValueError(
+                    f"The '{dim}' coordinate of member {i} differs from the one of the first member."
+                )
 
-    ens = xr.concat(ds, dim)
-    for vname, var in ds[0].variables.items():
-        ens[vname].attrs.update(**var.attrs)
-    ens.attrs.update(**ds[0].attrs)
+    size = 0 if time is None else time.size
+    coords = {
+        "realization": xr.IndexVariable(
+            "realization", np.arange(len(ds)), attrs={"axis": "E"}
+        )
+    }
+    if time is not None:
+        coords["time"] = xr.IndexVariable("time", time, attrs=ref.time.attrs)
+    for name, crd in ref.coords.items():
+        if name in ref.indexes:
+            continue
+        if any(name not in d.coords for d in ds):
+            raise ValueError(
+                f"Coordinate {name} is not present in all members of the ensemble."
+            )
+        members = [
+            _ens_place(d[name].transpose(*crd.dims).variable, pos, size)
+            for d, pos in zip(ds, positions)
+        ]
+        if all(m.equals(members[0]) for m in members[1:]):
+            coords[name] = members[0]
+        else:
+            # Like xr.concat, coordinates that differ between members are stacked along `realization`.
+            coords[name] = _ens_stack(members, crd)
+
+    data_vars = {}
+    for vname, var in ref.data_vars.items():
+        if any(vname not in d.data_vars for d in ds):
+            raise ValueError(
+                f"Variable {vname} is not present in all members of the ensemble."
+            )
+        members = [
+            _ens_place(d[vname].transpose(*var.dims).variable, pos, size)
+            for d, pos in zip(ds, positions)
+        ]
+        data_vars[vname] = _ens_stack(members, var)
 
+    ens = xr.Dataset(data_vars=data_vars, coords=coords, attrs=ref.attrs)
     return ens
 
 
@@ -138,11 +206,126 @@ def ensemble_mean_std_max_min(ens: xr.Dataset) -> xr.Dataset:
     return ds_out
 
 
+def ensemble_stats(
+    ens: Union[xr.Dataset, xr.DataArray],
+    stats: Sequence[str] = ("mean", "stdev", "min", "max"),
+    values: Optional[Sequence[int]] = None,
+    method: str = "interpolated",
+    sketch_size: int = 100,
+) -> xr.Dataset:
+    """Calculate many ensemble statistics in a single pass over the data.
+
+    Returns a Dataset containing the requested statistics and percentiles for input climate simulations.
+    Each chunk of the ensemble is read only once, whatever the number of statistics computed.
+
+    Parameters
+    ----------
+    ens: Union[xr.Dataset, xr.DataArray]
+      Ensemble dataset or dataarray (see xclim.ensembles.create_ensemble).
+    stats : Sequence[str]
+      Statistics to compute, any of 'mean', 'stdev', 'min', 'max', 'count' and 'positive'.
+      'count' is the number of valid (non-NaN) members and 'positive' the number of members with positive values.
+      When `ens` holds the changes between two periods, these two are the inputs of
+      :py:func:`xclim.ensembles.change_significance` with `test=None`.
+    values : Optional[Sequence[int]]
+      Percentile values to calculate. Default (None) is not to compute any.
+    method : {'interpolated', 'exact', 'sketch'}
+      How the percentiles are estimated, see :py:func:`ensemble_percentiles`.
+    sketch_size : int
+      Number of points in the summary of the members when `method='sketch'`, see :py:func:`ensemble_percentiles`.
+
+    Returns
+    -------
+    xr.Dataset
+      Dataset with data variables of ensemble statistics, named as in :py:func:`ensemble_mean_std_max_min` and
+      :py:func:`ensemble_percentiles` (`{var}_{stat}` and `{var}_p{value}`).
+
+    Examples
+    --------
+    >>> from xclim.ensembles import create_ensemble, ensemble_stats
+
+    Create the ensemble dataset:
+
+    >>> ens = create_ensemble(temperature_datasets)
+
+    Calculate the ensemble mean, standard-deviation and 10th, 50th and 90th percentiles in one pass:
+
+    >>> ens_stats = ensemble_stats(ens, stats=['mean', 'stdev'], values=(10, 50, 90))
+
+    Notes
+    -----
+    As in :py:func:`ensemble_percentiles`, the data is not rechunked along 'realization'. The moments of each chunk
+    (count, mean and sum of squared deviations) are merged with the parallel algorithm of Chan et al. (1979),
+    while the sorted members are merged for the percentiles.
+    """
+    unknown = set(stats) - set(_ens_stats_names)
+    if unknown:
+        raise ValueError(
+            f"Statistics {unknown} are not in {', '.join(_ens_stats_names)}."
+        )
+    values = values or []
+    if method not in ["interpolated", "exact", "sketch"]:
+        raise ValueError(
+            f"Method {method} is not one of 'interpolated', 'exact' or 'sketch'."
+        )
+
+    if isinstance(ens, xr.Dataset):
+        out = xr.merge(
+            [
+                ensemble_stats(
+                    da, stats, values, method=method, sketch_size=sketch_size
+                )
+                for da in ens.data_vars.values()
+                if "realization" in da.dims
+            ]
+        )
+        out.attrs.update(ens.attrs)
+        out.attrs["xclim_history"] = update_history(
+            f"Computation of statistics on {ens.realization.size} ensemble members.",
+            ens,
+        )
+        return out
+
+    out = xr.apply_ufunc(
+        _ens_stats,
+        ens,
+        input_core_dims=[["realization"]],
+        output_core_dims=[["stats"]],
+        keep_attrs=True,
+        kwargs=dict(
+            stats=list(stats), p=list(values), method=method, sketch_size=sketch_size
+        ),
+        dask="allowed",
+    )
+    names = list(stats) + [f"p{int(v):02d}" for v in values]
+    out = out.assign_coords(stats=xr.DataArray(names, dims=("stats",)))
+    out = out.to_dataset(dim="stats")
+
+    for stat, v in zip(names, list(stats) + list(values)):
+        out[stat].attrs.update(ens.attrs)
+        if stat in stats:
+            desc = f" : {stat} of ensemble"
+        else:
+            desc = f" {v}th percentile of ensemble."
+        out[stat].attrs["description"] = out[stat].attrs.get("description", "") + desc
+        if stat in ["count", "positive"]:
+            out[stat].attrs["units"] = ""
+    out = out.rename({stat: f"{ens.name}_{stat}" for stat in names})
+
+    out.attrs["xclim_history"] = update_history(
+        f"Computation of statistics on {ens.realization.size} ensemble members.",
+        ens,
+    )
+    return out
+
+
 def ensemble_percentiles(
     ens: Union[xr.Dataset, xr.DataArray],
     values: Sequence[int] = (10, 50, 90),
     keep_chunk_size: Optional[bool] = None,
     split: bool = True,
+    method: str = "interpolated",
+    sketch_size: int = 100,
 ) -> xr.Dataset:
     """Calculate ensemble statistics between a results from an ensemble of climate simulations.
 
@@ -155,13 +338,24 @@ def ensemble_percentiles(
     values : Tuple[int, int, int]
       Percentile values to calculate. Default: (10, 50, 90).
     keep_chunk_size : Optional[bool]
-      For ensembles using dask arrays, all chunks along the 'realization' axis are merged.
-      If True, the dataset is rechunked along the dimension with the largest chunks, so that the chunks keep the same size (approx)
-      If False, no shrinking is performed, resulting in much larger chunks
-      If not defined, the function decides which is best
+      For ensembles using dask arrays with many chunks along the 'realization' axis.
+      If None (default), the data is not rechunked and the percentiles are computed through
+      a tree reduction across the 'realization' chunks (see notes).
+      If given, all chunks along the 'realization' axis are first merged (legacy behaviour). If True,
+      the dataset is also rechunked along the dimension with the largest chunks, so that the chunks keep
+      the same size (approx). If False, no shrinking is performed, resulting in much larger chunks.
+      Only valid with `method='interpolated'`.
     split : bool
       Whether to split each percentile into a new variable of concatenate the ouput along a new
       "percentiles" dimension.
+    method : {'interpolated', 'exact', 'sketch'}
+      How the percentiles are estimated from the members. 'interpolated' (default) linearly interpolates
+      between the two closest ranks, as `numpy.percentile` does. 'exact' returns the member value at the
+      nearest rank, the output is always one of the members. 'sketch' computes an approximation of the
+      'interpolated' percentiles from a fixed-size summary of the members, see notes.
+    sketch_size : int
+      Number of points in the summary of the members when `method='sketch'`.
+      The results are exact when the number of members is smaller or equal to this value.
 
     Returns
     -------
@@ -188,12 +382,41 @@ def ensemble_percentiles(
     If the original array has many small chunks, it might be more efficient to do:
 
     >>> ens_percs = ensemble_percentiles(ens, keep_chunk_size=False)
+
+    For very large ensembles split across many chunks, an approximation can be computed with bounded memory:
+
+    >>> ens_percs = ensemble_percentiles(ens, method="sketch", sketch_size=50)
+
+    Notes
+    -----
+    When the 'realization' dimension of a dask-backed ensemble is split in more than one chunk, the percentiles
+    are computed without rechunking: each chunk is first sorted (or summarized) along 'realization', then these
+    sorted fragments are merged two by two by the workers, as in any dask reduction. This avoids the all-to-all
+    shuffle of a global rechunk, which is expensive when each member comes from a different file.
+
+    With `method='sketch'`, each fragment is compressed to `sketch_size` weighted points at evenly spaced ranks
+    before being merged, so that the memory needed per grid cell is bounded whatever the number of members. The
+    error on the percentile rank is then of the order of `1 / sketch_size`.
     """
+    if method not in ["interpolated", "exact", "sketch"]:
+        raise ValueError(
+            f"Method {method} is not one of 'interpolated', 'exact' or 'sketch'."
+        )
+    if keep_chunk_size is not None and method != "interpolated":
+        raise ValueError(
+            "Argument `keep_chunk_size` is only valid with method 'interpolated'."
+        )
+
     if isinstance(ens, xr.Dataset):
         out = xr.merge(
             [
                 ensemble_percentiles(
-                    da, values, keep_chunk_size=keep_chunk_size, split=split
+                    da,
+                    values,
+                    keep_chunk_size=keep_chunk_size,
+                    split=split,
+                    method=method,
+                    sketch_size=sketch_size,
                 )
                 for da in ens.data_vars.values()
                 if "realization" in da.dims
@@ -207,14 +430,12 @@ def ensemble_percentiles(
 
         return out
 
-    # Percentile calculation forbids any chunks along realization
-    if ens.chunks and len(ens.chunks[ens.get_axis_num("realization")]) > 1:
-        if keep_chunk_size is None:
-            # Enable smart rechunking is chunksize exceed 2E8 elements after merging along realization
-            keep_chunk_size = (
-                np.prod(ens.isel(realization=0).data.chunksize) * ens.realization.size
-                > 2e8
-            )
+    if (
+        keep_chunk_size is not None
+        and ens.chunks
+        and len(ens.chunks[ens.get_axis_num("realization")]) > 1
+    ):
+        # Legacy behaviour : merge all chunks along realization
         if keep_chunk_size:
             # Smart rechunk on dimension where chunks are the largest
             chkDim, chks = max(
@@ -230,15 +451,13 @@ def ensemble_percentiles(
             ens = ens.chunk({"realization": -1})
 
     out = xr.apply_ufunc(
-        _calc_perc,
+        _ens_perc,
         ens,
         input_core_dims=[["realization"]],
         output_core_dims=[["percentiles"]],
         keep_attrs=True,
-        kwargs=dict(p=values),
-        dask="parallelized",
-        output_dtypes=[ens.dtype],
-        output_sizes={"percentiles": len(values)},
+        kwargs=dict(p=values, method=method, sketch_size=sketch_size),
+        dask="allowed",
     )
 
     out = out.assign_coords(
@@ -270,7 +489,7 @@ def _ens_align_datasets(
     calendar: str = "default",
     **xr_kwargs,
 ) -> List[xr.Dataset]:
-    """Create a list of aligned xarray Datasets for ensemble Dataset creation.
+    """Open the members of an ensemble in parallel and convert their time coordinate to a common calendar.
 
     Parameters
     ----------
@@ -292,12 +511,13 @@ def _ens_align_datasets(
     Returns
     -------
     List[xr.Dataset]
+      The members, with their time coordinate decoded and converted. They are not aligned on a common time axis.
     """
     xr_kwargs.setdefault("chunks", "auto")
     xr_kwargs.setdefault("decode_times", False)
 
-    ds_all = []
-    for i, n in enumerate(datasets):
+    def _align(i_n):
+        i, n = i_n
         logging.info(f"Accessing {n} of {len(datasets)}")
         if mf_flag:
             ds = xr.open_mfdataset(n, combine="by_coords", **xr_kwargs)
@@ -310,7 +530,8 @@ def _ens_align_datasets(
                 ds = xr.open_dataset(n, **xr_kwargs)
 
         if "time" in ds.coords:
-            time = xr.decode_cf(ds).time
+            # Only the time coordinate is decoded, the other variables are not touched.
+            time = xr.decode_cf(ds[["time"]]).time
 
             if resample_freq is not None:
                 counts = time.resample(time=resample_freq).count()
@@ -320,18 +541,72 @@ def _ens_align_datasets(
                     )
                 time = counts.time
 
-            ds["time"] = time
-
+            # The calendar conversion is computed on the positions only, the data is then indexed accordingly.
             cal = get_calendar(time)
-            ds = convert_calendar(
-                ds,
+            pos = convert_calendar(
+                xr.DataArray(
+                    np.arange(time.size), dims=("time",), coords={"time": time}
+                ),
                 calendar,
                 align_on="date" if "360_day" in [cal, calendar] else None,
             )
+            if pos.size != time.size:
+                ds = ds.isel(time=pos.values.astype(int))
+            ds = ds.assign_coords(time=pos.time)
+
+        return ds
 
-        ds_all.append(ds)
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(_align, enumerate(datasets)))
 
-    return ds_all
+
+def _ens_stack(members: Sequence[xr.Variable], var: xr.Variable) -> xr.Variable:
+    """Stack the members' variables along a new leading `realization` dimension, keeping the attributes of `var`."""
+    stack = (
+        dsk.stack if any(isinstance(m.data, dsk.Array) for m in members) else np.stack
+    )
+    return xr.Variable(
+        ("realization",) + members[0].dims,
+        stack([m.data for m in members], axis=0),
+        attrs=var.attrs,
+        encoding=var.encoding,
+    )
+
+
+def _ens_place(var: xr.Variable, pos: Optional[np.ndarray], size: int) -> xr.Variable:
+    """Place a member's variable at positions `pos` of a time axis of length `size`, filling the gaps.
+
+    If the positions are contiguous, the data is padded with missing values, otherwise it is indexed.
+    Dask arrays stay lazy.
+    """
+    if pos is None or "time" not in var.dims:
+        return var
+    axis = var.get_axis_num("time")
+    data = var.data
+    if pos.size == size and (pos == np.arange(size)).all():
+        return var
+
+    dtype, fill_value = dtypes.maybe_promote(var.dtype)
+    data = data.astype(dtype)
+    if (np.diff(pos) == 1).all():
+        pads = []
+        for n in [pos[0], size - pos[-1] - 1]:
+            shape = data.shape[:axis] + (n,) + data.shape[axis + 1 :]
+            if isinstance(data, dsk.Array):
+                chunks = data.chunks[:axis] + ((n,),) + data.chunks[axis + 1 :]
+                pads.append(dsk.full(shape, fill_value, dtype=dtype, chunks=chunks))
+            else:
+                pads.append(np.full(shape, fill_value, dtype=dtype))
+        concat = dsk.concatenate if isinstance(data, dsk.Array) else np.concatenate
+        data = concat([pads[0], data, pads[1]], axis=axis)
+    else:
+        indexer = np.full(size, -1)
+        indexer[pos] = np.arange(pos.size)
+        mask = (indexer == -1).reshape((-1,) + (1,) * (data.ndim - axis - 1))
+        data = data[(slice(None),) * axis + (np.where(indexer == -1, 0, indexer),)]
+        where = dsk.where if isinstance(data, dsk.Array) else np.where
+        data = where(mask, fill_value, data)
+    return xr.Variable(var.dims, data, attrs=var.attrs, encoding=var.encoding)
 
 
 def _calc_perc(arr, p=[50]):
@@ -361,3 +636,324 @@ def _calc_perc(arr, p=[50]):
             np.nanpercentile(arr[nans], p, axis=-1), 0, -1
         ).ravel()
     return out
+
+
+def _ens_perc(arr, p=[50], method="interpolated", sketch_size=100):
+    """Ufunc-like computing percentiles over the last axis of the array, without rechunking it if it is a dask array.
+
+    Parameters
+    ----------
+    arr : Union[np.array, dask.array.Array]
+        Percentiles are computed over the last axis.
+    p : Sequence[float]
+        Percentiles to compute, between 0 and 100.
+    method : {'interpolated', 'exact', 'sketch'}
+        See :py:func:`ensemble_percentiles`.
+    sketch_size : int
+        Size of the summaries when `method` is 'sketch'.
+
+    Returns
+    -------
+    Union[np.array, dask.array.Array]
+        The percentiles along the last axis.
+    """
+    if method == "exact" or arr.dtype.kind == "f":
+        dtype = arr.dtype
+    else:
+        dtype = np.dtype(float)
+
+    if isinstance(arr, dsk.Array):
+        if len(arr.chunks[-1]) == 1:
+            return arr.map_blocks(
+                _ens_perc,
+                p=p,
+                method=method,
+                sketch_size=sketch_size,
+                chunks=arr.chunks[:-1] + ((len(p),),),
+                dtype=dtype,
+            )
+        # Tree reduction of sorted fragments (or of their summaries) along the realization axis
+        return dsk.reduction(
+            arr,
+            partial(_perc_chunk, method=method, sketch_size=sketch_size),
+            partial(_perc_agg, p=p, method=method, sketch_size=sketch_size),
+            combine=partial(_perc_combine, method=method, sketch_size=sketch_size),
+            axis=-1,
+            keepdims=True,
+            dtype=dtype,
+            concatenate=False,
+            output_size=len(p),
+            meta=np.empty((0,) * arr.ndim, dtype=dtype),
+        )
+
+    if method == "interpolated":
+        return _calc_perc(arr, p=p)
+    return _perc_agg(
+        _perc_chunk(arr, method=method, sketch_size=sketch_size),
+        p=p,
+        method=method,
+        sketch_size=sketch_size,
+        dtype=dtype,
+    )
+
+
+def _perc_chunk(
+    arr,
+    axis=None,
+    keepdims=True,
+    method="interpolated",
+    sketch_size=100,
+    computing_meta=False,
+):
+    """Sort a fragment of the ensemble along the last axis, summarizing it if the method is 'sketch'.
+
+    NaNs are sorted last. With the 'sketch' method, a dictionary of the sorted values and their weights is returned.
+    """
+    if computing_meta:
+        return arr
+    srt = np.sort(arr, axis=-1)
+    if method != "sketch":
+        return srt
+    wgts = (~np.isnan(srt)).astype(float)
+    if srt.shape[-1] > sketch_size:
+        return _sketch_compress(srt, wgts, sketch_size)
+    return {"vals": srt, "wgts": wgts}
+
+
+def _perc_combine(
+    parts, axis=None, keepdims=True, method="interpolated", sketch_size=100
+):
+    """Merge sorted fragments (or summaries) of the ensemble along the last axis."""
+    if not isinstance(parts, list):
+        parts = [parts]
+    if method != "sketch":
+        # A stable sort (timsort) only merges the already sorted runs.
+        return np.sort(np.concatenate(parts, axis=-1), axis=-1, kind="stable")
+
+    vals = np.concatenate([part["vals"] for part in parts], axis=-1)
+    wgts = np.concatenate([part["wgts"] for part in parts], axis=-1)
+    order = np.argsort(vals, axis=-1, kind="stable")
+    vals = np.take_along_axis(vals, order, axis=-1)
+    wgts = np.take_along_axis(wgts, order, axis=-1)
+    if vals.shape[-1] > sketch_size:
+        return _sketch_compress(vals, wgts, sketch_size)
+    return {"vals": vals, "wgts": wgts}
+
+
+def _perc_agg(
+    parts,
+    axis=None,
+    keepdims=True,
+    p=[50],
+    method="interpolated",
+    sketch_size=100,
+    dtype=None,
+):
+    """Compute the percentiles from sorted fragments (or summaries) of the ensemble, along the last axis."""
+    merged = _perc_combine(parts, method=method, sketch_size=sketch_size)
+    q = np.asarray(p, dtype=float) / 100
+
+    if method == "sketch":
+        vals, wgts = merged["vals"], merged["wgts"]
+        pos = q * (wgts.sum(axis=-1, keepdims=True) - 1)
+        return _weighted_interp(vals, wgts, pos).astype(dtype or float, copy=False)
+
+    # Here, `merged` holds all the values of each cell, sorted with NaNs last.
+    nval = np.sum(~np.isnan(merged), axis=-1, keepdims=True)
+    last = np.maximum(nval - 1, 0)
+    pos = q * (nval - 1)
+    if method == "exact":
+        out = np.take_along_axis(
+            merged, np.clip(np.around(pos), 0, last).astype(int), -1
+        )
+    else:
+        lo = np.clip(np.floor(pos), 0, last).astype(int)
+        hi = np.minimum(lo + 1, last)
+        out = _lerp(
+            np.take_along_axis(merged, lo, -1),
+            np.take_along_axis(merged, hi, -1),
+            pos - lo,
+        )
+    if np.any(nval == 0):
+        out = np.where(nval > 0, out, np.nan)
+    return out.astype(dtype or out.dtype, copy=False)
+
+
+def _lerp(a, b, t):
+    """Linear interpolation between `a` and `b` at `t` in [0, 1], computed as in `numpy.percentile`."""
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+def _weighted_interp(vals, wgts, pos):
+    """Interpolate sorted weighted samples at fractional ranks along the last axis.
+
+    Each point of weight `w` spans `w` ranks, the point being centered in that span. For unit weights,
+    this is the same as interpolating the values at indices `pos`. Null weights (NaN values) must be sorted last.
+    """
+    shape = pos.shape
+    vals = vals.reshape(-1, vals.shape[-1])
+    wgts = wgts.reshape(-1, wgts.shape[-1])
+    pos = pos.reshape(-1, shape[-1])
+    nrows, npts = vals.shape
+
+    tot = wgts.sum(axis=-1, keepdims=True)
+    nval = (wgts > 0).sum(axis=-1, keepdims=True)
+    ctr = np.where(wgts > 0, np.cumsum(wgts, axis=-1) - wgts / 2 - 0.5, tot)
+
+    # Vectorized searchsorted : rows are offset so the flattened centers stay sorted.
+    offset = np.arange(nrows)[:, np.newaxis] * (tot.max(initial=0) + 4)
+    j = np.searchsorted((ctr + offset).ravel(), (pos + offset).ravel(), side="right")
+    j = j.reshape(pos.shape) - np.arange(nrows)[:, np.newaxis] * npts
+
+    last = np.maximum(nval - 1, 0)
+    lo = np.clip(j - 1, 0, last)
+    hi = np.clip(j, 0, last)
+    c_lo = np.take_along_axis(ctr, lo, -1)
+    c_hi = np.take_along_axis(ctr, hi, -1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.clip(np.where(c_hi > c_lo, (pos - c_lo) / (c_hi - c_lo), 0), 0, 1)
+    out = _lerp(np.take_along_axis(vals, lo, -1), np.take_along_axis(vals, hi, -1), t)
+    out = np.where(nval > 0, out, np.nan)
+    return out.reshape(shape)
+
+
+def _sketch_compress(vals, wgts, size):
+    """Summarize sorted weighted samples along the last axis with `size` points of equal weights at evenly spaced ranks."""
+    tot = wgts.sum(axis=-1, keepdims=True)
+    pos = (np.arange(size) + 0.5) * tot / size - 0.5
+    return {
+        "vals": _weighted_interp(vals, wgts, pos),
+        "wgts": np.broadcast_to(tot / size, pos.shape).copy(),
+    }
+
+
+_ens_stats_names = ["mean", "stdev", "min", "max", "count", "positive"]
+
+
+def _ens_stats(arr, stats=[], p=[], method="interpolated", sketch_size=100):
+    """Ufunc-like computing statistics and percentiles over the last axis of the array, in a single pass.
+
+    Parameters
+    ----------
+    arr : Union[np.array, dask.array.Array]
+        Statistics are computed over the last axis.
+    stats : Sequence[str]
+        Names of the statistics to compute, see :py:func:`ensemble_stats`.
+    p : Sequence[float]
+        Percentiles to compute, between 0 and 100.
+    method : {'interpolated', 'exact', 'sketch'}
+        See :py:func:`ensemble_percentiles`.
+    sketch_size : int
+        Size of the summaries when `method` is 'sketch'.
+
+    Returns
+    -------
+    Union[np.array, dask.array.Array]
+        The statistics, then the percentiles, along the last axis.
+    """
+    dtype = np.result_type(arr.dtype, np.float32)
+    kws = dict(stats=stats, p=p, method=method, sketch_size=sketch_size)
+
+    if isinstance(arr, dsk.Array):
+        return dsk.reduction(
+            arr,
+            partial(_stats_chunk, **kws),
+            partial(_stats_agg, **kws),
+            combine=partial(_stats_combine, **kws),
+            axis=-1,
+            keepdims=True,
+            dtype=dtype,
+            concatenate=False,
+            output_size=len(stats) + len(p),
+            meta=np.empty((0,) * arr.ndim, dtype=dtype),
+        )
+    return _stats_agg(_stats_chunk(arr, **kws), dtype=dtype, **kws)
+
+
+def _stats_chunk(arr, axis=None, keepdims=True, computing_meta=False, **kws):
+    """Compute the moments, extrema and sorted values of a fragment of the ensemble along the last axis."""
+    if computing_meta:
+        return arr
+    n = np.sum(~np.isnan(arr), axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(arr, axis=-1, keepdims=True) / n
+    part = {
+        "n": n,
+        "mean": mean,
+        "m2": np.nansum((arr - mean) ** 2, axis=-1, keepdims=True),
+        "min": np.fmin.reduce(arr, axis=-1, keepdims=True),
+        "max": np.fmax.reduce(arr, axis=-1, keepdims=True),
+        "positive": np.sum(arr > 0, axis=-1, keepdims=True),
+    }
+    if kws["p"]:
+        part["perc"] = _perc_chunk(
+            arr, method=kws["method"], sketch_size=kws["sketch_size"]
+        )
+    return part
+
+
+def _stats_combine(parts, axis=None, keepdims=True, **kws):
+    """Merge the moments, extrema and sorted values of fragments of the ensemble."""
+    if not isinstance(parts, list):
+        return parts
+    out = dict(parts[0])
+    for part in parts[1:]:
+        n = out["n"] + part["n"]
+        delta = part["mean"] - out["mean"]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Chan et al. parallel algorithm, with care for empty fragments (NaN means).
+            out["mean"] = np.where(
+                part["n"] == 0,
+                out["mean"],
+                np.where(
+                    out["n"] == 0, part["mean"], out["mean"] + delta * part["n"] / n
+                ),
+            )
+            out["m2"] = (
+                out["m2"]
+                + part["m2"]
+                + np.where(
+                    (out["n"] == 0) | (part["n"] == 0),
+                    0,
+                    delta ** 2 * out["n"] * part["n"] / n,
+                )
+            )
+        out["n"] = n
+        out["min"] = np.fmin(out["min"], part["min"])
+        out["max"] = np.fmax(out["max"], part["max"])
+        out["positive"] = out["positive"] + part["positive"]
+    if kws["p"]:
+        out["perc"] = _perc_combine(
+            [part["perc"] for part in parts],
+            method=kws["method"],
+            sketch_size=kws["sketch_size"],
+        )
+    return out
+
+
+def _stats_agg(parts, axis=None, keepdims=True, dtype=None, **kws):
+    """Compute the statistics and percentiles from fragments of the ensemble, stacked along the last axis."""
+    part = _stats_combine(parts, **kws)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(part["m2"] / part["n"])
+    outs = {
+        "mean": part["mean"],
+        "stdev": std,
+        "min": part["min"],
+        "max": part["max"],
+        "count": part["n"],
+        "positive": part["positive"],
+    }
+    out = [outs[stat].astype(dtype or float) for stat in kws["stats"]]
+    if kws["p"]:
+        out.append(
+            _perc_agg(
+                part["perc"],
+                p=kws["p"],
+                method=kws["method"],
+                sketch_size=kws["sketch_size"],
+                dtype=dtype,
+            )
+        )
+    return np.concatenate(out, axis=-1)
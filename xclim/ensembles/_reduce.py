@@ -13,8 +13,10 @@ from typing import Optional, Tuple, Union
 import numpy as np
 import scipy.stats
 import xarray
+from joblib import Parallel, delayed
 from scipy.spatial.distance import cdist
 from sklearn.cluster import KMeans
+from sklearn.utils import check_random_state
 
 # Avoid having to include matplotlib in xclim requirements
 try:
@@ -72,29 +74,35 @@ def kkz_reduce_ensemble(
     if standardize:
         data = (data - data.mean("realization")) / data.std("realization")
 
-    data = data.transpose("realization", "criteria")
-    data["realization"] = np.arange(data.realization.size)
+    data = data.transpose("realization", "criteria").values
 
-    unselected = list(data.realization.values)
-    selected = []
+    # Without them, cdist would compute the variances or covariance matrix from its two inputs, which are
+    # all the realizations together in the original algorithm. They are computed once here.
+    if dist_method == "seuclidean" and "V" not in cdist_kwargs:
+        cdist_kwargs["V"] = np.var(data, axis=0, ddof=1)
+    elif dist_method == "mahalanobis" and "VI" not in cdist_kwargs:
+        cdist_kwargs["VI"] = np.linalg.inv(np.cov(data.T)).T
 
     dist0 = cdist(
-        data.mean("realization").expand_dims("realization"),
+        data.mean(axis=0, keepdims=True),
         data,
         metric=dist_method,
         **cdist_kwargs,
     )
-    selected.append(unselected.pop(dist0.argmin()))
+    selected = [int(dist0.argmin())]
 
+    # Distance between each realization and the closest selected one, updated with each new selection.
+    mindist = np.full(data.shape[0], np.inf)
     for i in range(1, num_select):
         dist = cdist(
-            data.isel(realization=selected),
-            data.isel(realization=unselected),
+            data[selected[-1:]],
+            data,
             metric=dist_method,
             **cdist_kwargs,
         )
-        dist = dist.min(axis=0)
-        selected.append(unselected.pop(dist.argmax()))
+        np.minimum(mindist, dist[0], out=mindist)
+        mindist[selected[-1]] = -np.inf
+        selected.append(int(mindist.argmax()))
 
     return selected
 
@@ -109,6 +117,9 @@ def kmeans_reduce_ensemble(
     model_weights: Optional[np.ndarray] = None,
     sample_weights: Optional[np.ndarray] = None,
     random_state: Optional[Union[int, np.random.RandomState]] = None,
+    n_init: int = 1000,
+    warm_start: bool = False,
+    n_jobs: Optional[int] = None,
 ) -> Tuple[list, np.ndarray, dict]:
     """Return a sample of ensemble members using k-means clustering.
 
@@ -143,6 +154,17 @@ def kmeans_reduce_ensemble(
       sklearn.cluster.KMeans() random_state parameter. Determines random number generation for centroid
       initialization. Use an int to make the randomness deterministic.
       See: https://scikit-learn.org/stable/modules/generated/sklearn.cluster.KMeans.html
+    n_init: int
+      Number of initializations of the final k-means clustering, the best one is kept. Defaults to 1000.
+    warm_start: bool
+      If True, the k-means clustering with n clusters of the R² profile is initialized with the
+      centroids found for n - 1 clusters and the member farthest from them, and run only once. This is
+      much faster than the default 15 random initializations for each number of clusters.
+    n_jobs: Optional[int]
+      If given, the independent initializations of each k-means clustering are run in parallel on that many threads
+      (-1 for all cores). Each initialization is then seeded from `random_state`, so that the results only depend
+      on `random_state` and not on `n_jobs`. They might however differ from the results obtained with the
+      default (None), where the initializations are run sequentially by scikit-learn.
     make_graph: bool
       output a dictionary of input for displays a plot of R² vs. the number of clusters.
       Defaults to True if matplotlib is installed in runtime environment.
@@ -258,7 +280,16 @@ def kmeans_reduce_ensemble(
     variable_weights = variable_weights / np.sum(variable_weights)
 
     z = z * variable_weights
-    rsq = _calc_rsq(z, method, make_graph, n_sim, random_state, sample_weights)
+    rsq = _calc_rsq(
+        z,
+        method,
+        make_graph,
+        n_sim,
+        random_state,
+        sample_weights,
+        warm_start=warm_start,
+        n_jobs=n_jobs,
+    )
 
     n_clusters = _get_nclust(method, n_sim, rsq, max_clusters)
 
@@ -269,11 +300,17 @@ def kmeans_reduce_ensemble(
         fig_data["realizations"] = n_sim
 
     # Final k-means clustering with 1000 iterations to avoid instabilities in the choice of final scenarios
-    kmeans = KMeans(
-        n_clusters=n_clusters, n_init=1000, max_iter=600, random_state=random_state
+    kmeans = _kmeans_fit(
+        z,
+        n_clusters,
+        n_init=n_init,
+        max_iter=600,
+        random_state=random_state,
+        sample_weights=sample_weights,
+        n_jobs=n_jobs,
     )
     # we use 'fit_' only once, otherwise it computes everything again
-    clusters = kmeans.fit_predict(z, sample_weight=sample_weights)
+    clusters = kmeans.labels_
 
     # squared distance to centroids
     d = np.square(
@@ -319,33 +356,97 @@ def kmeans_reduce_ensemble(
     return out, clusters, fig_data
 
 
-def _calc_rsq(z, method, make_graph, n_sim, random_state, sample_weights):
-    """Subfunction to kmeans_reduce_ensemble. Calculates r-square profile (r-square versus number of clusters."""
+def _calc_rsq(
+    z,
+    method,
+    make_graph,
+    n_sim,
+    random_state,
+    sample_weights,
+    warm_start=False,
+    n_jobs=None,
+):
+    """Subfunction to kmeans_reduce_ensemble. Calculates r-square profile (r-square versus number of clusters.
+
+    When the profile is not plotted and the method is 'rsq_cutoff', the computation stops as soon as the cutoff is
+    exceeded, the rest of the profile is left to NaN.
+    """
     rsq = None
     if list(method.keys())[0] != "n_clusters" or make_graph is True:
         # generate r2 profile data
         sumd = np.zeros(shape=n_sim) + np.nan
+        rsq = np.zeros(shape=n_sim) + np.nan
+        kmeans = None
         for nclust in range(n_sim):
-            # This is k-means with only 10 iterations, to limit the computation times
-            kmeans = KMeans(
-                n_clusters=nclust + 1,
-                n_init=15,
-                max_iter=300,
-                random_state=random_state,
-            )
-            kmeans = kmeans.fit(z, sample_weight=sample_weights)
+            if warm_start and kmeans is not None:
+                # Start from the previous centroids, adding the (weighted) farthest member as a new one.
+                dist = np.square(kmeans.transform(z)).min(axis=1) * sample_weights
+                init = np.vstack(
+                    (kmeans.cluster_centers_, np.asarray(z)[dist.argmax()])
+                )
+                kmeans = KMeans(
+                    n_clusters=nclust + 1, init=init, n_init=1, max_iter=300
+                ).fit(z, sample_weight=sample_weights)
+            else:
+                # This is k-means with only 15 initializations, to limit the computation times
+                kmeans = _kmeans_fit(
+                    z,
+                    nclust + 1,
+                    n_init=15,
+                    max_iter=300,
+                    random_state=random_state,
+                    sample_weights=sample_weights,
+                    n_jobs=n_jobs,
+                )
             sumd[
                 nclust
             ] = (
                 kmeans.inertia_
             )  # sum of the squared distance between each simulation and the nearest cluster centroid
 
-        # R² of the groups vs. the full ensemble
-        rsq = (sumd[0] - sumd) / sumd[0]
+            # R² of the groups vs. the full ensemble
+            rsq[nclust] = (sumd[0] - sumd[nclust]) / sumd[0]
+            if (
+                not make_graph
+                and "rsq_cutoff" in method
+                and rsq[nclust] > method["rsq_cutoff"]
+            ):
+                break
 
     return rsq
 
 
+def _kmeans_fit(
+    z, n_clusters, n_init, max_iter, random_state, sample_weights, n_jobs=None
+):
+    """Subfunction to kmeans_reduce_ensemble. Fits k-means with many initializations, possibly in parallel.
+
+    If `n_jobs` is None, scikit-learn runs the initializations. Otherwise, they are run in parallel threads, each
+    one seeded from `random_state`, and the first one with the smallest inertia is returned.
+    """
+    if n_jobs is None:
+        kmeans = KMeans(
+            n_clusters=n_clusters,
+            n_init=n_init,
+            max_iter=max_iter,
+            random_state=random_state,
+        )
+        return kmeans.fit(z, sample_weight=sample_weights)
+
+    seeds = check_random_state(random_state).randint(
+        np.iinfo(np.int32).max, size=n_init
+    )
+    fits = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(
+            KMeans(
+                n_clusters=n_clusters, n_init=1, max_iter=max_iter, random_state=seed
+            ).fit
+        )(z, sample_weight=sample_weights)
+        for seed in seeds
+    )
+    return min(fits, key=lambda kmeans: kmeans.inertia_)
+
+
 def _get_nclust(method=None, n_sim=None, rsq=None, max_clusters=None):
     """Subfunction to kmeans_reduce_ensemble. Determine number of clusters to create depending on various methods."""
     # if we actually need to find the optimal number of clusters, this is where it is done
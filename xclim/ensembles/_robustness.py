@@ -16,7 +16,7 @@ References
 from typing import Tuple, Union
 
 import numpy as np
-import scipy.stats as spstats
+import scipy.special as spspecial
 import xarray as xr
 
 from xclim.core.formatting import update_history
@@ -143,36 +143,31 @@ def change_significance(
         p_change = kwargs.setdefault("p_change", 0.05)
 
         # Test hypothesis of no significant change
-        pvals = xr.apply_ufunc(
-            lambda f, r: spstats.ttest_1samp(f, r, axis=-1, nan_policy="omit")[1],
-            fut,
-            ref.mean("time"),
-            input_core_dims=[["realization", "time"], ["realization"]],
-            output_core_dims=[["realization"]],
-            vectorize=True,
-            dask="parallelized",
-            output_dtypes=[float],
+        # Single sample T-test, computed from the moments of fut along time.
+        n_fut = fut.count("time")
+        t_stat = (fut.mean("time") - ref.mean("time")) / np.sqrt(
+            fut.var("time", ddof=1) / n_fut
         )
+        pvals = _ttest_pvalue(t_stat, n_fut - 1)
         # When p < p_change, the hypothesis of no significant change is rejected.
         changed = pvals < p_change
     elif test == "welch-ttest":
         p_change = kwargs.setdefault("p_change", 0.05)
 
         # Test hypothesis of no significant change
-        # equal_var=False -> Welch's T-test
-        pvals = xr.apply_ufunc(
-            lambda f, r: spstats.ttest_ind(
-                f, r, axis=-1, equal_var=False, nan_policy="omit"
-            )[1],
-            fut,
-            ref,
-            input_core_dims=[["realization", "time"], ["realization", "time"]],
-            output_core_dims=[["realization"]],
-            exclude_dims={"time"},
-            vectorize=True,
-            dask="parallelized",
-            output_dtypes=[float],
+        # Welch's T-test (unequal variances), computed from the moments of fut and ref along time.
+        n_fut = fut.count("time")
+        n_ref = ref.count("time")
+        v_fut = fut.var("time", ddof=1) / n_fut
+        v_ref = ref.var("time", ddof=1) / n_ref
+        t_stat = (fut.mean("time") - ref.mean("time")) / np.sqrt(v_fut + v_ref)
+        # Welch–Satterthwaite degrees of freedom
+        dof = (v_fut + v_ref) ** 2 / (
+            v_fut ** 2 / (n_fut - 1) + v_ref ** 2 / (n_ref - 1)
         )
+        # As in scipy, when both variances are null, use 1 degree of freedom.
+        dof = dof.fillna(1)
+        pvals = _ttest_pvalue(t_stat, dof)
 
         # When p < p_change, the hypothesis of no significant change is rejected.
         changed = pvals < p_change
@@ -229,6 +224,17 @@ def change_significance(
     return change_frac, pos_frac
 
 
+def _ttest_pvalue(t_stat, dof):
+    """Two-sided p-value of a T-test, from the statistic and the degrees of freedom, in a single vectorized call."""
+    return xr.apply_ufunc(
+        lambda t, df: 2 * spspecial.stdtr(df, -np.abs(t)),
+        t_stat,
+        dof,
+        dask="parallelized",
+        output_dtypes=[float],
+    )
+
+
 def robustness_coefficient(
     fut: Union[xr.DataArray, xr.Dataset], ref: Union[xr.DataArray, xr.Dataset]
 ) -> Union[xr.DataArray, xr.Dataset]:
@@ -266,42 +272,45 @@ def robustness_coefficient(
 
     def _knutti_sedlacek(ref, fut):
         def diff_cdf_sq_area_int(x1, x2):
-            """Exact integral of the squared area between the non-parametric CDFs of 2 vectors."""
-            # Non-parametric CDF on points x1 and x2
-            # i.e. y1(x) is the proportion of x1 <= x
-            y1 = (np.arange(x1.size) + 1) / x1.size
-            y2 = (np.arange(x2.size) + 1) / x2.size
-
-            x2_in_1 = np.searchsorted(x1, x2, side="right")  # Where to insert x2 in x1
-            x1_in_2 = np.searchsorted(x2, x1, side="right")  # Where to insert x1 in x2
-
-            # Merge to get all "discontinuities" of the CDF difference
-            # y1 with repeated value (to the right) where x2 is inserted
-            # Same for y2. 0s are prepended where needed.
-            x = np.insert(x1, x2_in_1, x2)
-            y1_f = np.insert(y1, x2_in_1, np.r_[0, y1][x2_in_1])
-            y2_f = np.insert(y2, x1_in_2, np.r_[0, y2][x1_in_2])
+            """Exact integral of the squared area between the non-parametric CDFs of 2 vectors, along the last axis."""
+            shape = np.broadcast(x1[..., 0], x2[..., 0]).shape
+            x1 = np.broadcast_to(x1, shape + x1.shape[-1:])
+            x2 = np.broadcast_to(x2, shape + x2.shape[-1:])
+
+            # Merge the samples to get all "discontinuities" of the CDF difference.
+            # Each point of x1 increments the difference by 1 / n1, each point of x2 decrements it by 1 / n2.
+            x = np.concatenate((x1, x2), axis=-1)
+            steps = np.concatenate(
+                (
+                    np.full(x1.shape, 1 / x1.shape[-1]),
+                    np.full(x2.shape, -1 / x2.shape[-1]),
+                ),
+                axis=-1,
+            )
+            order = np.argsort(x, axis=-1)
+            x = np.take_along_axis(x, order, axis=-1)
+            # Difference between the non-parametric CDFs at each point
+            # i.e. y1(x) - y2(x) where y1(x) is the proportion of x1 <= x
+            dy = np.cumsum(np.take_along_axis(steps, order, axis=-1), axis=-1)
 
             # Discrete integral of the squared difference (distance) between the two CDFs.
-            return np.sum(np.diff(x) * (y1_f - y2_f)[:-1] ** 2)
+            return np.sum(np.diff(x, axis=-1) * dy[..., :-1] ** 2, axis=-1)
 
-        # Get sorted vectors
-        v_fut = np.sort(fut.flatten())  # "cumulative" models distribution
-        v_favg = np.sort(fut.mean(axis=-1))  # Multi-model mean
-        v_ref = np.sort(ref)  # Historical values
+        v_fut = fut.reshape(fut.shape[:-2] + (-1,))  # "cumulative" models distribution
+        v_favg = fut.mean(axis=-1)  # Multi-model mean
 
         A1 = diff_cdf_sq_area_int(v_fut, v_favg)
-        A2 = diff_cdf_sq_area_int(v_ref, v_favg)
+        A2 = diff_cdf_sq_area_int(ref, v_favg)
 
         return 1 - A1 / A2
 
+    # All grid cells are processed at once, the integrals are vectorized along the leading dimensions.
     R = xr.apply_ufunc(
         _knutti_sedlacek,
         ref,
         fut,
         input_core_dims=[["time"], ["realization", "time"]],
         exclude_dims={"time"},
-        vectorize=True,
         dask="parallelized",
         output_dtypes=[float],
     )
@@ -23,7 +23,7 @@ class Converter(Indicator):
     missing = "skip"
 
 
-tg = Converter(
+tg = Converter.lazy(
     identifier="tg",
     _nvar=2,
     units="K",
@@ -35,7 +35,7 @@ tg = Converter(
 )
 
 
-wind_speed_from_vector = Converter(
+wind_speed_from_vector = Converter.lazy(
     identifier="wind_speed_from_vector",
     _nvar=2,
     var_name=["sfcWind", "sfcWindfromdir"],
@@ -51,7 +51,7 @@ wind_speed_from_vector = Converter(
 )
 
 
-wind_vector_from_speed = Converter(
+wind_vector_from_speed = Converter.lazy(
     identifier="wind_vector_from_speed",
     _nvar=2,
     var_name=["uas", "vas"],
@@ -67,7 +67,7 @@ wind_vector_from_speed = Converter(
 )
 
 
-saturation_vapor_pressure = Converter(
+saturation_vapor_pressure = Converter.lazy(
     identifier="e_sat",
     _nvar=1,
     units="Pa",
@@ -85,7 +85,7 @@ saturation_vapor_pressure = Converter(
 )
 
 
-relative_humidity_from_dewpoint = Converter(
+relative_humidity_from_dewpoint = Converter.lazy(
     identifier="rh_fromdewpoint",
     _nvar=2,
     units="%",
@@ -111,7 +111,7 @@ relative_humidity_from_dewpoint = Converter(
 )
 
 
-relative_humidity = Converter(
+relative_humidity = Converter.lazy(
     identifier="rh",
     _nvar=3,
     units="%",
@@ -134,7 +134,7 @@ relative_humidity = Converter(
 )
 
 
-specific_humidity = Converter(
+specific_humidity = Converter.lazy(
     identifier="huss",
     _nvar=3,
     units="",
@@ -154,7 +154,7 @@ specific_humidity = Converter(
 )
 
 
-snowfall_approximation = Converter(
+snowfall_approximation = Converter.lazy(
     identifier="prsn",
     _nvar=2,
     units="kg m-2 s-1",
@@ -167,7 +167,7 @@ snowfall_approximation = Converter(
     compute=indices.snowfall_approximation,
 )
 
-rain_approximation = Converter(
+rain_approximation = Converter.lazy(
     identifier="prlp",
     _nvar=2,
     units="kg m-2 s-1",
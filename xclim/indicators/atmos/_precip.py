@@ -73,7 +73,7 @@ class Prsn(Daily):
         cfchecks.check_valid(prsn, "standard_name", "solid_precipitation_flux")
 
 
-rain_on_frozen_ground_days = PrTasx(
+rain_on_frozen_ground_days = PrTasx.lazy(
     identifier="rain_frzgr",
     units="days",
     standard_name="number_of_days_with_lwe_thickness_of_"
@@ -88,7 +88,7 @@ rain_on_frozen_ground_days = PrTasx(
     compute=indices.rain_on_frozen_ground_days,
 )
 
-max_1day_precipitation_amount = Pr(
+max_1day_precipitation_amount = Pr.lazy(
     identifier="rx1day",
     units="mm/day",
     standard_name="lwe_thickness_of_precipitation_amount",
@@ -98,7 +98,7 @@ max_1day_precipitation_amount = Pr(
     compute=indices.max_1day_precipitation_amount,
 )
 
-max_n_day_precipitation_amount = Pr(
+max_n_day_precipitation_amount = Pr.lazy(
     identifier="max_n_day_precipitation_amount",
     var_name="rx{window}day",
     units="mm",
@@ -109,7 +109,7 @@ max_n_day_precipitation_amount = Pr(
     compute=indices.max_n_day_precipitation_amount,
 )
 
-wetdays = Pr(
+wetdays = Pr.lazy(
     identifier="wetdays",
     units="days",
     standard_name="number_of_days_with_lwe_thickness_of_precipitation_amount_at_or_above_threshold",
@@ -119,7 +119,7 @@ wetdays = Pr(
     compute=indices.wetdays,
 )
 
-dry_days = Pr(
+dry_days = Pr.lazy(
     identifier="dry_days",
     units="days",
     standard_name="number_of_days_with_lwe_thickness_of_precipitation_amount_below_threshold",
@@ -129,7 +129,7 @@ dry_days = Pr(
     compute=indices.dry_days,
 )
 
-maximum_consecutive_wet_days = Pr(
+maximum_consecutive_wet_days = Pr.lazy(
     identifier="cwd",
     units="days",
     standard_name="number_of_days_with_lwe_thickness_of_"
@@ -141,7 +141,7 @@ maximum_consecutive_wet_days = Pr(
     compute=indices.maximum_consecutive_wet_days,
 )
 
-maximum_consecutive_dry_days = Pr(
+maximum_consecutive_dry_days = Pr.lazy(
     identifier="cdd",
     units="days",
     standard_name="number_of_days_with_lwe_thickness_of_"
@@ -153,7 +153,7 @@ maximum_consecutive_dry_days = Pr(
     compute=indices.maximum_consecutive_dry_days,
 )
 
-daily_pr_intensity = Pr(
+daily_pr_intensity = Pr.lazy(
     identifier="sdii",
     units="mm/day",
     standard_name="lwe_thickness_of_precipitation_amount",
@@ -165,7 +165,7 @@ daily_pr_intensity = Pr(
     compute=indices.daily_pr_intensity,
 )
 
-max_pr_intensity = HrPr(
+max_pr_intensity = HrPr.lazy(
     identifier="max_pr_intensity",
     units="mm/h",
     standard_name="precipitation",
@@ -177,7 +177,7 @@ max_pr_intensity = HrPr(
     keywords="IDF curves",
 )
 
-precip_accumulation = Pr(
+precip_accumulation = Pr.lazy(
     title="Accumulated total precipitation (solid and liquid)",
     identifier="prcptot",
     units="mm",
@@ -188,7 +188,7 @@ precip_accumulation = Pr(
     compute=wrapped_partial(indices.precip_accumulation, tas=None, phase=None),
 )
 
-liquid_precip_accumulation = PrTasx(
+liquid_precip_accumulation = PrTasx.lazy(
     title="Accumulated liquid precipitation.",
     identifier="liquidprcptot",
     units="mm",
@@ -201,7 +201,7 @@ liquid_precip_accumulation = PrTasx(
     ),  # _empty is added to un-optionalize the argument.
 )
 
-solid_precip_accumulation = PrTasx(
+solid_precip_accumulation = PrTasx.lazy(
     title="Accumulated solid precipitation.",
     identifier="solidprcptot",
     units="mm",
@@ -214,7 +214,7 @@ solid_precip_accumulation = PrTasx(
     ),
 )
 
-drought_code = PrTas(
+drought_code = PrTas.lazy(
     identifier="dc",
     units="",
     standard_name="drought_code",
@@ -224,7 +224,7 @@ drought_code = PrTas(
     missing="skip",
 )
 
-fire_weather_indexes = Daily(
+fire_weather_indexes = Daily.lazy(
     _nvar=4,
     identifier="fwi",
     realm="atmos",
@@ -259,7 +259,7 @@ fire_weather_indexes = Daily(
 )
 
 
-last_snowfall = Prsn(
+last_snowfall = Prsn.lazy(
     identifier="last_snowfall",
     standard_name="day_of_year",
     long_name="Date of last snowfall",
@@ -268,7 +268,7 @@ last_snowfall = Prsn(
     compute=indices.last_snowfall,
 )
 
-first_snowfall = Prsn(
+first_snowfall = Prsn.lazy(
     identifier="first_snowfall",
     standard_name="day_of_year",
     long_name="Date of first snowfall",
@@ -98,7 +98,7 @@ class TasminTasmax(Daily2D):
         check_units(tasmax, tasmin.attrs["units"])
 
 
-tn_days_below = Tasmin(
+tn_days_below = Tasmin.lazy(
     identifier="tn_days_below",
     units="days",
     standard_name="number_of_days_with_air_temperature_below_threshold",
@@ -108,7 +108,7 @@ tn_days_below = Tasmin(
     compute=indices.tn_days_below,
 )
 
-tx_days_above = Tasmax(
+tx_days_above = Tasmax.lazy(
     identifier="tx_days_above",
     units="days",
     standard_name="number_of_days_with_air_temperature_above_threshold",
@@ -118,7 +118,7 @@ tx_days_above = Tasmax(
     compute=indices.tx_days_above,
 )
 
-tx_tn_days_above = TasminTasmax(
+tx_tn_days_above = TasminTasmax.lazy(
     identifier="tx_tn_days_above",
     units="days",
     standard_name="number_of_days_with_air_temperature_above_threshold",
@@ -129,7 +129,7 @@ tx_tn_days_above = TasminTasmax(
     compute=indices.tx_tn_days_above,
 )
 
-heat_wave_frequency = TasminTasmax(
+heat_wave_frequency = TasminTasmax.lazy(
     identifier="heat_wave_frequency",
     units="",
     standard_name="heat_wave_events",
@@ -145,7 +145,7 @@ heat_wave_frequency = TasminTasmax(
     compute=indices.heat_wave_frequency,
 )
 
-heat_wave_max_length = TasminTasmax(
+heat_wave_max_length = TasminTasmax.lazy(
     identifier="heat_wave_max_length",
     units="days",
     standard_name="spell_length_of_days_with_air_temperature_above_threshold",
@@ -161,7 +161,7 @@ heat_wave_max_length = TasminTasmax(
     compute=indices.heat_wave_max_length,
 )
 
-heat_wave_total_length = TasminTasmax(
+heat_wave_total_length = TasminTasmax.lazy(
     identifier="heat_wave_total_length",
     units="days",
     standard_name="spell_length_of_days_with_air_temperature_above_threshold",
@@ -178,7 +178,7 @@ heat_wave_total_length = TasminTasmax(
 )
 
 
-heat_wave_index = Tasmax(
+heat_wave_index = Tasmax.lazy(
     identifier="heat_wave_index",
     units="days",
     standard_name="heat_wave_index",
@@ -190,7 +190,7 @@ heat_wave_index = Tasmax(
 )
 
 
-hot_spell_frequency = Tasmax(
+hot_spell_frequency = Tasmax.lazy(
     identifier="hot_spell_frequency",
     units="",
     standard_name="hot_spell_events",
@@ -203,7 +203,7 @@ hot_spell_frequency = Tasmax(
     compute=indices.hot_spell_frequency,
 )
 
-hot_spell_max_length = Tasmax(
+hot_spell_max_length = Tasmax.lazy(
     identifier="hot_spell_max_length",
     units="days",
     standard_name="spell_length_of_days_with_air_temperature_above_threshold",
@@ -216,7 +216,7 @@ hot_spell_max_length = Tasmax(
     compute=indices.hot_spell_max_length,
 )
 
-tg_mean = Tas(
+tg_mean = Tas.lazy(
     identifier="tg_mean",
     units="K",
     standard_name="air_temperature",
@@ -226,7 +226,7 @@ tg_mean = Tas(
     compute=indices.tg_mean,
 )
 
-tg_max = Tas(
+tg_max = Tas.lazy(
     identifier="tg_max",
     units="K",
     standard_name="air_temperature",
@@ -236,7 +236,7 @@ tg_max = Tas(
     compute=indices.tg_max,
 )
 
-tg_min = Tas(
+tg_min = Tas.lazy(
     identifier="tg_min",
     units="K",
     standard_name="air_temperature",
@@ -246,7 +246,7 @@ tg_min = Tas(
     compute=indices.tg_min,
 )
 
-tx_mean = Tasmax(
+tx_mean = Tasmax.lazy(
     identifier="tx_mean",
     units="K",
     standard_name="air_temperature",
@@ -256,7 +256,7 @@ tx_mean = Tasmax(
     compute=indices.tx_mean,
 )
 
-tx_max = Tasmax(
+tx_max = Tasmax.lazy(
     identifier="tx_max",
     units="K",
     standard_name="air_temperature",
@@ -266,7 +266,7 @@ tx_max = Tasmax(
     compute=indices.tx_max,
 )
 
-tx_min = Tasmax(
+tx_min = Tasmax.lazy(
     identifier="tx_min",
     units="K",
     standard_name="air_temperature",
@@ -276,7 +276,7 @@ tx_min = Tasmax(
     compute=indices.tx_min,
 )
 
-tn_mean = Tasmin(
+tn_mean = Tasmin.lazy(
     identifier="tn_mean",
     units="K",
     standard_name="air_temperature",
@@ -286,7 +286,7 @@ tn_mean = Tasmin(
     compute=indices.tn_mean,
 )
 
-tn_max = Tasmin(
+tn_max = Tasmin.lazy(
     identifier="tn_max",
     units="K",
     standard_name="air_temperature",
@@ -296,7 +296,7 @@ tn_max = Tasmin(
     compute=indices.tn_max,
 )
 
-tn_min = Tasmin(
+tn_min = Tasmin.lazy(
     identifier="tn_min",
     units="K",
     standard_name="air_temperature",
@@ -306,7 +306,7 @@ tn_min = Tasmin(
     compute=indices.tn_min,
 )
 
-daily_temperature_range = TasminTasmax(
+daily_temperature_range = TasminTasmax.lazy(
     title="Mean of daily temperature range.",
     identifier="dtr",
     units="K",
@@ -317,7 +317,7 @@ daily_temperature_range = TasminTasmax(
     compute=wrapped_partial(indices.daily_temperature_range, op="mean"),
 )
 
-max_daily_temperature_range = TasminTasmax(
+max_daily_temperature_range = TasminTasmax.lazy(
     title="Maximum of daily temperature range.",
     identifier="dtrmax",
     units="K",
@@ -328,7 +328,7 @@ max_daily_temperature_range = TasminTasmax(
     compute=wrapped_partial(indices.daily_temperature_range, op="max"),
 )
 
-daily_temperature_range_variability = TasminTasmax(
+daily_temperature_range_variability = TasminTasmax.lazy(
     identifier="dtrvar",
     units="K",
     standard_name="air_temperature",
@@ -342,7 +342,7 @@ daily_temperature_range_variability = TasminTasmax(
     compute=indices.daily_temperature_range_variability,
 )
 
-extreme_temperature_range = TasminTasmax(
+extreme_temperature_range = TasminTasmax.lazy(
     identifier="etr",
     units="K",
     standard_name="air_temperature",
@@ -352,7 +352,7 @@ extreme_temperature_range = TasminTasmax(
     compute=indices.extreme_temperature_range,
 )
 
-cold_spell_duration_index = Tasmin(
+cold_spell_duration_index = Tasmin.lazy(
     identifier="cold_spell_duration_index",
     var_name="csdi_{window}",
     units="days",
@@ -366,7 +366,7 @@ cold_spell_duration_index = Tasmin(
     compute=indices.cold_spell_duration_index,
 )
 
-cold_spell_days = Tas(
+cold_spell_days = Tas.lazy(
     identifier="cold_spell_days",
     units="days",
     standard_name="cold_spell_days",
@@ -378,7 +378,7 @@ cold_spell_days = Tas(
     compute=indices.cold_spell_days,
 )
 
-cold_spell_frequency = Tas(
+cold_spell_frequency = Tas.lazy(
     identifier="cold_spell_frequency",
     units="",
     standard_name="cold_spell_frequency",
@@ -391,7 +391,7 @@ cold_spell_frequency = Tas(
 )
 
 
-daily_freezethaw_cycles = TasminTasmax(
+daily_freezethaw_cycles = TasminTasmax.lazy(
     identifier="dlyfrzthw",
     units="days",
     standard_name="daily_freezethaw_cycles",
@@ -402,7 +402,7 @@ daily_freezethaw_cycles = TasminTasmax(
     compute=indices.daily_freezethaw_cycles,
 )
 
-cooling_degree_days = Tas(
+cooling_degree_days = Tas.lazy(
     identifier="cooling_degree_days",
     units="K days",
     standard_name="integral_of_air_temperature_excess_wrt_time",
@@ -412,7 +412,7 @@ cooling_degree_days = Tas(
     compute=indices.cooling_degree_days,
 )
 
-heating_degree_days = Tas(
+heating_degree_days = Tas.lazy(
     identifier="heating_degree_days",
     units="K days",
     standard_name="integral_of_air_temperature_deficit_wrt_time",
@@ -422,7 +422,7 @@ heating_degree_days = Tas(
     compute=indices.heating_degree_days,
 )
 
-growing_degree_days = Tas(
+growing_degree_days = Tas.lazy(
     identifier="growing_degree_days",
     units="K days",
     standard_name="integral_of_air_temperature_excess_wrt_time",
@@ -432,7 +432,7 @@ growing_degree_days = Tas(
     compute=indices.growing_degree_days,
 )
 
-freshet_start = Tas(
+freshet_start = Tas.lazy(
     identifier="freshet_start",
     units="",
     standard_name="day_of_year",
@@ -442,7 +442,7 @@ freshet_start = Tas(
     compute=indices.freshet_start,
 )
 
-frost_days = Tasmin(
+frost_days = Tasmin.lazy(
     identifier="frost_days",
     units="days",
     standard_name="days_with_air_temperature_below_threshold",
@@ -452,7 +452,7 @@ frost_days = Tasmin(
     compute=indices.frost_days,
 )
 
-frost_season_length = Tasmin(
+frost_season_length = Tasmin.lazy(
     identifier="frost_season_length",
     units="days",
     standard_name="days_with_air_temperature_below_threshold",
@@ -465,7 +465,7 @@ frost_season_length = Tasmin(
     compute=wrapped_partial(indices.frost_season_length, thresh="0 degC"),
 )
 
-last_spring_frost = Tasmin(
+last_spring_frost = Tasmin.lazy(
     identifier="last_spring_frost",
     units="",
     standard_name="day_of_year",
@@ -475,7 +475,7 @@ last_spring_frost = Tasmin(
     compute=indices.last_spring_frost,
 )
 
-first_day_below = Tasmin(
+first_day_below = Tasmin.lazy(
     identifier="first_day_below",
     units="",
     standard_name="day_of_year",
@@ -484,7 +484,7 @@ first_day_below = Tasmin(
     compute=indices.first_day_below,
 )
 
-first_day_above = Tasmin(
+first_day_above = Tasmin.lazy(
     identifier="first_day_above",
     units="",
     standard_name="day_of_year",
@@ -494,7 +494,7 @@ first_day_above = Tasmin(
 )
 
 
-ice_days = Tasmax(
+ice_days = Tasmax.lazy(
     identifier="ice_days",
     standard_name="days_with_air_temperature_below_threshold",
     units="days",
@@ -504,7 +504,7 @@ ice_days = Tasmax(
     compute=indices.ice_days,
 )
 
-consecutive_frost_days = Tasmin(
+consecutive_frost_days = Tasmin.lazy(
     identifier="consecutive_frost_days",
     units="days",
     standard_name="spell_length_of_days_with_air_temperature_below_threshold",
@@ -515,7 +515,7 @@ consecutive_frost_days = Tasmin(
     compute=indices.maximum_consecutive_frost_days,
 )
 
-maximum_consecutive_frost_free_days = Tasmin(
+maximum_consecutive_frost_free_days = Tasmin.lazy(
     identifier="consecutive_frost_free_days",
     units="days",
     standard_name="spell_length_of_days_with_air_temperature_above_threshold",
@@ -526,7 +526,7 @@ maximum_consecutive_frost_free_days = Tasmin(
     compute=indices.maximum_consecutive_frost_free_days,
 )
 
-growing_season_length = Tas(
+growing_season_length = Tas.lazy(
     identifier="growing_season_length",
     units="days",
     standard_name="growing_season_length",
@@ -539,7 +539,7 @@ growing_season_length = Tas(
     compute=indices.growing_season_length,
 )
 
-growing_season_end = Tas(
+growing_season_end = Tas.lazy(
     identifier="growing_season_end",
     units="",
     standard_name="day_of_year",
@@ -551,7 +551,7 @@ growing_season_end = Tas(
     compute=indices.growing_season_end,
 )
 
-tropical_nights = Tasmin(
+tropical_nights = Tasmin.lazy(
     identifier="tropical_nights",
     units="days",
     standard_name="number_of_days_with_air_temperature_above_threshold",
@@ -562,7 +562,7 @@ tropical_nights = Tasmin(
     compute=indices.tropical_nights,
 )
 
-tg90p = Tas(
+tg90p = Tas.lazy(
     identifier="tg90p",
     units="days",
     standard_name="days_with_air_temperature_above_threshold",
@@ -574,7 +574,7 @@ tg90p = Tas(
     compute=indices.tg90p,
 )
 
-tg10p = Tas(
+tg10p = Tas.lazy(
     identifier="tg10p",
     units="days",
     standard_name="days_with_air_temperature_below_threshold",
@@ -586,7 +586,7 @@ tg10p = Tas(
     compute=indices.tg10p,
 )
 
-tx90p = Tasmax(
+tx90p = Tasmax.lazy(
     identifier="tx90p",
     units="days",
     standard_name="days_with_air_temperature_above_threshold",
@@ -598,7 +598,7 @@ tx90p = Tasmax(
     compute=indices.tx90p,
 )
 
-tx10p = Tasmax(
+tx10p = Tasmax.lazy(
     identifier="tx10p",
     units="days",
     standard_name="days_with_air_temperature_below_threshold",
@@ -610,7 +610,7 @@ tx10p = Tasmax(
     compute=indices.tx10p,
 )
 
-tn90p = Tasmin(
+tn90p = Tasmin.lazy(
     identifier="tn90p",
     units="days",
     standard_name="days_with_air_temperature_above_threshold",
@@ -622,7 +622,7 @@ tn90p = Tasmin(
     compute=indices.tn90p,
 )
 
-tn10p = Tasmin(
+tn10p = Tasmin.lazy(
     identifier="tn10p",
     units="days",
     standard_name="days_with_air_temperature_below_threshold",
@@ -635,7 +635,7 @@ tn10p = Tasmin(
 )
 
 
-degree_days_exceedance_date = Tas(
+degree_days_exceedance_date = Tas.lazy(
     identifier="degree_days_exceedance_date",
     units="",
     standard_name="day_of_year",
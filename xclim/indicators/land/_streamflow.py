@@ -65,7 +65,7 @@ class Fit(Streamflow):
         pass
 
 
-base_flow_index = Streamflow(
+base_flow_index = Streamflow.lazy(
     identifier="base_flow_index",
     units="",
     long_name="Base flow index",
@@ -73,7 +73,7 @@ base_flow_index = Streamflow(
     compute=base_flow_index,
 )
 
-freq_analysis = FA(
+freq_analysis = FA.lazy(
     identifier="freq_analysis",
     var_name="q{window}{mode}{indexer}",
     long_name="N-year return period {mode} {indexer} {window}-day flow",
@@ -83,7 +83,7 @@ freq_analysis = FA(
     compute=frequency_analysis,
 )
 
-rb_flashiness_index = Streamflow(
+rb_flashiness_index = Streamflow.lazy(
     identifier="rb_flashiness_index",
     units="",
     var_name="rbi",
@@ -92,7 +92,7 @@ rb_flashiness_index = Streamflow(
     compute=rb_flashiness_index,
 )
 
-stats = Stats(
+stats = Stats.lazy(
     identifier="stats",
     var_name="q{indexer}{op}",
     long_name="{freq} {op} of {indexer} daily flow ",
@@ -102,7 +102,7 @@ stats = Stats(
 )
 
 
-fit = Fit(
+fit = Fit.lazy(
     identifier="fit",
     var_name="params",
     units="",
@@ -115,7 +115,7 @@ fit = Fit(
 )
 
 
-doy_qmax = Streamflow(
+doy_qmax = Streamflow.lazy(
     identifier="doy_qmax",
     var_name="q{indexer}_doy_qmax",
     long_name="Day of the year of the maximum over {indexer}",
@@ -127,7 +127,7 @@ doy_qmax = Streamflow(
 )
 
 
-doy_qmin = Streamflow(
+doy_qmin = Streamflow.lazy(
     identifier="doy_qmin",
     var_name="q{indexer}_doy_qmin",
     long_name="Day of the year of the minimum over {indexer}",
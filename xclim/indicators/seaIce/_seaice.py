@@ -23,7 +23,7 @@ class SicArea(Indicator2D):
         cfchecks.check_valid(area, "standard_name", "cell_area")
 
 
-sea_ice_extent = SicArea(
+sea_ice_extent = SicArea.lazy(
     identifier="sea_ice_extent",
     units="m2",
     standard_name="sea_ice_extent",
@@ -34,7 +34,7 @@ sea_ice_extent = SicArea(
 )
 
 
-sea_ice_area = SicArea(
+sea_ice_area = SicArea.lazy(
     identifier="sea_ice_area",
     units="m2",
     standard_name="sea_ice_area",
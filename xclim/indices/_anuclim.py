@@ -19,7 +19,7 @@ from ._multivariate import (
     precip_accumulation,
 )
 from ._simple import tg_mean
-from .generic import select_resample_op
+from .generic import rolling_mean, rolling_sum, select_resample_op
 from .run_length import lazy_indexing
 
 # Frequencies : YS: year start, QS-DEC: seasons starting in december, MS: month start
@@ -555,20 +555,15 @@ def _to_quarter(
             f'Unknown input time frequency "{freq}": must be one of "D", "W" or "M".'
         )
 
-    if tas is not None:
-        tas = ensure_chunk_size(tas, time=np.ceil(window / 2))
-    if pr is not None:
-        pr = ensure_chunk_size(pr, time=np.ceil(window / 2))
-
     with xarray.set_options(keep_attrs=True):
         if pr is not None:
             pr = pint_multiply(pr, 1 * u, "mm")
-            out = pr.rolling(time=window, center=False).sum()
+            out = rolling_sum(pr, window)
             out.attrs = pr.attrs
             out.attrs["units"] = "mm"
 
         if tas is not None:
-            out = tas.rolling(time=window, center=False).mean(skipna=False)
+            out = rolling_mean(tas, window)
             out.attrs = tas.attrs
 
     out = ensure_chunk_size(out, time=-1)
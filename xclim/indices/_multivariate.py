@@ -4,7 +4,7 @@ from typing import Optional, Union
 import numpy as np
 import xarray
 
-from xclim.core.calendar import resample_doy
+from xclim.core.calendar import compare_doy
 from xclim.core.units import (
     convert_units_to,
     declare_units,
@@ -16,7 +16,7 @@ from xclim.core.units import (
 from . import fwi
 from . import run_length as rl
 from ._conversion import rain_approximation, snowfall_approximation
-from .generic import select_resample_op
+from .generic import rolling_sum, select_resample_op
 
 # Frequencies : YS: year start, QS-DEC: seasons starting in december, MS: month start
 # See http://pandas.pydata.org/pandas-docs/stable/timeseries.html#offset-aliases
@@ -108,10 +108,8 @@ def cold_spell_duration_index(
     """
     tn10 = convert_units_to(tn10, tasmin)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(tn10, tasmin)
-
-    below = tasmin < thresh
+    # Compare each day with the threshold of its day of year.
+    below = compare_doy(tasmin, "<", tn10)
 
     return below.resample(time=freq).map(
         rl.windowed_run_count, window=window, dim="time"
@@ -898,12 +896,9 @@ def rain_on_frozen_ground_days(
     t = convert_units_to(thresh, pr)
     frz = convert_units_to("0 C", tas)
 
-    def func(x, axis):
-        """Check that temperature conditions are below 0 for seven days and above after."""
-        frozen = x == np.array([0, 0, 0, 0, 0, 0, 0, 1], bool)
-        return frozen.all(axis=axis)
-
-    tcond = (tas > frz).rolling(time=8).reduce(func)
+    # Temperature above 0 after seven days below 0, the only thawed day of the 8-day window.
+    thawed = tas > frz
+    tcond = thawed & (rolling_sum(thawed, window=8) == 1)
     pcond = pr > t
 
     return (tcond * pcond * 1).resample(time=freq).sum(dim="time")
@@ -950,12 +945,13 @@ def days_over_precip_thresh(
     thresh = convert_units_to(thresh, pr)
 
     tp = np.maximum(per, thresh)
-    if "dayofyear" in per.coords:
-        # Create time series out of doy values.
-        tp = resample_doy(tp, pr)
 
     # Compute the days where precip is both over the wet day threshold and the percentile threshold.
-    over = pr > tp
+    if "dayofyear" in per.coords:
+        # Compare each day with the threshold of its day of year.
+        over = compare_doy(pr, ">", tp)
+    else:
+        over = pr > tp
 
     return over.resample(time=freq).sum(dim="time")
 
@@ -995,15 +991,17 @@ def fraction_over_precip_thresh(
     thresh = convert_units_to(thresh, pr)
 
     tp = np.maximum(per, thresh)
-    if "dayofyear" in per.coords:
-        # Create time series out of doy values.
-        tp = resample_doy(tp, pr)
 
     # Total precip during wet days over period
     total = pr.where(pr > thresh).resample(time=freq).sum(dim="time")
 
     # Compute the days where precip is both over the wet day threshold and the percentile threshold.
-    over = pr.where(pr > tp).resample(time=freq).sum(dim="time")
+    if "dayofyear" in per.coords:
+        # Compare each day with the threshold of its day of year.
+        over = compare_doy(pr, ">", tp)
+    else:
+        over = pr > tp
+    over = pr.where(over).resample(time=freq).sum(dim="time")
 
     return over / total
 
@@ -1044,11 +1042,8 @@ def tg90p(
     """
     t90 = convert_units_to(t90, tas)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(t90, tas)
-
     # Identify the days over the 90th percentile
-    over = tas > thresh
+    over = compare_doy(tas, ">", t90)
 
     return over.resample(time=freq).sum(dim="time")
 
@@ -1089,11 +1084,8 @@ def tg10p(
     """
     t10 = convert_units_to(t10, tas)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(t10, tas)
-
     # Identify the days below the 10th percentile
-    below = tas < thresh
+    below = compare_doy(tas, "<", t10)
 
     return below.resample(time=freq).sum(dim="time")
 
@@ -1134,11 +1126,8 @@ def tn90p(
     """
     t90 = convert_units_to(t90, tasmin)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(t90, tasmin)
-
     # Identify the days with min temp above 90th percentile.
-    over = tasmin > thresh
+    over = compare_doy(tasmin, ">", t90)
 
     return over.resample(time=freq).sum(dim="time")
 
@@ -1179,11 +1168,8 @@ def tn10p(
     """
     t10 = convert_units_to(t10, tasmin)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(t10, tasmin)
-
     # Identify the days below the 10th percentile
-    below = tasmin < thresh
+    below = compare_doy(tasmin, "<", t10)
 
     return below.resample(time=freq).sum(dim="time")
 
@@ -1224,11 +1210,8 @@ def tx90p(
     """
     t90 = convert_units_to(t90, tasmax)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(t90, tasmax)
-
     # Identify the days with max temp above 90th percentile.
-    over = tasmax > thresh
+    over = compare_doy(tasmax, ">", t90)
 
     return over.resample(time=freq).sum(dim="time")
 
@@ -1269,11 +1252,8 @@ def tx10p(
     """
     t10 = convert_units_to(t10, tasmax)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(t10, tasmax)
-
     # Identify the days below the 10th percentile
-    below = tasmax < thresh
+    below = compare_doy(tasmax, "<", t10)
 
     return below.resample(time=freq).sum(dim="time")
 
@@ -1385,10 +1365,8 @@ def warm_spell_duration_index(
     precipitation, J. Geophys. Res., 111, D05109, doi: 10.1029/2005JD006290.
 
     """
-    # Create time series out of doy values.
-    thresh = resample_doy(tx90, tasmax)
-
-    above = tasmax > thresh
+    # Compare each day with the threshold of its day of year.
+    above = compare_doy(tasmax, ">", tx90)
 
     return above.resample(time=freq).map(
         rl.windowed_run_count, window=window, dim="time"
@@ -4,6 +4,7 @@ import xarray
 from xclim.core.units import convert_units_to, declare_units, pint_multiply, units
 
 from . import run_length as rl
+from .generic import rolling_mean, rolling_sum
 
 # Frequencies : YS: year start, QS-DEC: seasons starting in december, MS: month start
 # See http://pandas.pydata.org/pandas-docs/stable/timeseries.html#offset-aliases
@@ -456,7 +457,7 @@ def max_n_day_precipitation_amount(
     >>> out = max_n_day_precipitation_amount(pr, window=5, freq="YS")
     """
     # Rolling sum of the values
-    arr = pr.rolling(time=window).sum(skipna=False)
+    arr = rolling_sum(pr, window)
     out = arr.resample(time=freq).max(dim="time", keep_attrs=True)
 
     out.attrs["units"] = pr.units
@@ -494,7 +495,7 @@ def max_pr_intensity(pr, window: int = 1, freq: str = "YS"):
     # TODO
     """
     # Rolling sum of the values
-    arr = pr.rolling(time=window).mean(skipna=False)
+    arr = rolling_mean(pr, window)
     out = arr.resample(time=freq).max(dim="time", keep_attrs=True)
 
     out.attrs["units"] = pr.units
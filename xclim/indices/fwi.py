@@ -86,6 +86,9 @@ import xarray as xr
 from dask.array import Array as dskarray
 from numba import jit, vectorize
 
+from xclim.core.calendar import time_field
+from xclim.core.utils import float_dtype
+
 DEFAULT_PARAMS = dict(
     # min_lat=-58,
     # max_lat=75,
@@ -524,7 +527,7 @@ def _fire_weather_calc(
 
     ind_data = OrderedDict()
     for indice in indexes:
-        ind_data[indice] = np.zeros_like(tas) * np.nan
+        ind_data[indice] = np.full(tas.shape, np.nan, dtype=float_dtype(tas))
 
     # We have to start further is snow_depth is used for shut_down and/or start_up
     start_idx = params.get(
@@ -704,7 +707,7 @@ def fire_weather_ufunc(
         (rh, "rh", ["DMC", "FFMC"], True),
         (ws, "ws", ["FFMC"], True),
         (snd, "snd", ["snow_depth"], True),
-        (tas.time.dt.month, "month", ["DC", "DMC"], True),
+        (time_field(tas, "month"), "month", ["DC", "DMC"], True),
         (lat, "lat", ["DC", "DMC"], False),
         (dc0, "dc0", ["DC"], False),
         (dmc0, "dmc0", ["DMC"], False),
@@ -6,10 +6,16 @@ Generic indices submodule
 
 Helper functions for common generic actions done in the computation of indices.
 """
+from functools import partial
 from typing import Union
 
+import bottleneck as bn
 import numpy as np
 import xarray as xr
+from dask import array as dsk
+
+from xclim.core.calendar import time_field, time_index_info
+from xclim.core.utils import ensure_chunk_size, float_dtype
 
 __all__ = [
     "select_time",
@@ -20,6 +26,11 @@ __all__ = [
     "threshold_count",
     "get_daily_events",
     "daily_downsampler",
+    "rolling_sum",
+    "rolling_mean",
+    "rolling_all",
+    "rolling_any",
+    "rolling_threshold_count",
 ]
 
 
@@ -44,7 +55,7 @@ def select_time(da: xr.DataArray, **indexer):
         selected = da
     else:
         key, val = indexer.popitem()
-        time_att = getattr(da.time.dt, key)
+        time_att = time_field(da, key)
         selected = da.sel(time=time_att.isin(val)).dropna(dim="time")
 
     return selected
@@ -83,7 +94,7 @@ def select_resample_op(da: xr.DataArray, op: str, freq: str = "YS", **indexer):
 def doymax(da: xr.DataArray):
     """Return the day of year of the maximum value."""
     i = da.argmax(dim="time")
-    out = da.time.dt.dayofyear[i]
+    out = time_field(da, "dayofyear")[i]
     out.attrs["units"] = ""
     return out
 
@@ -91,7 +102,7 @@ def doymax(da: xr.DataArray):
 def doymin(da: xr.DataArray):
     """Return the day of year of the minimum value."""
     i = da.argmin(dim="time")
-    out = da.time.dt.dayofyear[i]
+    out = time_field(da, "dayofyear")[i]
     out.attrs["units"] = ""
     return out
 
@@ -229,17 +240,10 @@ def daily_downsampler(da: xr.DataArray, freq: str = "YS") -> xr.DataArray:
             x2 = x2.sortby('time')
     """
     # generate tags from da.time and freq
-    if isinstance(da.time.values[0], np.datetime64):
-        years = [f"{y:04d}" for y in da.time.dt.year.values]
-        months = [f"{m:02d}" for m in da.time.dt.month.values]
-    else:
-        # cannot use year, month, season attributes, not available for all calendars ...
-        years = [f"{v.year:04d}" for v in da.time.values]
-        months = [f"{v.month:02d}" for v in da.time.values]
-    seasons = [
-        "DJF DJF MAM MAM MAM JJA JJA JJA SON SON SON DJF".split()[int(m) - 1]
-        for m in months
-    ]
+    info = time_index_info(da)
+    years = [f"{y:04d}" for y in info.year]
+    months = [f"{m:02d}" for m in info.month]
+    seasons = list(info.season)
 
     n_t = da.time.size
     if freq == "YS":
@@ -269,3 +273,182 @@ def daily_downsampler(da: xr.DataArray, freq: str = "YS") -> xr.DataArray:
 
     # return groupby according to tags
     return buffer.groupby("tags")
+
+
+def _rolling_kernel(
+    arr: np.ndarray, window: int, how: str, dtype=np.float64
+) -> np.ndarray:
+    """Reduce the trailing windows of `window` elements along the last axis of a numpy array.
+
+    Float sums and means use bottleneck's moving window functions. Booleans and integers are summed exactly from
+    their cumulative sum. Sums and means are returned with the floating point `dtype`.
+    """
+    if how in ["sum", "mean"] and arr.dtype.kind == "f":
+        if arr.shape[-1] < window:
+            return np.full(arr.shape, np.nan, dtype=dtype)
+        out = getattr(bn, f"move_{how}")(arr, window, axis=-1)
+        return out.astype(dtype, copy=False)
+
+    cumsum = np.cumsum(arr, axis=-1, dtype=np.int64)
+    total = cumsum.copy()
+    total[..., window:] -= cumsum[..., :-window]
+    if how == "all":
+        return total == window
+    if how == "any":
+        out = total > 0
+        out[..., : window - 1] = False
+        return out
+
+    out = total.astype(dtype)
+    out[..., : window - 1] = np.nan
+    if how == "mean":
+        out /= window
+    return out
+
+
+def _rolling(da: xr.DataArray, window: int, dim: str, how: str) -> xr.DataArray:
+    """Apply `_rolling_kernel` along `dim`, on each block of dask arrays, with the boundaries handled by `map_overlap`."""
+    fdtype = float_dtype(da)
+    dtype = bool if how in ["all", "any"] else fdtype
+    kernel = partial(_rolling_kernel, window=window, how=how, dtype=fdtype)
+
+    def _func(arr):
+        if isinstance(arr, dsk.Array):
+            if arr.numblocks[-1] == 1:
+                # A single block can be shorter than the window, but has no boundaries to handle.
+                return arr.map_blocks(kernel, dtype=dtype)
+            # Each block is extended with the last window - 1 elements of the previous one.
+            return arr.map_overlap(
+                kernel,
+                depth={arr.ndim - 1: window - 1},
+                boundary="none",
+                dtype=dtype,
+            )
+        return kernel(arr)
+
+    da = ensure_chunk_size(da, **{dim: min(window - 1, da[dim].size)})
+    out = xr.apply_ufunc(
+        _func,
+        da,
+        input_core_dims=[[dim]],
+        output_core_dims=[[dim]],
+        dask="allowed",
+        keep_attrs=True,
+    )
+    return out.transpose(*da.dims)
+
+
+def rolling_sum(da: xr.DataArray, window: int, dim: str = "time") -> xr.DataArray:
+    """Sum over a moving window.
+
+    Equivalent to ``da.rolling({dim: window}).sum(skipna=False)``, but with compiled moving window functions and
+    without requiring a single chunk along `dim`. Each sum is labeled with the last element of its window.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+      Input data.
+    window : int
+      Number of elements in the window.
+    dim : str
+      Dimension along which the window moves.
+
+    Returns
+    -------
+    xr.DataArray
+      Sum of the `window` elements ending at each position, NaN for the first `window - 1` positions and for
+      the windows including a NaN.
+    """
+    return _rolling(da, window, dim, "sum")
+
+
+def rolling_mean(da: xr.DataArray, window: int, dim: str = "time") -> xr.DataArray:
+    """Mean over a moving window.
+
+    Equivalent to ``da.rolling({dim: window}).mean(skipna=False)``, see :py:func:`rolling_sum`.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+      Input data.
+    window : int
+      Number of elements in the window.
+    dim : str
+      Dimension along which the window moves.
+
+    Returns
+    -------
+    xr.DataArray
+      Mean of the `window` elements ending at each position, NaN for the first `window - 1` positions and for
+      the windows including a NaN.
+    """
+    return _rolling(da, window, dim, "mean")
+
+
+def rolling_all(da: xr.DataArray, window: int, dim: str = "time") -> xr.DataArray:
+    """Whether all elements of a moving window are True.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+      Boolean input data.
+    window : int
+      Number of elements in the window.
+    dim : str
+      Dimension along which the window moves.
+
+    Returns
+    -------
+    xr.DataArray
+      True where the `window` elements ending at each position are all True. False for the first `window - 1`
+      positions.
+    """
+    return _rolling(da, window, dim, "all")
+
+
+def rolling_any(da: xr.DataArray, window: int, dim: str = "time") -> xr.DataArray:
+    """Whether any element of a moving window is True.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+      Boolean input data.
+    window : int
+      Number of elements in the window.
+    dim : str
+      Dimension along which the window moves.
+
+    Returns
+    -------
+    xr.DataArray
+      True where any of the `window` elements ending at each position is True. False for the first `window - 1`
+      positions.
+    """
+    return _rolling(da, window, dim, "any")
+
+
+def rolling_threshold_count(
+    da: xr.DataArray, op: str, thresh: Union[float, int], window: int, dim="time"
+) -> xr.DataArray:
+    """Count the elements of a moving window meeting a threshold condition.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+      Input data.
+    op : {">", "<", ">=", "<=", "gt", "lt", "ge", "le"}
+      Logical operator {>, <, >=, <=, gt, lt, ge, le }. e.g. arr > thresh.
+    thresh : Union[float, int]
+      Threshold value.
+    window : int
+      Number of elements in the window.
+    dim : str
+      Dimension along which the window moves.
+
+    Returns
+    -------
+    xr.DataArray
+      The number of elements meeting the condition among the `window` elements ending at each position, NaN for
+      the first `window - 1` positions.
+    """
+    return _rolling(compare(da, op, thresh), window, dim, "sum")
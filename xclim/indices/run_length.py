@@ -15,6 +15,11 @@ import numpy as np
 import xarray as xr
 from dask import array as dsk
 
+from xclim.core.calendar import time_index_info
+from xclim.core.utils import float_dtype
+
+from .generic import rolling_sum
+
 npts_opt = 9000
 
 
@@ -50,18 +55,17 @@ def rle(
     xr.DataArray
     """
     n = len(da[dim])
+    dtype = float_dtype()
     # Need to chunk here to ensure the broadcasting is not made in memory
-    i = xr.DataArray(np.arange(da[dim].size), dims=dim).chunk({"time": -1})
+    i = xr.DataArray(np.arange(da[dim].size, dtype=dtype), dims=dim).chunk({dim: -1})
     ind, da = xr.broadcast(i, da)
     # Rechunk, but with broadcasted da
     ind = ind.chunk(da.chunks)
     b = ind.where(~da)  # find indexes where false
-    end1 = (
-        da.where(b[dim] == b[dim][-1], drop=True) * 0 + n
-    )  # add additional end value index (deal with end cases)
-    start1 = (
-        da.where(b[dim] == b[dim][0], drop=True) * 0 - 1
-    )  # add additional start index (deal with end cases)
+    # add additional end value index (deal with end cases)
+    end1 = (da.where(b[dim] == b[dim][-1], drop=True) * 0 + n).astype(dtype)
+    # add additional start index (deal with end cases)
+    start1 = (da.where(b[dim] == b[dim][0], drop=True) * 0 - 1).astype(dtype)
     b = xr.concat([start1, b, end1], dim)
 
     # Ensure bfill operates on entire (unchunked) time dimension
@@ -243,13 +247,15 @@ def first_run(
 
     else:
         da = da.astype("int")
-        i = xr.DataArray(np.arange(da[dim].size), dims=dim)
+        i = xr.DataArray(np.arange(da[dim].size, dtype=float_dtype()), dims=dim)
         ind = xr.broadcast(i, da)[0].transpose(*da.dims)
         if isinstance(da.data, dsk.Array):
             ind = ind.chunk(da.chunks)
-        wind_sum = da.rolling(time=window).sum(skipna=False)
+        wind_sum = rolling_sum(da, window, dim=dim)
         out = ind.where(wind_sum >= window).min(dim=dim) - (window - 1)
         # remove window - 1 as rolling result index is last element of the moving window
+        # 1D reductions can return a float64 scalar
+        out = out.astype(ind.dtype)
 
     if coord:
         crd = da[dim]
@@ -720,7 +726,7 @@ def first_run_ufunc(
         input_core_dims=[[dim]],
         vectorize=True,
         dask="parallelized",
-        output_dtypes=[np.float],
+        output_dtypes=[float_dtype()],
         keep_attrs=True,
         kwargs={"window": window},
     )
@@ -835,16 +841,15 @@ def index_of_date(
     """
     if date is None:
         return np.array([default])
+    info = time_index_info(time, time.dims[0])
     try:
         date = datetime.strptime(date, "%Y-%m-%d")
-        year_cond = time.dt.year == date.year
+        year_cond = info.year == date.year
     except ValueError:
         date = datetime.strptime(date, "%m-%d")
         year_cond = True
 
-    idxs = np.where(
-        year_cond & (time.dt.month == date.month) & (time.dt.day == date.day)
-    )[0]
+    idxs = np.where(year_cond & (info.month == date.month) & (info.day == date.day))[0]
     if max_idxs is not None and idxs.size > max_idxs:
         raise ValueError(
             f"More than {max_idxs} instance of date {date} found in the coordinate array."
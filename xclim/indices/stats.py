@@ -5,6 +5,7 @@ from typing import Optional, Sequence, Union
 import dask.array
 import numpy as np
 import xarray as xr
+from scipy.special import comb, gammaln
 
 from xclim.core.formatting import (
     prefix_attrs,
@@ -67,52 +68,64 @@ def fit(da: xr.DataArray, dist: str = "norm", method="ML"):
     -----
     Coordinates for which all values are NaNs will be dropped before fitting the distribution. If the array
     still contains NaNs, the distribution parameters will be returned as NaNs.
+
+    For the gamma, genextreme, gumbel_r, norm and weibull_min distributions, the ML method optimizes the
+    likelihood of all coordinates together, using damped Newton iterations starting from the PWM estimates
+    (when valid) of the standardized series. The likelihood of some distributions (ex: gamma with a shape parameter
+    below 1) is unbounded near the sample minimum, and such fits do not converge: these coordinates are fitted
+    by `scipy.stats`, as are all coordinates for other distributions.
+
+    The PWM method computes the sample L-moments and the parameters of all coordinates at once with array
+    operations, using the same estimators and approximations as the `lmoments3` library, which is not needed.
+    Parameters are NaN where the series has too few values or where the L-moments are invalid for the distribution.
     """
     method_name = {"ML": "maximum likelihood", "PWM": "probability weighted moments"}
 
     # Get the distribution
     dc = get_dist(dist)
-    if method == "PWM":
-        lm3dc = get_lm3_dist(dist)
+    if method == "PWM" and dist not in _pwm_fitters:
+        raise ValueError(
+            f"The {dist} distribution is not supported by the PWM method. "
+            f"Supported distributions are: {', '.join(_pwm_fitters.keys())}."
+        )
 
     shape_params = [] if dc.shapes is None else dc.shapes.split(",")
     dist_params = shape_params + ["loc", "scale"]
 
-    # Fit the parameters.
-    # This would also be the place to impose constraints on the series minimum length if needed.
-    def fitfunc(arr):
-        """Fit distribution parameters."""
-        x = np.ma.masked_invalid(arr).compressed()
-
-        # Return NaNs if array is empty.
-        if len(x) <= 1:
-            return [np.nan] * len(dist_params)
-
-        # Estimate parameters
-        if method == "ML":
-            args, kwargs = _fit_start(x, dist)
-            params = dc.fit(x, *args, **kwargs)
-        elif method == "PWM":
-            params = list(lm3dc.lmom_fit(x).values())
-
-        # Fill with NaNs if one of the parameters is NaN
-        if np.isnan(params).any():
-            params[:] = np.nan
-
-        return params
+    # Dimensions for the distribution parameters
+    dims = [d if d != "time" else "dparams" for d in da.dims]
 
-    # xarray.apply_ufunc does not yet support multiple outputs with dask parallelism.
-    duck = dask.array if isinstance(da.data, dask.array.Array) else np
-    data = duck.apply_along_axis(fitfunc, da.get_axis_num("time"), da)
+    if method == "PWM" or dist in _ml_fitters:
+        # All grid cells are fitted at once, with array operations.
+        if method == "PWM":
+            func, kwargs = _fit_pwm, dict(nmom=len(dist_params))
+        else:
+            func, kwargs = _fit_ml, {}
+        data = xr.apply_ufunc(
+            func,
+            da,
+            input_core_dims=[["time"]],
+            output_core_dims=[["dparams"]],
+            dask="parallelized",
+            output_dtypes=[float],
+            dask_gufunc_kwargs=dict(
+                output_sizes={"dparams": len(dist_params)},
+                allow_rechunk=True,
+            ),
+            kwargs=dict(dist=dist, **kwargs),
+        )
+        data = data.transpose(*dims).data
+    else:
+        # Fit the parameters of each grid cell with scipy.
+        # xarray.apply_ufunc does not yet support multiple outputs with dask parallelism.
+        duck = dask.array if isinstance(da.data, dask.array.Array) else np
+        data = duck.apply_along_axis(_fit_scipy, da.get_axis_num("time"), da, dist)
 
     # Coordinates for the distribution parameters
     coords = dict(da.coords.items())
     coords.pop("time")
     coords["dparams"] = dist_params
 
-    # Dimensions for the distribution parameters
-    dims = [d if d != "time" else "dparams" for d in da.dims]
-
     out = xr.DataArray(data=data, coords=coords, dims=dims)
     out.attrs = prefix_attrs(
         da.attrs, ["standard_name", "long_name", "units", "description"], "original_"
@@ -160,28 +173,29 @@ def parametric_quantile(p: xr.DataArray, q: Union[int, Sequence]):
     dist = p.attrs["scipy_dist"]
     dc = get_dist(dist)
 
-    # Create a lambda function to facilitate passing arguments to dask. There is probably a better way to do this.
-    if np.all(q > 0.5):
-
-        def func(x):
-            return dc.isf(1 - q, *x)
-
-    else:
-
-        def func(x):
-            return dc.ppf(q, *x)
-
-    duck = dask.array if isinstance(p.data, dask.array.Array) else np
-    data = duck.apply_along_axis(func, p.get_axis_num("dparams"), p)
-
-    # Create coordinate for the return periods
-    coords = dict(p.coords.items())
-    coords.pop("dparams")
-    coords["quantile"] = q
     # Create dimensions
     dims = [d if d != "dparams" else "quantile" for d in p.dims]
 
-    out = xr.DataArray(data=data, coords=coords, dims=dims)
+    # The parameters of all cells are broadcast against the quantiles, in a single call per block.
+    if np.all(q > 0.5):
+        func, qs = dc.isf, 1 - q
+    else:
+        func, qs = dc.ppf, q
+    qs = xr.DataArray(qs, dims=("quantile",))
+    out = (
+        xr.apply_ufunc(
+            _parametric_quantile,
+            p,
+            qs,
+            input_core_dims=[["dparams"], []],
+            dask="parallelized",
+            output_dtypes=[float],
+            dask_gufunc_kwargs=dict(allow_rechunk=True),
+            kwargs=dict(func=func),
+        )
+        .transpose(*dims)
+        .assign_coords(quantile=q)
+    )
     out.attrs = unprefix_attrs(p.attrs, ["units", "standard_name"], "original_")
 
     attrs = dict(
@@ -198,8 +212,19 @@ def parametric_quantile(p: xr.DataArray, q: Union[int, Sequence]):
     return out
 
 
+def _parametric_quantile(params, q, func):
+    """Apply `func` (ppf or isf) to `q` with the distribution parameters along the last axis of `params`."""
+    return func(q, *np.moveaxis(params, -1, 0))
+
+
 def fa(
-    da: xr.DataArray, t: Union[int, Sequence], dist: str = "norm", mode: str = "max"
+    da: xr.DataArray,
+    t: Union[int, Sequence],
+    dist: str = "norm",
+    mode: str = "max",
+    bootstrap: int = 0,
+    ci: Sequence[float] = (0.05, 0.95),
+    random_state: Optional[Union[int, np.random.RandomState]] = None,
 ):
     """Return the value corresponding to the given return period.
 
@@ -215,14 +240,26 @@ def fa(
       (see scipy.stats).
     mode : {'min', 'max}
       Whether we are looking for a probability of exceedance (max) or a probability of non-exceedance (min).
+    bootstrap : int
+      Number of bootstrap samples. If larger than 0, the `ci` quantiles of the return values estimated from
+      the resampled series are returned instead of the return values.
+    ci : Sequence[float]
+      Quantiles of the bootstrap distribution of the return values, for example the bounds of a confidence interval.
+    random_state : Optional[Union[int, np.random.RandomState]]
+      Seed or random number generator used to draw the bootstrap samples.
 
     Returns
     -------
     xarray.DataArray
-      An array of values with a 1/t probability of exceedance (if mode=='max').
+      An array of values with a 1/t probability of exceedance (if mode=='max'). With `bootstrap`, the array
+      has a `ci` dimension along the quantiles of the bootstrap distribution of these values.
+
+    Notes
+    -----
+    The bootstrap samples are drawn with replacement from the input series, the same for all grid cells, and
+    stacked along a `sample` dimension. The samples are fitted together, in blocks of `sample` computed in parallel
+    by dask. If the input is not a dask array, the output is computed before being returned.
     """
-    # Fit the parameters of the distribution
-    p = fit(da, dist)
     t = np.atleast_1d(t)
 
     if mode in ["max", "high"]:
@@ -234,16 +271,51 @@ def fa(
     else:
         raise ValueError(f"Mode `{mode}` should be either 'max' or 'min'.")
 
+    lazy = isinstance(da.data, dask.array.Array)
+    if bootstrap:
+        da = _bootstrap_samples(da, bootstrap, random_state)
+
+    # Fit the parameters of the distribution
+    p = fit(da, dist)
+
     # Compute the quantiles
     out = (
         parametric_quantile(p, q)
         .rename({"quantile": "return_period"})
         .assign_coords(return_period=t)
     )
+
+    if bootstrap:
+        out = out.chunk({"sample": -1})
+        out = out.quantile(ci, dim="sample", keep_attrs=True).rename(quantile="ci")
+        out.attrs["bootstrap"] = bootstrap
+        if not lazy:
+            out = out.load()
+
     out.attrs["mode"] = mode
     return out
 
 
+def _bootstrap_samples(da, n, random_state=None, block=10000):
+    """Return `n` series resampled with replacement along `time`, stacked along a new `sample` dimension.
+
+    The output is a dask array, chunked along `sample` so that each block holds about `block` series.
+    """
+    rng = random_state
+    if not isinstance(rng, np.random.RandomState):
+        rng = np.random.RandomState(rng)
+    idx = rng.randint(0, da.time.size, size=(n, da.time.size))
+
+    da = da.chunk({"time": -1})
+    cells = np.prod([max(c) for d, c in zip(da.dims, da.chunks) if d != "time"])
+    return (
+        da.drop_vars("time")
+        .isel(time=xr.DataArray(idx, dims=("sample", "time")))
+        .assign_coords(time=da.time)
+        .chunk({"sample": max(1, block // cells), "time": -1})
+    )
+
+
 def frequency_analysis(
     da: xr.DataArray,
     mode: str,
@@ -251,6 +323,9 @@ def frequency_analysis(
     dist: str,
     window: int = 1,
     freq: Optional[str] = None,
+    bootstrap: int = 0,
+    ci: Sequence[float] = (0.05, 0.95),
+    random_state: Optional[Union[int, np.random.RandomState]] = None,
     **indexer,
 ):
     """Return the value corresponding to a return period.
@@ -272,6 +347,13 @@ def frequency_analysis(
     freq : str
       Resampling frequency. If None, the frequency is assumed to be 'YS' unless the indexer is season='DJF',
       in which case `freq` would be set to `AS-DEC`.
+    bootstrap : int
+      Number of bootstrap samples of the period extremes. If larger than 0, the `ci` quantiles of the bootstrap
+      distribution of the return values are returned, see :py:func:`fa`.
+    ci : Sequence[float]
+      Quantiles of the bootstrap distribution of the return values, for example the bounds of a confidence interval.
+    random_state : Optional[Union[int, np.random.RandomState]]
+      Seed or random number generator used to draw the bootstrap samples.
     **indexer : {dim: indexer, }, optional
       Time attribute and values over which to subset the array. For example, use season='DJF' to select winter values,
       month=1 to select January, or month=[6,7,8] to select summer months. If not indexer is given, all values are
@@ -286,7 +368,7 @@ def frequency_analysis(
     # Apply rolling average
     attrs = da.attrs.copy()
     if window > 1:
-        da = da.rolling(time=window).mean(skipna=False)
+        da = generic.rolling_mean(da, window)
         da.attrs.update(attrs)
 
     # Assign default resampling frequency if not provided
@@ -296,7 +378,15 @@ def frequency_analysis(
     sel = generic.select_resample_op(da, op=mode, freq=freq, **indexer)
 
     # Frequency analysis
-    return fa(sel, t, dist, mode)
+    return fa(
+        sel,
+        t,
+        dist,
+        mode,
+        bootstrap=bootstrap,
+        ci=ci,
+        random_state=random_state,
+    )
 
 
 def get_dist(dist):
@@ -325,6 +415,446 @@ def get_lm3_dist(dist):
     return getattr(lmoments3.distr, _lm3_dist_map[dist])
 
 
+def _sample_lmoments(x, nmom):
+    """Return the sample L-moments l1, l2 and L-moment ratios t3, t4, ... along the last axis.
+
+    The L-moments are computed from the unbiased estimators of the probability weighted moments,
+    all series at once. NaNs are ignored.
+    """
+    x = np.sort(x, axis=-1)  # NaNs are sorted last
+    valid = ~np.isnan(x)
+    n = valid.sum(axis=-1, keepdims=True)
+    x = np.where(valid, x, 0)
+    rank = np.arange(x.shape[-1])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # b_r = 1/n sum_i C(i, r) / C(n - 1, r) x_i
+        w = np.ones(x.shape)
+        b = [x.sum(axis=-1) / n[..., 0]]
+        for r in range(1, nmom):
+            w = w * (rank - r + 1) / (n - r)
+            b.append((w * x).sum(axis=-1) / n[..., 0])
+
+        # l_{r+1} = sum_k p*_{r,k} b_k, with the shifted Legendre polynomials coefficients.
+        lmom = []
+        for r in range(nmom):
+            coefs = [
+                (-1) ** (r - k) * comb(r, k, exact=True) * comb(r + k, k, exact=True)
+                for k in range(r + 1)
+            ]
+            lmom.append(sum(c * bk for c, bk in zip(coefs, b)))
+        lmom[2:] = [lm / lmom[1] for lm in lmom[2:]]
+
+    # Not enough values for the requested L-moments.
+    return [np.where(n[..., 0] > nmom, lm, np.nan) for lm in lmom]
+
+
+def _pwm_expon(l1, l2):
+    return np.where(l2 > 0, l1 - 2 * l2, np.nan), 2 * l2
+
+
+def _pwm_gamma(l1, l2, t3):
+    # t3 is not used, but like lmoments3, we require enough values to estimate it.
+    a1, a2, a3 = -0.3080, -0.05812, 0.01765
+    b1, b2, b3, b4 = 0.7213, -0.5947, -2.1817, 1.2113
+
+    cv = np.where((l1 > l2) & (l2 > 0), l2 / l1, np.nan)
+    t = np.where(cv >= 0.5, 1 - cv, np.pi * cv ** 2)
+    alpha = np.where(
+        cv >= 0.5,
+        t * (b1 + t * b2) / (1 + t * (b3 + t * b4)),
+        (1 + a1 * t) / (t * (1 + t * (a2 + t * a3))),
+    )
+    return alpha, np.zeros_like(alpha), l1 / alpha
+
+
+def _pwm_genextreme(l1, l2, t3, eu=0.57721566, small=1e-5, eps=1e-6, maxit=20):
+    dl2, dl3 = np.log(2), np.log(3)
+    a0, a1, a2, a3, a4 = 0.28377530, -1.21096399, -2.50728214, -1.13455566, -0.07138022
+    b1, b2, b3 = 2.06189696, 1.31912239, 0.25077104
+    c1, c2, c3 = 1.59921491, -0.48832213, 0.01573152
+    d1, d2 = -0.64363929, 0.08985247
+
+    t3 = np.where((l2 > 0) & (np.abs(t3) < 1), t3, np.nan)
+
+    # Rational approximations of the shape parameter, for negative and positive t3.
+    z = 1 - t3
+    g = np.where(
+        t3 <= 0,
+        (a0 + t3 * (a1 + t3 * (a2 + t3 * (a3 + t3 * a4))))
+        / (1 + t3 * (b1 + t3 * (b2 + t3 * b3))),
+        (-1 + z * (c1 + z * (c2 + z * c3))) / (1 + z * (d1 + z * d2)),
+    )
+
+    # For t3 < -0.8, the approximation is refined with Newton-Raphson iterations.
+    newton = t3 < -0.8
+    if np.any(newton):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            g = np.where(t3 <= -0.97, 1 - np.log(1 + t3) / dl2, g)
+            t0 = (t3 + 3) * 0.5
+            todo = newton.copy()
+            for _ in range(1, maxit):
+                x2 = 2.0 ** -g
+                x3 = 3.0 ** -g
+                xx2 = 1 - x2
+                xx3 = 1 - x3
+                deriv = (xx2 * x3 * dl3 - xx3 * x2 * dl2) / xx2 ** 2
+                gnew = g - (xx3 / xx2 - t0) / deriv
+                converged = np.abs(gnew - g) <= eps * gnew
+                g = np.where(todo, gnew, g)
+                todo = todo & ~converged
+                if not todo.any():
+                    break
+        g = np.where(todo, np.nan, g)
+
+    gumbel = (t3 > 0) & (np.abs(g) < small)
+    g = np.where(gumbel, 0, g)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gam = np.exp(gammaln(1 + g))
+        scale = np.where(gumbel, l2 / dl2, l2 * g / (gam * (1 - 2.0 ** -g)))
+        loc = np.where(gumbel, l1 - eu * scale, l1 - scale * (1 - gam) / g)
+    return g, loc, scale
+
+
+def _pwm_genpareto(l1, l2, t3):
+    g = np.where((l2 > 0) & (np.abs(t3) < 1), (1 - 3 * t3) / (1 + t3), np.nan)
+    scale = (1 + g) * (2 + g) * l2
+    return -g, l1 - scale / (1 + g), scale
+
+
+def _pwm_gumbel_r(l1, l2, eu=0.577215664901532861):
+    scale = np.where(l2 > 0, l2 / np.log(2), np.nan)
+    return l1 - eu * scale, scale
+
+
+def _pwm_norm(l1, l2):
+    return np.where(l2 > 0, l1, np.nan), l2 * np.sqrt(np.pi)
+
+
+def _pwm_pearson3(l1, l2, t3, small=1e-6):
+    c1, c2, c3 = 0.2906, 0.1882, 0.0442
+    d1, d2, d3, d4, d5, d6 = 0.36067, -0.59567, 0.25361, -2.78861, 2.56096, -0.77045
+
+    at3 = np.where((l2 > 0) & (np.abs(t3) < 1), np.abs(t3), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(at3 >= 1 / 3, 1 - at3, 3 * np.pi * at3 * at3)
+        alpha = np.where(
+            at3 >= 1 / 3,
+            t * (d1 + t * (d2 + t * d3)) / (1 + t * (d4 + t * (d5 + t * d6))),
+            (1 + c1 * t) / (t * (1 + t * (c2 + t * c3))),
+        )
+        rtalph = np.sqrt(alpha)
+        beta = np.sqrt(np.pi) * l2 * np.exp(gammaln(alpha) - gammaln(alpha + 0.5))
+
+    normal = at3 <= small
+    skew = np.where(normal, 0, np.sign(t3) * 2 / rtalph)
+    scale = np.where(normal, l2 * np.sqrt(np.pi), beta * rtalph)
+    return skew, np.where(np.isnan(at3), np.nan, l1), scale
+
+
+def _pwm_weibull_min(l1, l2, t3, gumbel_t3=0.16992500144231237):
+    t3 = np.where((t3 < 1) & (t3 > -gumbel_t3), t3, np.nan)
+    c, loc, scale = _pwm_genextreme(-l1, l2, -t3)
+    delta = 1 / c
+    beta = scale / c
+    return delta, -loc - beta, beta
+
+
+# PWM estimators of the distribution parameters from the L-moments, by scipy distribution name.
+_pwm_fitters = {
+    "expon": _pwm_expon,
+    "gamma": _pwm_gamma,
+    "genextreme": _pwm_genextreme,
+    "genpareto": _pwm_genpareto,
+    "gumbel_r": _pwm_gumbel_r,
+    "norm": _pwm_norm,
+    "pearson3": _pwm_pearson3,
+    "weibull_min": _pwm_weibull_min,
+}
+
+
+def _fit_pwm(arr, dist, nmom):
+    """Fit a distribution by the PWM method along the last axis of `arr`, returning the parameters along the last axis.
+
+    As in `lmoments3`, the number of L-moments used, `nmom`, is the number of distribution parameters
+    and at least `nmom + 1` valid values are needed.
+    """
+    lmom = _sample_lmoments(arr, nmom)
+    params = np.stack(np.broadcast_arrays(*_pwm_fitters[dist](*lmom)), axis=-1)
+
+    # Fill with NaNs if one of the parameters is NaN
+    return np.where(np.isnan(params).any(axis=-1, keepdims=True), np.nan, params)
+
+
+def _wmean(a, valid):
+    """Mean of `a` along the last axis, over the `valid` values only."""
+    return np.where(valid, a, 0).sum(axis=-1) / valid.sum(axis=-1)
+
+
+# Standardized log-density f(z, *shapes) of the distributions fitted by the batched ML engine and its derivative
+# with respect to z. Both are computed for all cells at once, with z of shape (cells, values) and the shape
+# parameters of shape (cells, 1). Values outside the support have a log-density of -inf or NaN.
+def _ml_logpdf_genextreme(z, c):
+    c0 = c == 0
+    c = np.where(c0, 1, c)
+    lt = np.log1p(-c * z)
+    tc = np.exp(lt / c)
+    ez = np.exp(-z)
+    f = np.where(c0, -z - ez, (1 / c - 1) * lt - tc)
+    fz = np.where(c0, ez - 1, (tc - 1 + c) / np.exp(lt))
+    return f, fz
+
+
+def _ml_logpdf_gumbel_r(z):
+    ez = np.exp(-z)
+    return -z - ez, ez - 1
+
+
+def _ml_logpdf_gamma(z, a):
+    f = np.where(z > 0, (a - 1) * np.log(z) - z - gammaln(a), -np.inf)
+    return f, (a - 1) / z - 1
+
+
+def _ml_logpdf_weibull_min(z, c):
+    f = np.where(z > 0, np.log(c) + (c - 1) * np.log(z) - z ** c, -np.inf)
+    return f, (c - 1) / z - c * z ** (c - 1)
+
+
+# Starting parameters of the ML optimization, for data standardized to a zero mean and a unit variance.
+# Each function returns a list of candidates, the first one with a finite likelihood is used. The last
+# candidate must have a finite likelihood for all samples with at least two different values.
+def _ml_start_genextreme(z, valid, lmom):
+    c, loc, scale = _pwm_genextreme(*lmom)
+    s = np.full(len(z), np.sqrt(6) / np.pi)
+    return [(c, loc, scale), (np.zeros(len(z)), -0.57722 * s, s)]
+
+
+def _ml_start_gumbel_r(z, valid, lmom):
+    s = np.full(len(z), np.sqrt(6) / np.pi)
+    return [_pwm_gumbel_r(*lmom[:2]), (-0.57722 * s, s)]
+
+
+def _ml_start_gamma(z, valid, lmom):
+    # Three-parameters gamma from the PWM estimates of the Pearson type III distribution.
+    skew, mean, sd = _pwm_pearson3(*lmom)
+    skew = np.where(skew > 0, skew, np.nan)
+    a = 4 / skew ** 2
+    scale = sd * skew / 2
+    # Moments of the data shifted by a fraction of the standard deviation below the minimum.
+    zmin = np.where(valid, z, np.inf).min(axis=-1)
+    my = _wmean(z - zmin[:, np.newaxis] + 0.5, valid)
+    return [(a, mean - a * scale, scale), (my ** 2, zmin - 0.5, 1 / my)]
+
+
+def _ml_start_weibull_min(z, valid, lmom):
+    # Same as `_fit_start`, with all cells at once.
+    loc = np.where(valid, z, np.inf).min(axis=-1) - 0.01
+    ly = np.log(z - loc[:, np.newaxis])
+    mly = _wmean(ly, valid)
+    c = np.pi / np.sqrt(6) / np.sqrt(_wmean((ly - mly[:, np.newaxis]) ** 2, valid))
+    scale = _wmean(np.exp(ly * c[:, np.newaxis]), valid) ** (1 / c)
+    return [_pwm_weibull_min(*lmom), (c, loc, scale)]
+
+
+# Distributions supported by the batched ML engine: log-density, starting parameters and whether the
+# shape parameter is optimized in log-space (that is, must be positive). The three-parameter lognormal is
+# left to scipy: its likelihood is unbounded as the location approaches the sample minimum, so the result
+# depends on the path of the optimizer.
+_ml_fitters = {
+    "gamma": (_ml_logpdf_gamma, _ml_start_gamma, True),
+    "genextreme": (_ml_logpdf_genextreme, _ml_start_genextreme, False),
+    "gumbel_r": (_ml_logpdf_gumbel_r, _ml_start_gumbel_r, False),
+    "norm": (None, None, False),
+    "weibull_min": (_ml_logpdf_weibull_min, _ml_start_weibull_min, True),
+}
+
+
+def _ml_nll(theta, z, valid, logpdf, logshape, h=1e-5):
+    """Return the negative log-likelihood of all cells and its gradient with respect to the parameters.
+
+    The parameters `theta` are the shape parameters (or their logarithm if `logshape` is True), the location
+    and the logarithm of the scale, along the last axis. The derivatives with respect to the shape parameters
+    are estimated by central differences, with step `h`. The log-likelihood is infinite outside the support.
+    """
+    *shapes, loc, lscale = np.moveaxis(theta, -1, 0)
+    zs = (z - loc[:, np.newaxis]) * np.exp(-lscale)[:, np.newaxis]
+    n = valid.sum(axis=-1)
+
+    def _shape(t):
+        return (np.exp(t) if logshape else t)[:, np.newaxis]
+
+    def _sumf(f):
+        return np.where(valid, f, 0).sum(axis=-1)
+
+    with np.errstate(all="ignore"):
+        f, fz = logpdf(zs, *map(_shape, shapes))
+        nll = n * lscale - _sumf(f)
+        nll = np.where(np.isfinite(nll), nll, np.inf)
+
+        grad = []
+        for i, t in enumerate(shapes):
+            fp = logpdf(zs, *map(_shape, shapes[:i] + [t + h] + shapes[i + 1 :]))[0]
+            fm = logpdf(zs, *map(_shape, shapes[:i] + [t - h] + shapes[i + 1 :]))[0]
+            grad.append(-_sumf(fp - fm) / (2 * h))
+        grad.append(_sumf(fz) * np.exp(-lscale))
+        grad.append(n + _sumf(zs * fz))
+    return nll, np.stack(grad, axis=-1)
+
+
+def _ml_newton(theta, z, valid, logpdf, logshape, maxiter=100, gtol=1e-7, h=1e-4):
+    """Minimize the negative log-likelihood of all cells together, with damped Newton iterations.
+
+    The Hessian is estimated by central differences of the gradient, with step `h`. The damping of each cell
+    (Levenberg-Marquardt) is decreased after each successful step and increased when the likelihood does not
+    improve. Cells converge when all components of the gradient are below `gtol` times the sample size.
+
+    Returns the optimized parameters and a boolean array flagging the cells that converged.
+    """
+    m, npar = theta.shape
+    theta = theta.copy()
+    eye = np.eye(npar)
+    n = valid.sum(axis=-1)
+    nll, grad = _ml_nll(theta, z, valid, logpdf, logshape)
+    hess = np.zeros((m, npar, npar))
+    stale = np.ones(m, dtype=bool)
+    lam = np.full(m, 1e-3)
+    converged = np.zeros(m, dtype=bool)
+    active = np.isfinite(nll)
+
+    for _ in range(maxiter):
+        done = active & (np.abs(grad).max(axis=-1) <= gtol * n)
+        converged |= done
+        active &= ~done & (lam < 1e10)
+        if not active.any():
+            break
+
+        # Update the Hessian where the parameters have changed.
+        idx = np.flatnonzero(active & stale)
+        if idx.size:
+            th, zi, vi = theta[idx], z[idx], valid[idx]
+            cols = []
+            for j in range(npar):
+                gp = _ml_nll(th + h * eye[j], zi, vi, logpdf, logshape)[1]
+                gm = _ml_nll(th - h * eye[j], zi, vi, logpdf, logshape)[1]
+                cols.append((gp - gm) / (2 * h))
+            hj = np.stack(cols, axis=-1)
+            hj = (hj + np.swapaxes(hj, -1, -2)) / 2
+            bad = ~np.isfinite(hj).all(axis=(-1, -2))
+            hj[bad] = eye * n[idx][bad, np.newaxis, np.newaxis]
+            hess[idx] = hj
+            stale[idx] = False
+
+        idx = np.flatnonzero(active)
+        a = hess[idx] + lam[idx, np.newaxis, np.newaxis] * eye
+        try:
+            step = np.linalg.solve(a, -grad[idx][..., np.newaxis])[..., 0]
+        except np.linalg.LinAlgError:
+            step = -(np.linalg.pinv(a) @ grad[idx][..., np.newaxis])[..., 0]
+
+        new = theta[idx] + step
+        nll_new, grad_new = _ml_nll(new, z[idx], valid[idx], logpdf, logshape)
+        ok = nll_new <= nll[idx]
+        acc = idx[ok]
+        theta[acc], nll[acc], grad[acc] = new[ok], nll_new[ok], grad_new[ok]
+        stale[acc] = True
+        lam[idx] = np.where(ok, np.maximum(lam[idx] / 10, 1e-12), lam[idx] * 10)
+
+    return theta, converged
+
+
+def _fit_ml(arr, dist, maxiter=100, return_converged=False):
+    """Fit a distribution by maximum likelihood along the last axis of `arr`, all cells together.
+
+    The series are standardized and the optimization starts from the PWM estimates when they are valid.
+    Series where the optimization does not converge are fitted by scipy. Returns the parameters along the
+    last axis. Series with less than two different values give NaN parameters. If `return_converged` is True,
+    also returns a boolean array flagging the series fitted by the optimization, the other valid series being
+    the ones fitted by scipy.
+    """
+    logpdf, start, logshape = _ml_fitters[dist]
+    nshapes = (
+        0 if get_dist(dist).shapes is None else len(get_dist(dist).shapes.split(","))
+    )
+    x = arr.reshape(-1, arr.shape[-1])
+    valid = ~np.isnan(x)
+    out = np.full((len(x), nshapes + 2), np.nan)
+    flags = np.zeros(len(x), dtype=bool)
+
+    with np.errstate(all="ignore"):
+        mu = _wmean(x, valid)
+        sd = np.sqrt(_wmean((x - mu[:, np.newaxis]) ** 2, valid))
+    ok = (valid.sum(axis=-1) > 1) & (sd > 0)
+    mu, sd = mu[ok], sd[ok]
+
+    if dist == "norm":
+        # The ML estimators are the mean and standard deviation.
+        out[ok] = np.stack([mu, sd], axis=-1)
+        flags[ok] = True
+        return _ml_output(out, flags, arr.shape, return_converged)
+
+    valid = valid[ok]
+    z = np.where(valid, (x[ok] - mu[:, np.newaxis]) / sd[:, np.newaxis], 0)
+
+    def _to_theta(params):
+        *shapes, loc, scale = np.broadcast_arrays(*params)
+        shapes = [np.log(c) if logshape else c for c in shapes]
+        return np.stack(shapes + [loc, np.log(scale)], axis=-1)
+
+    with np.errstate(all="ignore"):
+        lmom = _sample_lmoments(np.where(valid, z, np.nan), 3)
+        starts = start(z, valid, lmom)
+        theta = _to_theta(starts[-1])
+        for params in starts[-2::-1]:
+            cand = _to_theta(params)
+            good = np.isfinite(_ml_nll(cand, z, valid, logpdf, logshape)[0])
+            theta[good] = cand[good]
+
+    theta, converged = _ml_newton(theta, z, valid, logpdf, logshape, maxiter=maxiter)
+
+    shapes = theta[:, :nshapes]
+    if logshape:
+        shapes = np.exp(shapes)
+    out[ok, :nshapes] = shapes
+    out[ok, nshapes] = mu + sd * theta[:, nshapes]
+    out[ok, nshapes + 1] = sd * np.exp(theta[:, nshapes + 1])
+
+    # The optimization didn't find a minimum, for example because the likelihood is unbounded.
+    flags[ok] = converged
+    for i in np.flatnonzero(ok)[~converged]:
+        out[i] = _fit_scipy(x[i], dist)
+    return _ml_output(out, flags, arr.shape, return_converged)
+
+
+def _ml_output(out, flags, shape, return_converged):
+    """Reshape the parameters, and the convergence flags if requested, to the shape of the input cells."""
+    out = out.reshape(shape[:-1] + (-1,))
+    if return_converged:
+        return out, flags.reshape(shape[:-1])
+    return out
+
+
+def _fit_scipy(arr, dist):
+    """Fit a distribution by maximum likelihood on the valid values of `arr`, with `scipy.stats`."""
+    # This would also be the place to impose constraints on the series minimum length if needed.
+    x = np.ma.masked_invalid(arr).compressed()
+    dc = get_dist(dist)
+
+    # Return NaNs if array is empty.
+    if len(x) <= 1:
+        nparams = 2 if dc.shapes is None else len(dc.shapes.split(",")) + 2
+        return [np.nan] * nparams
+
+    # Estimate parameters
+    args, kwargs = _fit_start(x, dist)
+    params = dc.fit(x, *args, **kwargs)
+
+    # Fill with NaNs if one of the parameters is NaN
+    if np.isnan(params).any():
+        params = np.full(len(params), np.nan)
+
+    return params
+
+
 def _fit_start(x, dist):
     """Return initial values for distribution parameters.
 
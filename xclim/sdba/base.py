@@ -7,6 +7,8 @@ import numpy as np
 import xarray as xr
 from boltons.funcutils import wraps
 
+from xclim.core.calendar import TimeIndexInfo, time_index_info
+
 
 # ## Base class for the sdba module
 class Parametrizable(dict):
@@ -166,6 +168,8 @@ class Grouper(Parametrizable):
             return da[self.dim]
 
         ind = da.indexes[self.dim]
+        if self.dim == "time" and self.prop in TimeIndexInfo.fields:
+            ind = time_index_info(ind)
         i = getattr(ind, self.prop)
 
         if not np.issubdtype(i.dtype, np.integer):
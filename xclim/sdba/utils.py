@@ -9,7 +9,7 @@ from boltons.funcutils import wraps
 from scipy.interpolate import griddata, interp1d
 
 from xclim.core.calendar import _interpolate_doy_calendar
-from xclim.core.utils import ensure_chunk_size
+from xclim.core.utils import ensure_chunk_size, float_dtype
 
 from .base import Grouper, parse_group
 
@@ -399,6 +399,7 @@ def interp_on_quantiles(
     """
     dim = group.dim
     prop = group.prop
+    dtype = float_dtype(yq)
 
     if prop is None:
         fill_value = "extrapolate" if method == "nearest" else np.nan
@@ -406,7 +407,7 @@ def interp_on_quantiles(
         def _interp_quantiles_1D(newx, oldx, oldy):
             return interp1d(
                 oldx, oldy, bounds_error=False, kind=method, fill_value=fill_value
-            )(newx)
+            )(newx).astype(dtype, copy=False)
 
         return xr.apply_ufunc(
             _interp_quantiles_1D,
@@ -417,7 +418,7 @@ def interp_on_quantiles(
             output_core_dims=[[dim]],
             vectorize=True,
             dask="parallelized",
-            output_dtypes=[np.float],
+            output_dtypes=[dtype],
         )
     # else:
 
@@ -429,13 +430,13 @@ def interp_on_quantiles(
                 "All-NaN slice encountered in interp_on_quantiles",
                 category=RuntimeWarning,
             )
-            return newx
+            return newx.astype(dtype, copy=False)
         return griddata(
             (oldx.flatten(), oldg.flatten()),
             oldy.flatten(),
             (newx, newg),
             method=method,
-        )
+        ).astype(dtype, copy=False)
 
     xq = add_cyclic_bounds(xq, prop, cyclic_coords=False)
     yq = add_cyclic_bounds(yq, prop, cyclic_coords=False)
@@ -459,7 +460,7 @@ def interp_on_quantiles(
         output_core_dims=[[dim]],
         vectorize=True,
         dask="parallelized",
-        output_dtypes=[yq.dtype],
+        output_dtypes=[dtype],
     )
 
 
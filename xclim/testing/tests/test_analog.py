@@ -1,6 +1,7 @@
 # Tests taken from flyingpigeon on Nov 2020
 import numpy as np
 import pytest
+import xarray as xr
 from numpy.testing import assert_almost_equal
 from scipy import integrate, stats
 
@@ -86,6 +87,86 @@ def test_spatial_analogs_multidim():
     assert out.attrs["indices"] == "meantemp,totalpr"
 
 
+@pytest.mark.parametrize("method", xca.metrics.keys())
+def test_spatial_analogs_multitarget(method):
+    # Targets and candidates are prepared once and compared to each other.
+    if method == "skezely_rizzo":
+        pytest.skip("Method not implemented.")
+    np.random.seed(3)
+    data = xr.Dataset(
+        {
+            v: (("time", "lat", "lon"), np.random.randn(20, 3, 4) + i)
+            for i, v in enumerate(["tg", "pr"])
+        }
+    )
+    data.tg[0, 1, 2] = np.nan
+    target = data.isel(lat=[0, 1], lon=0).rename(lat="site")
+
+    out = xca.spatial_analogs(target, data, method=method)
+    assert out.dims == ("site", "lat", "lon")
+
+    for s, i, j in np.ndindex(2, 3, 4):
+        x = np.stack([target.tg[:, s], target.pr[:, s]], axis=-1)
+        y = np.stack([data.tg[:, i, j], data.pr[:, i, j]], axis=-1)
+        np.testing.assert_allclose(out[s, i, j], xca.metrics[method](x, y))
+    assert out[:, 1, 2].isnull().all()
+
+
+@pytest.mark.parametrize("method", ["seuclidean", "kolmogorov_smirnov"])
+def test_spatial_analogs_batched(method):
+    # Batched metrics give the same results on dask blocks as the per-cell metric.
+    np.random.seed(4)
+    data = xr.Dataset(
+        {
+            v: (("time", "lat", "lon"), np.random.randn(15, 4, 5) + i)
+            for i, v in enumerate(["tg", "pr"])
+        }
+    )
+    target = data.isel(lat=slice(0, 2), lon=0).rename(lat="site")
+
+    out = xca.spatial_analogs(target, data.chunk({"lat": 2, "lon": 2}), method=method)
+    assert out.chunks is not None
+    assert out.dims == ("site", "lat", "lon")
+
+    for s, i, j in np.ndindex(2, 4, 5):
+        x = np.stack([target.tg[:, s], target.pr[:, s]], axis=-1)
+        y = np.stack([data.tg[:, i, j], data.pr[:, i, j]], axis=-1)
+        np.testing.assert_allclose(out[s, i, j], xca.metrics[method](x, y))
+
+
+@pytest.mark.parametrize("method", ["zech_aslan", "kolmogorov_smirnov"])
+def test_top_analogs(method):
+    np.random.seed(5)
+    data = xr.Dataset(
+        {
+            v: (("time", "lat", "lon"), np.random.randn(20, 6, 7) + i)
+            for i, v in enumerate(["tg", "pr"])
+        },
+        coords={"lat": np.arange(6.0), "lon": np.arange(7.0) - 70},
+    )
+    target = data.isel(lat=[1, 4], lon=2).rename(lat="site")
+    full = xca.spatial_analogs(target, data, method=method).stack(cell=["lat", "lon"])
+
+    # Without screening, the k best cells of the full dissimilarity map are found.
+    out = xca.top_analogs(target, data, k=4, method=method, screen=20)
+    assert out.dims == ("site", "analog")
+    for s in range(2):
+        exp = full.isel(site=s).sortby(full.isel(site=s))[:4]
+        np.testing.assert_allclose(out.isel(site=s), exp)
+        np.testing.assert_array_equal(out.lat.isel(site=s), exp.lat)
+        np.testing.assert_array_equal(out.lon.isel(site=s), exp.lon)
+
+    # With screening, only the candidates closest in mean are evaluated.
+    out = xca.top_analogs(target, data.chunk({"lat": 3}), k=4, method=method, screen=2)
+    assert out.dims == ("site", "analog")
+    assert (out.diff("analog") >= 0).all()
+    for s in range(2):
+        exp = full.isel(site=s).sel(
+            cell=list(zip(out.lat[s].values, out.lon[s].values))
+        )
+        np.testing.assert_allclose(out.isel(site=s), exp)
+
+
 class TestSEuclidean:
     def test_simple(self):
         d = 2
@@ -172,6 +253,20 @@ class TestFR:
         dm = xca.friedman_rafsky(x, y)
         assert_almost_equal(dm, 0.96667, 4)
 
+    @pytest.mark.parametrize("d", [1, 2, 5])
+    def test_mst(self, d):
+        # The spanning tree has the same length as the one computed from all distances.
+        from scipy.sparse.csgraph import minimum_spanning_tree
+        from scipy.spatial import distance_matrix
+
+        np.random.seed(6)
+        xy = np.random.randn(120, d)
+        edges = xca._euclidean_mst(xy)
+        assert edges.shape == (119, 2)
+        length = np.sqrt(((xy[edges[:, 0]] - xy[edges[:, 1]]) ** 2).sum(-1)).sum()
+        exp = minimum_spanning_tree(distance_matrix(xy, xy)).sum()
+        assert_almost_equal(length, exp)
+
 
 class TestKS:
     def test_1D_ks_2samp(self):
@@ -187,6 +282,18 @@ class TestKS:
         dm = xca.kolmogorov_smirnov(x, y)
         assert_almost_equal(dm, 0.96667, 4)
 
+    def test_blocks(self, monkeypatch):
+        # Quadrant counts of stacked samples are the same when computed in blocks.
+        np.random.seed(3)
+        x = np.random.randn(20, 2)
+        ys = np.random.randn(7, 15, 2)
+        exp = xca._ks_quadrants(x, ys)
+        assert exp.shape == (7, 20, 4)
+        monkeypatch.setattr(xca, "_KS_BLOCK_SIZE", 1000)
+        np.testing.assert_array_equal(xca._ks_quadrants(x, ys), exp)
+        for y, e in zip(ys, exp):
+            np.testing.assert_array_equal(xca._ks_quadrants(x, y), e)
+
 
 def analytical_KLDiv(p, q):
     """Return the Kullback-Leibler divergence between two distributions.
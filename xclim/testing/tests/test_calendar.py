@@ -8,8 +8,11 @@ import xarray as xr
 from numpy.testing import assert_array_equal
 from xarray.coding.cftimeindex import CFTimeIndex
 
+from xclim import set_options
 from xclim.core.calendar import (
+    _convert_datetime,
     adjust_doy_calendar,
+    compare_doy,
     convert_calendar,
     date_range,
     datetime_to_decimal_year,
@@ -19,7 +22,10 @@ from xclim.core.calendar import (
     interp_calendar,
     max_doy,
     percentile_doy,
+    resample_doy,
     time_bnds,
+    time_field,
+    time_index_info,
 )
 from xclim.testing import open_dataset
 
@@ -86,6 +92,46 @@ def test_percentile_doy_nan(tas_series):
     assert pnan.attrs["units"] == "K"
 
 
+def test_percentile_doy_precision(tas_series):
+    tas = tas_series(np.arange(365, dtype=np.float32), start="1/1/2001")
+    p = percentile_doy(tas, window=5, per=0.5)
+    assert p.dtype == np.float32
+    assert p.sel(dayofyear=3).data == 2
+
+    with set_options(precision="float32"):
+        p = percentile_doy(tas.astype(float), window=5, per=0.5)
+    assert p.dtype == np.float32
+
+
+@pytest.mark.parametrize("calendar", ["default", "noleap", "360_day"])
+def test_compare_doy(calendar):
+    time = date_range("2000-01-01", periods=800, freq="D", calendar=calendar)
+    da = xr.DataArray(
+        np.random.rand(800, 3),
+        dims=("time", "site"),
+        coords={"time": time},
+        attrs={"units": "K"},
+    )
+    doy = percentile_doy(da, per=0.5)
+
+    thresh = resample_doy(doy, da)
+    assert thresh.dims == da.dims
+    assert thresh.attrs["units"] == "K"
+    assert_array_equal(
+        thresh.isel(site=1), doy.isel(site=1).sel(dayofyear=da.time.dt.dayofyear)
+    )
+
+    exp = da > thresh
+    xr.testing.assert_identical(compare_doy(da, ">", doy), exp)
+    # Lazy comparison on each block
+    out = compare_doy(da.chunk({"time": 100}).transpose(), "gt", doy)
+    assert out.chunks == ((3,), (100,) * 8)
+    xr.testing.assert_identical(out.compute(), exp.transpose())
+
+    with pytest.raises(ValueError):
+        compare_doy(da, "!=", doy)
+
+
 def test_adjust_doy_360_to_366():
     source = xr.DataArray(np.arange(360), coords=[np.arange(1, 361)], dims="dayofyear")
     time = pd.date_range("2000-01-01", "2001-12-31", freq="D")
@@ -176,6 +222,39 @@ def test_convert_calendar(source, target, target_as_str, freq):
         assert conv.isnull().sum() == max(max_doy[target] - max_doy[source], 0)
 
 
+@pytest.mark.parametrize(
+    "source,target,align_on",
+    [
+        ("standard", "noleap", "date"),
+        ("noleap", "default", "date"),
+        ("360_day", "julian", "date"),
+        ("360_day", "julian", "year"),
+        ("all_leap", "360_day", "year"),
+    ],
+)
+def test_convert_calendar_elementwise(source, target, align_on):
+    time = date_range("2003-12-30T05:30", periods=1000, freq="17H", calendar=source)
+    da = xr.DataArray(np.arange(1000), dims=("time",), coords={"time": time})
+
+    conv = convert_calendar(da, target, align_on=align_on)
+
+    # Reference conversion, date by date
+    exp = {}
+    for i, t in enumerate(time):
+        new_doy = None
+        if align_on == "year":
+            new_doy = round(
+                days_in_year(t.year, target) * t.dayofyr / days_in_year(t.year, source)
+            )
+        new = _convert_datetime(t, new_doy=new_doy, calendar=target)
+        if not pd.isnull(new):
+            exp.setdefault(new, i)
+    dates, pos = zip(*sorted(exp.items()))
+    assert conv.dtype == da.dtype
+    assert_array_equal(conv, pos)
+    assert_array_equal(conv.time, xr.DataArray(list(dates), dims=("time",)))
+
+
 @pytest.mark.parametrize(
     "source,target,freq",
     [
@@ -346,3 +425,55 @@ def test_datetime_to_decimal_year(source_cal, exp180):
     )
     decy = datetime_to_decimal_year(times, calendar=source_cal)
     np.testing.assert_almost_equal(decy[180] - 2004, exp180)
+
+
+@pytest.mark.parametrize("calendar", ["default", "noleap", "360_day", "standard"])
+def test_time_index_info(calendar):
+    time = date_range("1999-11-25", periods=800, freq="12H", calendar=calendar)
+    da = xr.DataArray(np.arange(800), dims=("time",), coords={"time": time})
+
+    info = time_index_info(da)
+    assert info.calendar == get_calendar(da)
+    for field in [
+        "year",
+        "month",
+        "day",
+        "hour",
+        "dayofyear",
+        "dayofweek",
+        "days_in_month",
+        "minute",
+        "second",
+        "season",
+    ]:
+        out = time_field(da, field)
+        assert_array_equal(out, getattr(da.time.dt, field))
+        assert out.name == field
+
+    # Same instance for the same index, or an equal one
+    assert time_index_info(da + 1) is info
+    assert time_index_info(da.copy()) is info
+    assert time_index_info(da.isel(time=slice(1, None))) is not info
+    assert not info.month.flags.writeable
+
+    for freq in ["YS", "AS-JUL", "QS-DEC", "MS", "D"]:
+        labels = info.period_labels(freq)
+        _, counts = np.unique(labels, return_counts=True)
+        assert_array_equal(counts, da.resample(time=freq).count())
+
+
+def test_time_index_info_calendars():
+    # Equal dates of different calendars don't share their components
+    noleap = date_range("2000-01-01", periods=5, freq="MS", calendar="noleap")
+    d360 = date_range("2000-01-01", periods=5, freq="MS", calendar="360_day")
+    assert_array_equal(time_index_info(noleap).dayofyear, [1, 32, 60, 91, 121])
+    assert_array_equal(time_index_info(d360).dayofyear, [1, 31, 61, 91, 121])
+    assert_array_equal(time_index_info(d360).days_in_month, [30] * 5)
+
+    # Equal dates share their components, same fingerprints with other dates don't
+    noleap2 = date_range("2000-01-01", periods=5, freq="MS", calendar="noleap")
+    assert time_index_info(noleap2) is time_index_info(noleap)
+    other = CFTimeIndex(
+        list(noleap[:2]) + [noleap[2].replace(day=5)] + list(noleap[3:])
+    )
+    assert_array_equal(time_index_info(other).day, [1, 1, 5, 1, 1])
@@ -18,6 +18,7 @@ import sys
 from copy import deepcopy
 from pathlib import Path
 
+import dask.array
 import numpy as np
 import pandas as pd
 import pytest
@@ -113,6 +114,30 @@ class TestEnsembleStats:
             ens_mean.where(~(np.isnan(ens_mean)), drop=True).time.dt.year.max() == 2050
         )
 
+    def test_create_ensemble_lazy(self, tmp_path):
+        files = []
+        for i, n in enumerate(self.nc_files):
+            ds = open_dataset(os.path.join("EnsembleStats", n)).isel(
+                time=slice(i, 151 - i)
+            )
+            ds["area"] = ds.lat * ds.lon
+            files.append(tmp_path / n)
+            ds.to_netcdf(files[-1])
+
+        ens = ensembles.create_ensemble(files)
+        assert isinstance(ens.tg_mean.data, dask.array.Array)
+        assert len(ens.time) == 151
+        assert ens.area.dims == ("realization", "lat", "lon")
+        assert (
+            ens.tg_mean.isel(realization=3, time=[0, 1, 2, -3, -2, -1]).isnull().all()
+        )
+        np.testing.assert_array_equal(
+            ens.tg_mean.isel(realization=1, time=slice(1, 150)),
+            open_dataset(os.path.join("EnsembleStats", self.nc_files[1]))
+            .tg_mean.isel(time=slice(1, 150))
+            .values,
+        )
+
     @pytest.mark.parametrize(
         "timegen,calkw",
         [(xr.cftime_range, {"calendar": "360_day"}), (pd.date_range, {})],
@@ -137,6 +162,40 @@ class TestEnsembleStats:
         assert ens.time.size == 24
         np.testing.assert_equal(ens.isel(time=0), [0, 0])
 
+    def test_create_unaligned_coords(self):
+        time = pd.date_range("2000-01-01", periods=3, freq="D")
+        d1 = xr.DataArray(
+            np.arange(6).reshape(3, 2),
+            dims=("time", "lat"),
+            coords={"time": time, "lat": [10, 20]},
+            name="tas",
+        )
+        # Same latitudes in another order are reindexed
+        d2 = d1.isel(lat=[1, 0])
+        ens = ensembles.create_ensemble((d1, d2))
+        np.testing.assert_array_equal(ens.tas.isel(realization=0), ens.tas[1])
+
+        with pytest.raises(ValueError, match="'lat' coordinate of member 1"):
+            ensembles.create_ensemble((d1, d1.assign_coords(lat=[30, 40])))
+
+    def test_create_member_coords(self):
+        time = pd.date_range("2000-01-01", periods=3, freq="D")
+        d1 = xr.DataArray(
+            np.arange(6.0).reshape(3, 2),
+            dims=("time", "lat"),
+            coords={"time": time, "lat": [10, 20], "height": 2.0, "model": "a"},
+            name="tas",
+        )
+        d2 = d1.assign_coords(height=10.0)
+        ens = ensembles.create_ensemble((d1, d2))
+        # Coordinates that differ are stacked along realization, the others are kept
+        np.testing.assert_array_equal(ens.height, [2.0, 10.0])
+        assert ens.height.dims == ("realization",)
+        assert ens.model.dims == ()
+
+        with pytest.raises(ValueError, match="Coordinate height is not present"):
+            ensembles.create_ensemble((d1, d2.drop_vars("height")))
+
     @pytest.mark.parametrize("transpose", [False, True])
     def test_calc_perc(self, transpose):
         ens = ensembles.create_ensemble(self.nc_datasets_simple)
@@ -177,6 +236,36 @@ class TestEnsembleStats:
         out1 = ensembles.ensemble_percentiles(ens.load(), split=False)
         np.testing.assert_array_equal(out1["tg_mean"], out2["tg_mean"])
 
+    @pytest.mark.parametrize("method", ["interpolated", "exact", "sketch"])
+    def test_calc_perc_blocks(self, method):
+        ens = ensembles.create_ensemble(self.nc_datasets_simple).load()
+        ens.tg_mean[2, 0, 5, 5] = np.nan
+
+        out1 = ensembles.ensemble_percentiles(ens, split=False, method=method)
+        out2 = ensembles.ensemble_percentiles(
+            ens.chunk({"realization": 1, "time": 10}), split=False, method=method
+        )
+        assert out2.tg_mean.chunks is not None
+        np.testing.assert_array_almost_equal(out1["tg_mean"], out2["tg_mean"])
+
+        nearest = ensembles.ensemble_percentiles(ens, split=False, method="exact")
+        assert np.isin(nearest.tg_mean.isel(time=0, lon=5, lat=4), ens.tg_mean).all()
+
+    def test_calc_perc_sketch(self):
+        ens = xr.DataArray(
+            np.random.default_rng(42).normal(size=(500, 10)),
+            dims=("realization", "x"),
+            name="tas",
+        )
+        exact = ensembles.ensemble_percentiles(ens, split=False)
+        approx = ensembles.ensemble_percentiles(
+            ens.chunk({"realization": 50}), split=False, method="sketch", sketch_size=50
+        )
+        np.testing.assert_allclose(approx, exact, atol=0.1)
+
+        with pytest.raises(ValueError):
+            ensembles.ensemble_percentiles(ens, method="sketch", keep_chunk_size=True)
+
     def test_calc_perc_nans(self):
         ens = ensembles.create_ensemble(self.nc_datasets_simple).load()
 
@@ -219,6 +308,29 @@ class TestEnsembleStats:
         )
         assert "Computation of statistics on" in out1.attrs["xclim_history"]
 
+    @pytest.mark.parametrize("chunks", [None, {"realization": 1, "time": 10}])
+    def test_calc_stats(self, chunks):
+        ens = ensembles.create_ensemble(self.nc_datasets_simple).load()
+        ens.tg_mean[2, 0, 5, 5] = np.nan
+        out_ms = ensembles.ensemble_mean_std_max_min(ens)
+        out_p = ensembles.ensemble_percentiles(ens, values=(10, 90))
+        if chunks:
+            ens = ens.chunk(chunks)
+
+        out = ensembles.ensemble_stats(
+            ens, stats=["mean", "stdev", "min", "max", "count"], values=(10, 90)
+        )
+        for name in ["tg_mean_mean", "tg_mean_stdev", "tg_mean_min", "tg_mean_max"]:
+            np.testing.assert_allclose(out[name], out_ms[name], rtol=1e-6)
+        for name in ["tg_mean_p10", "tg_mean_p90"]:
+            np.testing.assert_allclose(out[name], out_p[name])
+        assert out.tg_mean_count[0, 5, 5] == 3
+        assert out.tg_mean_count.attrs["units"] == ""
+        assert "Computation of statistics on" in out.attrs["xclim_history"]
+
+        with pytest.raises(ValueError):
+            ensembles.ensemble_stats(ens, stats=["median"])
+
 
 @pytest.mark.slow
 class TestEnsembleReduction:
@@ -274,6 +386,24 @@ class TestEnsembleReduction:
         assert ids == [0, 3, 4, 6, 7, 10, 11, 12, 13]
         assert len(ids) == 9
 
+    def test_kmeans_parallel(self):
+        ds = open_dataset(self.nc_file)
+
+        sels = [
+            ensembles.kmeans_reduce_ensemble(
+                data=ds.data,
+                method={"rsq_cutoff": 0.5},
+                random_state=42,
+                make_graph=False,
+                n_init=50,
+                warm_start=True,
+                n_jobs=n_jobs,
+            )
+            for n_jobs in [1, 2]
+        ]
+        assert sels[0][0] == sels[1][0]
+        np.testing.assert_array_equal(sels[0][1], sels[1][1])
+
     def test_kmeans_sampleweights(self):
         ds = open_dataset(self.nc_file)
         # Test sample weights
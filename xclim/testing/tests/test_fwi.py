@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 import xarray as xr
 
-from xclim import atmos
+from xclim import atmos, set_options
 from xclim.indices.fwi import (
     _shut_down_and_start_ups,
     build_up_index,
@@ -128,6 +128,27 @@ def test_fire_weather_indicator():
     xr.testing.assert_allclose(fwi.T[10:], ds.fwi[10:], rtol=0.05, atol=0.05)
 
 
+def test_fire_weather_ufunc_precision():
+    ds = get_data(as_xr=True)
+    kws = dict(
+        tas=ds.temp,
+        pr=ds.pr,
+        rh=ds.rh,
+        ws=ds.ws,
+        lat=ds.lat,
+        ffmc0=ds.ffmc[1],
+        dmc0=ds.dmc[1],
+        dc0=ds.dc[1],
+        indexes=["DC", "FWI"],
+    )
+    exp = fire_weather_ufunc(**kws)
+    with set_options(precision="float32"):
+        out = fire_weather_ufunc(**kws)
+    for name, da in out.items():
+        assert da.dtype == np.float32
+        np.testing.assert_allclose(da, exp[name], rtol=1e-4)
+
+
 def test_day_length():
     assert day_length(44, 1) == 6.5
 
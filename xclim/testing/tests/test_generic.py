@@ -1,6 +1,7 @@
 import cftime
 import numpy as np
 import pandas as pd
+import pytest
 import xarray as xr
 
 from xclim.indices import generic
@@ -131,3 +132,42 @@ def test_doyminmax(q_series):
     assert dmx.values == [40]
     assert dmn.values == [50]
     assert dmx.units == ""
+
+
+class TestRolling:
+    @pytest.mark.parametrize("chunks", [None, {"time": 10}])
+    @pytest.mark.parametrize("window", [1, 4])
+    def test_sum_mean(self, pr_series, chunks, window):
+        a = np.random.rand(100)
+        a[30] = np.nan
+        pr = pr_series(a)
+        da = pr if chunks is None else pr.chunk(chunks)
+
+        out = generic.rolling_sum(da, window)
+        assert out.attrs == pr.attrs
+        xr.testing.assert_allclose(
+            out.load(), pr.rolling(time=window).sum(skipna=False)
+        )
+        out = generic.rolling_mean(da, window)
+        xr.testing.assert_allclose(
+            out.load(), pr.rolling(time=window).mean(skipna=False)
+        )
+
+    def test_short(self, pr_series):
+        pr = pr_series(np.random.rand(4))
+        out = generic.rolling_sum(pr.chunk({"time": 2}), 7)
+        np.testing.assert_array_equal(out, [np.nan] * 4)
+
+    @pytest.mark.parametrize("chunks", [None, {"time": 3}])
+    def test_bool(self, tas_series, chunks):
+        tas = tas_series(np.array([0, 2, 2, 2, 0, 0, 0, 2, 0, 0], float))
+        da = tas if chunks is None else tas.chunk(chunks)
+
+        count = generic.rolling_threshold_count(da, ">", 1, window=3)
+        np.testing.assert_array_equal(count, [np.nan] * 2 + [2, 3, 2, 1, 0, 1, 1, 1])
+        np.testing.assert_array_equal(
+            generic.rolling_all(da > 1, window=3), [0, 0, 0, 1, 0, 0, 0, 0, 0, 0]
+        )
+        np.testing.assert_array_equal(
+            generic.rolling_any(da > 1, window=3), [0, 0, 1, 1, 1, 1, 0, 1, 1, 1]
+        )
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 # Tests for the Indicator objects
 import gc
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
 import dask
@@ -95,6 +96,50 @@ def test_attrs(tas_series):
     assert txm.name == "tmin5"
 
 
+def test_attrs_cache(tas_series):
+    from xclim.core.indicator import _attrs_cache
+
+    a = tas_series(np.arange(360.0))
+    ind = UniIndTemp()
+    _attrs_cache.clear()
+    out1 = ind(a, thresh=5, freq="YS")
+    assert len(_attrs_cache) == 1
+    out2 = ind(a, thresh=5, freq="YS")
+    assert len(_attrs_cache) == 1
+    assert out1.attrs["long_name"] == "Annual mean surface temperature"
+    assert out2.attrs == out1.attrs
+
+    # 5 and 5.0 are formatted the same, but not in the history.
+    out3 = ind(a, thresh=5.0, freq="MS")
+    assert len(_attrs_cache) == 2
+    assert out3.attrs["long_name"] == "Monthly mean surface temperature"
+    assert "tmin(da=<array>, thresh=5.0, freq='MS')" in out3.attrs["xclim_history"]
+
+    # Arguments that can't be used as keys are not cached
+    ind(a, thresh=np.array(5), freq="YS")
+    assert len(_attrs_cache) == 2
+
+    with xclim.set_options(metadata_locales=["fr"]):
+        out = atmos.tg_mean(a, freq="YS")
+        assert "long_name_fr" in out.attrs
+    out = atmos.tg_mean(a, freq="YS")
+    assert "long_name_fr" not in out.attrs
+
+
+def test_precision(tas_series, tasmax_series):
+    a = tas_series(np.arange(360.0, dtype=np.float32))
+    ind = UniIndTemp()
+    assert ind(a, thresh=5, freq="MS").dtype == np.float32
+
+    a = tas_series(np.arange(360.0))
+    with xclim.set_options(precision="float32"):
+        out = ind(a, thresh=5, freq="MS")
+        assert out.dtype == np.float32
+        assert atmos.tg_mean(a, freq="MS").dtype == np.float32
+        tx = tasmax_series(np.arange(360.0))
+        assert atmos.tx_days_above(tx, thresh="10 K", freq="MS").dtype == np.float32
+
+
 def test_registering():
     UniIndTemp()
     assert "TMIN" in registry
@@ -129,6 +174,43 @@ def test_registering():
         registry["I2D"].get_instance()
 
 
+def test_lazy(tas_series):
+    ind = UniIndTemp.lazy(identifier="lazytmin")
+    assert "LAZYTMIN" in registry
+    assert registry.is_pending("LAZYTMIN")
+
+    # The class is created on first use.
+    assert isinstance(ind, UniIndTemp)
+    assert not registry.is_pending("LAZYTMIN")
+    assert registry["LAZYTMIN"] is ind.__class__
+    assert registry["LAZYTMIN"].get_instance().identifier == "lazytmin"
+
+    a = tas_series(np.arange(360.0))
+    out = ind(a, thresh=5, freq="YS")
+    assert "lazytmin(da=<array>, thresh=5, freq='YS')" in out.attrs["xclim_history"]
+    assert ind.__call__.__doc__ == ind.compute.__doc__
+
+    # Registry lookups also create the class.
+    UniIndTemp.lazy(identifier="lazytmin2")
+    assert registry["LAZYTMIN2"].identifier == "lazytmin2"
+    assert not registry.is_pending("LAZYTMIN2")
+
+
+def test_lazy_threads():
+    names = [f"LAZYTHREAD{i}" for i in range(20)]
+    for name in names:
+        UniIndTemp.lazy(identifier=name.lower())
+
+    def lookup(name):
+        assert names[0] in list(registry)
+        return registry[name].identifier
+
+    # Lookups racing to create the same indicators all succeed.
+    with ThreadPoolExecutor(8) as executor:
+        out = list(executor.map(lookup, names * 8))
+    assert out == [name.lower() for name in names] * 8
+
+
 def test_module():
     """Translations are keyed according to the module where the indicators are defined."""
     assert atmos.tg_mean.__module__.split(".")[2] == "atmos"
@@ -252,6 +334,36 @@ def test_signature():
     assert "ds" in ind._sig.parameters
 
 
+@pytest.mark.parametrize(
+    "ind,args,kwds",
+    [
+        (UniIndTemp, ("tas",), {}),
+        (UniIndTemp, ("tas", 5), {"freq": "MS"}),
+        (UniIndTemp, (), {"da": "tas", "ds": None, "thresh": 5}),
+        (UniIndPr, ("pr", "MS"), {}),
+        (UniClim, ("tas",), {"month": [1, 2]}),
+    ],
+)
+def test_call_plan(ind, args, kwds):
+    ind = ind()
+    ba = ind._sig.bind(*args, **kwds)
+    ba.apply_defaults()
+    arguments = ind._call_plan.bind(args, kwds)
+    assert list(arguments.items()) == list(ba.arguments.items())
+
+
+def test_call_plan_errors(tas_series):
+    a = tas_series(np.arange(360.0))
+    ind = UniIndTemp()
+    calls = [((a, 5, "YS", 1), {}), ((a, 5), {"thresh": 4}), ((a,), {"x": 1})]
+    for args, kwds in calls:
+        assert ind._call_plan.bind(args, kwds) is None
+        with pytest.raises(TypeError):
+            ind(*args, **kwds)
+    # Required parameter missing
+    assert UniIndPr()._call_plan.bind((a,), {}) is None
+
+
 def test_doc():
     ind = UniIndTemp()
     assert ind.__call__.__doc__ == ind.compute.__doc__
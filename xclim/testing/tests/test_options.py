@@ -21,6 +21,7 @@ from xclim.core.options import OPTIONS, register_missing_method
         ("missing_options", {"wmo": {"nm": 10, "nc": 3}}),
         ("missing_options", {"pct": {"tolerance": 0.1}}),
         ("missing_options", {"wmo": {"nm": 10, "nc": 3}, "pct": {"tolerance": 0.1}}),
+        ("precision", "float32"),
     ],
 )
 def test_set_options_valid(option, value):
@@ -43,6 +44,7 @@ def test_set_options_valid(option, value):
         ("data_validation", True),
         ("check_missing", "from_context"),
         ("cf_compliance", False),
+        ("precision", "float16"),
         ("missing_options", {"pct": {"nm": 45}}),
         ("missing_options", {"wmo": {"nm": 45, "nc": 3}}),
         (
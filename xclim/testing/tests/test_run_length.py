@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 import xarray as xr
 
+from xclim import set_options
 from xclim.indices import run_length as rl
 from xclim.testing import open_dataset
 
@@ -41,6 +42,17 @@ class TestRLE:
         expected[2:12] = np.nan
         np.testing.assert_array_equal(out, expected)
 
+    def test_precision(self):
+        time = pd.date_range("2000-01-01", periods=5, freq="D")
+        da = xr.DataArray(
+            [False, True, True, False, True], coords={"time": time}, dims="time"
+        )
+        assert rl.rle(da).dtype == np.float64
+        with set_options(precision="float32"):
+            out = rl.rle(da)
+        assert out.dtype == np.float32
+        np.testing.assert_array_equal(out, [0, 2, np.nan, np.nan, 1, np.nan])
+
 
 class TestLongestRun:
     nc_pr = os.path.join("NRCANdaily", "nrcan_canada_daily_pr_1990.nc")
@@ -189,6 +201,16 @@ class TestFirstRun:
         out = rl.first_run(runs, window=1, dim="time", coord=coord, ufunc_1dim=use_1dim)
         np.testing.assert_array_equal(out.load(), expected)
 
+    @pytest.mark.parametrize("use_1dim", [True, False])
+    def test_precision(self, tas_series, use_1dim):
+        t = np.zeros(60)
+        t[30:40] = 2
+        tas = tas_series(t, start="2000-01-01")
+        with set_options(precision="float32"):
+            out = rl.first_run(tas > 1, window=2, ufunc_1dim=use_1dim)
+        assert out.dtype == np.float32
+        assert out == 30
+
 
 class TestWindowedRunEvents:
     nc_pr = os.path.join("NRCANdaily", "nrcan_canada_daily_pr_1990.nc")
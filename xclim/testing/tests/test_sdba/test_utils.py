@@ -4,6 +4,7 @@ import pytest
 import xarray as xr
 from scipy.stats import norm
 
+from xclim import set_options
 from xclim.sdba import utils as u
 from xclim.sdba.base import Grouper
 
@@ -110,6 +111,34 @@ def test_interp_on_quantiles(shape, group, method):
         xr.testing.assert_equal(fut_corr.isnull(), fut == 1000)
 
 
+@pytest.mark.parametrize("group", ["time", "time.month"])
+@pytest.mark.parametrize("method", ["nearest", "linear", "cubic"])
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_interp_on_quantiles_precision(group, method, use_dask):
+    group = Grouper(group)
+    t = pd.date_range("2000-01-01", periods=730, freq="D")
+    obs = xr.DataArray(np.random.random_sample(730), dims=("time",), coords={"time": t})
+    q = np.linspace(0, 1, 11)
+    xq = group.apply("quantile", obs, q=q).rename(quantile="quantiles")
+    if use_dask:
+        obs = obs.chunk({"time": -1})
+
+    out = u.interp_on_quantiles(
+        obs.astype(np.float32),
+        xq.astype(np.float32),
+        xq.astype(np.float32),
+        group=group,
+        method=method,
+    )
+    assert out.dtype == np.float32
+    assert out.load().dtype == np.float32
+
+    with set_options(precision="float32"):
+        out = u.interp_on_quantiles(obs, xq, xq, group=group, method=method)
+    assert out.dtype == np.float32
+    assert out.load().dtype == np.float32
+
+
 @pytest.mark.parametrize("use_dask", [True, False])
 def test_rank(use_dask):
     arr = np.random.random_sample(size=(10, 10, 1000))
@@ -1,3 +1,4 @@
+import dask.array
 import numpy as np
 import pytest
 import xarray as xr
@@ -148,6 +149,80 @@ class TestFA(object):
         assert p.dims[-1] == "dparams"
 
 
+class TestMLFit:
+    params = {
+        "gamma": dict(a=3, loc=5, scale=2),
+        "genextreme": dict(c=0.1, loc=300, scale=75),
+        "gumbel_r": dict(loc=10, scale=2),
+        "norm": dict(loc=3, scale=2),
+        "weibull_min": dict(c=1.8, loc=-300, scale=4000),
+    }
+
+    @pytest.mark.parametrize("dist", params.keys())
+    def test_ml_fit(self, dist):
+        """Test that all cells are fitted together, as scipy does on each cell."""
+        dc = stats.get_dist(dist)
+        data = dc(**self.params[dist]).rvs(size=(40, 2, 3), random_state=7)
+        data[:10, 1, 1] = np.nan
+        data[:, 0, 0] = np.nan
+        da = xr.DataArray(
+            data,
+            dims=("time", "x", "y"),
+            coords={"time": xr.cftime_range("1980-01-01", periods=40, freq="YS")},
+        ).chunk({"x": 1})
+
+        out = stats.fit(da, dist=dist)
+        assert isinstance(out.data, dask.array.Array)
+        assert list(out.coords) == ["dparams"]
+        out = out.compute()
+
+        assert np.isnan(out[:, 0, 0]).all()
+        for i, j in [(0, 1), (1, 1), (1, 2)]:
+            x = data[:, i, j][~np.isnan(data[:, i, j])]
+            args, kwargs = stats._fit_start(x, dist)
+            expected = dc.fit(x, *args, **kwargs)
+            np.testing.assert_allclose(out[:, i, j], expected, rtol=1e-4)
+
+    def test_not_converged(self):
+        """Fits that do not converge, with an unbounded likelihood, are done by scipy."""
+        data = stats.get_dist("gamma")(0.7, 0, 2).rvs(size=(40, 3), random_state=0)
+        da = xr.DataArray(data, dims=("time", "x"), coords={"time": np.arange(40)})
+
+        out = stats.fit(da, dist="gamma")
+        for i in range(3):
+            args, kwargs = stats._fit_start(data[:, i], "gamma")
+            expected = stats.get_dist("gamma").fit(data[:, i], *args, **kwargs)
+            np.testing.assert_array_equal(out[:, i], expected)
+
+    def test_converged_flags(self, monkeypatch):
+        """The cells flagged as not converged are exactly the ones refitted by scipy."""
+        gamma = stats.get_dist("gamma")
+        data = np.concatenate(
+            [
+                gamma(0.7, 0, 2).rvs(size=(3, 40), random_state=0),
+                gamma(3, 0, 2).rvs(size=(3, 40), random_state=1),
+                np.full((1, 40), np.nan),
+            ]
+        )
+        refit = []
+        fit_scipy = stats._fit_scipy
+        monkeypatch.setattr(
+            stats,
+            "_fit_scipy",
+            lambda arr, dist: refit.append(arr) or fit_scipy(arr, dist),
+        )
+        out, converged = stats._fit_ml(data, "gamma", return_converged=True)
+        assert converged.shape == (7,)
+        assert converged[3:6].all()
+        assert not converged[6]
+        rows = [np.flatnonzero((data == arr).all(axis=1))[0] for arr in refit]
+        assert rows == list(np.flatnonzero(~converged[:6]))
+        assert rows
+        np.testing.assert_array_equal(out[6], np.nan)
+
+        np.testing.assert_array_equal(stats._fit_ml(data, "gamma"), out)
+
+
 class TestPWMFit:
     params = {
         "expon": {"loc": 0.9527273, "scale": 2.2836364},
@@ -194,11 +269,40 @@ class TestPWMFit:
         )
         out = stats.fit(da, dist=dist, method="PWM").compute()
 
-        # Check that values are identical to lmoments3's output dict
+        # Check that values are the same as lmoments3's output dict, up to rounding errors
         l3dc = stats.get_lm3_dist(dist)
         expected = l3dc.lmom_fit(da.values)
         for key, val in expected.items():
-            np.testing.assert_array_equal(out.sel(dparams=key), val, 1)
+            np.testing.assert_allclose(out.sel(dparams=key), val, rtol=1e-10)
+
+    def test_pwm_fit_grid(self):
+        """Test that all cells are fitted at once, with invalid cells set to NaN."""
+        n = 50
+        par = self.params["genextreme"]
+        data = stats.get_dist("genextreme")(**par).rvs(size=(n, 3, 4), random_state=2)
+        data[: n - 3, 0, 0] = np.nan
+        data[:10, 1, 1] = np.nan
+        data[:, 2, 2] = 1
+        da = xr.DataArray(
+            data,
+            dims=("time", "x", "y"),
+            coords={"time": xr.cftime_range("1980-01-01", periods=n, freq="YS")},
+        ).chunk({"x": 1})
+
+        out = stats.fit(da, dist="genextreme", method="PWM")
+        assert out.dims == ("dparams", "x", "y")
+        assert isinstance(out.data, dask.array.Array)
+        out = out.compute()
+
+        assert np.isnan(out[:, 0, 0]).all()
+        assert np.isnan(out[:, 2, 2]).all()
+        single = stats.fit(da[10:, 1, 1], dist="genextreme", method="PWM")
+        np.testing.assert_allclose(out[:, 1, 1], single, rtol=1e-12)
+
+        # Parameters are close to the true ones.
+        np.testing.assert_allclose(
+            out.mean(["x", "y"]), list(par.values()), rtol=0.3, atol=0.1
+        )
 
 
 class TestFrequencyAnalysis:
@@ -221,6 +325,31 @@ class TestFrequencyAnalysis:
             q.transpose(), mode="max", t=2, dist="genextreme", window=6, freq="YS"
         )
 
+    def test_bootstrap(self, ndq_series):
+        kws = dict(mode="max", t=[2, 5], dist="gumbel_r", window=6, freq="YS")
+        out = stats.frequency_analysis(
+            ndq_series, bootstrap=30, ci=[0.05, 0.5, 0.95], random_state=1, **kws
+        )
+        assert out.dims == ("ci", "return_period", "x", "y")
+        assert out.attrs["bootstrap"] == 30
+        assert isinstance(out.data, np.ndarray)
+        assert (out.diff("ci") >= 0).all()
+
+        # Reproducible, also with dask
+        out2 = stats.frequency_analysis(
+            ndq_series.chunk({"x": 1}),
+            bootstrap=30,
+            ci=[0.05, 0.5, 0.95],
+            random_state=1,
+            **kws,
+        )
+        assert isinstance(out2.data, dask.array.Array)
+        np.testing.assert_allclose(out2, out)
+
+        # The median is close to the estimate from the original series.
+        est = stats.frequency_analysis(ndq_series, **kws)
+        np.testing.assert_allclose(out.sel(ci=0.5), est, rtol=0.1)
+
 
 class TestParametricQuantile:
     def test_synth(self):
@@ -242,3 +371,26 @@ class TestParametricQuantile:
 
         np.testing.assert_array_almost_equal(q, expected, 1)
         assert "quantile" in q.coords
+
+    def test_grid(self):
+        """Test that the quantiles of all cells are computed lazily, for each quantile."""
+        data = stats.get_dist("gumbel_r")(loc=10, scale=2).rvs(
+            size=(30, 3, 4), random_state=1
+        )
+        da = xr.DataArray(
+            data,
+            dims=("time", "x", "y"),
+            coords={"time": xr.cftime_range("1980-01-01", periods=30, freq="YS")},
+        ).chunk({"x": 1})
+        p = stats.fit(da, dist="gumbel_r").transpose("x", "dparams", "y")
+        q = stats.parametric_quantile(p, [0.1, 0.5, 0.99])
+
+        assert isinstance(q.data, dask.array.Array)
+        assert q.dims == ("x", "quantile", "y")
+        np.testing.assert_array_equal(q["quantile"], [0.1, 0.5, 0.99])
+        p = p.values
+        for i, j in [(0, 0), (2, 3)]:
+            np.testing.assert_allclose(
+                q.values[i, :, j],
+                stats.get_dist("gumbel_r").ppf([0.1, 0.5, 0.99], *p[i, :, j]),
+            )
@@ -80,10 +80,55 @@ class TestConvertUnitsTo:
         out = convert_units_to(pr, "mm/day")
         assert isinstance(out.data, dsk.Array)
 
+    def test_dtype_and_copy(self, tas_series):
+        tas = tas_series(np.arange(10, dtype=np.float32)).chunk({"time": 5})
+        tas.attrs["units"] = "degC"
+
+        out = convert_units_to(tas, "K")
+        assert out.dtype == np.float32
+        assert isinstance(out.data, dsk.Array)
+        assert out.chunks == tas.chunks
+        np.testing.assert_allclose(out, np.arange(10) + 273.15, rtol=1e-6)
+        assert out.attrs["units"] == "K"
+        assert tas.attrs["units"] == "degC"
+
+        # Identity conversion, only the symbol changes.
+        out = convert_units_to(tas, "celsius")
+        assert out.data is tas.data
+        assert out.attrs["units"] == pint2cfunits(units2pint("celsius"))
+        out.attrs["units"] = "C"
+        assert tas.attrs["units"] == "degC"
+
+    def test_precision(self, tas_series):
+        tas = tas_series(np.arange(10, dtype=np.float64))
+        with set_options(precision="float32"):
+            out = convert_units_to(tas, "degC")
+        assert out.dtype == np.float32
+        np.testing.assert_allclose(out, np.arange(10) - 273.15, rtol=1e-6)
+
     def test_offset_confusion(self):
         out = convert_units_to("10 degC days", "K days")
         assert out == 10
 
+    @pytest.mark.parametrize(
+        "fu,tu,context",
+        [
+            ("degC", "K", None),
+            ("K", "degC", None),
+            ("degF", "degC", None),
+            ("mm/d", "kg m-2 s-1", "hydro"),
+            ("kg m-2 s-1", "mm/d", "hydro"),
+        ],
+    )
+    def test_affine(self, fu, tu, context):
+        values = np.array([-10.5, 0, 3.2, 300])
+        da = xr.DataArray(values, dims=("x",), attrs={"units": fu})
+        out = convert_units_to(da, tu, context=context)
+        with units.context(context or "none"):
+            exp = units.Quantity(values, units2pint(fu)).to(units2pint(tu)).m
+        np.testing.assert_allclose(out, exp, rtol=1e-12)
+        assert out.attrs["units"] == pint2cfunits(units2pint(tu))
+
 
 class TestUnitConversion:
     def test_pint2cfunits(self):